@@ -0,0 +1,52 @@
+"""Micro-benchmark: AsyncComponent.handle_message throughput with and without listeners.
+
+Run from the repository root with:
+    python -m benchmarks.bench_component
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from flexiflow.component import AsyncComponent
+from flexiflow.event_manager import AsyncEventManager
+from flexiflow.state_machine import StateMachine
+
+MESSAGES = 50_000
+# start/cancel bounces between InitialState and AwaitingConfirmation, so every message transitions
+CYCLE = ({"type": "start"}, {"type": "cancel"})
+
+
+async def _noop(_):
+    return None
+
+
+async def _bench(listeners: bool) -> float:
+    bus = AsyncEventManager()
+    if listeners:
+        await bus.subscribe("component.message.received", "observer", _noop)
+        await bus.subscribe("state.changed", "observer", _noop)
+
+    component = AsyncComponent(
+        name="bench",
+        state_machine=StateMachine.from_name("InitialState"),
+        event_bus=bus,
+    )
+
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        await component.handle_message(CYCLE[i & 1])
+    elapsed = time.perf_counter() - start
+    return MESSAGES / elapsed
+
+
+async def main() -> None:
+    print(f"{'listeners':>10} {'messages/s':>12}")
+    for listeners in (False, True):
+        rate = await _bench(listeners)
+        print(f"{str(listeners):>10} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
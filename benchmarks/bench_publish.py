@@ -0,0 +1,44 @@
+"""Micro-benchmark: AsyncEventManager.publish cost versus subscriber count.
+
+Run from the repository root with:
+    python -m benchmarks.bench_publish
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from flexiflow.event_manager import AsyncEventManager
+
+SUBSCRIBER_COUNTS = (0, 1, 5, 25, 100, 500)
+PUBLISHES = 20_000
+
+
+async def _noop(_):
+    return None
+
+
+async def _bench(n_subs: int, delivery: str) -> float:
+    bus = AsyncEventManager()
+    for i in range(n_subs):
+        await bus.subscribe("bench.event", f"c{i}", _noop, priority=(i % 5) + 1)
+
+    publishes = max(200, PUBLISHES // max(1, n_subs))
+    start = time.perf_counter()
+    for _ in range(publishes):
+        await bus.publish("bench.event", None, delivery=delivery)
+    elapsed = time.perf_counter() - start
+    return elapsed / publishes * 1e6
+
+
+async def main() -> None:
+    print(f"{'subscribers':>12} {'sequential us':>15} {'concurrent us':>15}")
+    for n in SUBSCRIBER_COUNTS:
+        seq = await _bench(n, "sequential")
+        conc = await _bench(n, "concurrent")
+        print(f"{n:>12} {seq:>15.2f} {conc:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -24,7 +24,8 @@ def create_app(engine: Any):
         component = engine.get(name)
         if component is None:
             raise HTTPException(status_code=404, detail="Component not found")
-        await component.handle_message(message)
+        # Through the component's mailbox, so concurrent requests are serialized
+        await engine.send(name, message)
         return {"status": "sent"}
 
     return app
@@ -0,0 +1,104 @@
+"""Opt-in latency and throughput statistics for AsyncEventManager."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+# Upper bounds (seconds) of the fixed latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    float("inf"),
+)
+
+
+class HandlerStats:
+    """Counters and latency histogram for one (event_name, component_name) pair."""
+
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "histogram")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.histogram: List[int] = [0] * len(LATENCY_BUCKETS)
+
+    def record(self, duration: float, failed: bool) -> None:
+        self.calls += 1
+        if failed:
+            self.errors += 1
+        self.total_seconds += duration
+        if duration > self.max_seconds:
+            self.max_seconds = duration
+        self.histogram[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "max_seconds": self.max_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "histogram": list(self.histogram),
+        }
+
+
+class BusStats:
+    """Per-event and per-(event, component) statistics collected by the bus."""
+
+    def __init__(self) -> None:
+        self._published: Dict[str, int] = {}
+        self._handlers: Dict[Tuple[str, str], HandlerStats] = {}
+
+    def record_publish(self, event_name: str) -> None:
+        self._published[event_name] = self._published.get(event_name, 0) + 1
+
+    def record_call(self, event_name: str, component_name: str, duration: float, failed: bool) -> None:
+        key = (event_name, component_name)
+        stats = self._handlers.get(key)
+        if stats is None:
+            stats = self._handlers[key] = HandlerStats()
+        stats.record(duration, failed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a nested, JSON-friendly snapshot.
+
+        Shape::
+
+            {
+                "buckets": [...upper bounds...],
+                "events": {
+                    event_name: {
+                        "published": int, "calls": int, "errors": int,
+                        "handlers": {component_name: {calls, errors, total_seconds,
+                                                      max_seconds, mean_seconds, histogram}},
+                    },
+                },
+            }
+        """
+        events: Dict[str, Dict[str, Any]] = {}
+        for name, count in self._published.items():
+            events[name] = {"published": count, "calls": 0, "errors": 0, "handlers": {}}
+        for (name, component), stats in self._handlers.items():
+            entry = events.setdefault(
+                name, {"published": 0, "calls": 0, "errors": 0, "handlers": {}}
+            )
+            entry["calls"] += stats.calls
+            entry["errors"] += stats.errors
+            entry["handlers"][component] = stats.snapshot()
+        return {"buckets": list(LATENCY_BUCKETS), "events": events}
+
+    def reset(self) -> None:
+        self._published.clear()
+        self._handlers.clear()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .emitter import ObservabilityEmitter
 from .event_manager import AsyncEventManager
 from .state_machine import StateMachine
 
@@ -14,6 +15,9 @@ class AsyncComponent:
     state_machine: StateMachine = field(default_factory=lambda: StateMachine.from_name("InitialState"))
     logger: Any = None  # logging.Logger-like
     event_bus: Optional[AsyncEventManager] = None
+    # Set by FlexiFlowEngine(observability="background"); observability events then
+    # go to the emitter's ring buffer instead of being awaited inline
+    emitter: Optional[ObservabilityEmitter] = None
 
     async def add_rule(self, rule: dict) -> None:
         self.rules.append(rule)
@@ -23,11 +27,19 @@ class AsyncComponent:
 
     async def handle_message(self, message: Dict[str, Any]) -> None:
         # Capture state before handling for observability
-        from_state = self.state_machine.current_state.__class__.__name__
+        from_state = self.state_machine.current_state
+        bus = self.event_bus
+        emitter = self.emitter
 
-        # Emit message received event (fire-and-forget, never blocks core logic)
-        if self.event_bus:
-            await self.event_bus.publish(
+        # Emit message received event (skipped entirely when nobody listens)
+        if emitter is not None:
+            if emitter.has_subscribers("component.message.received"):
+                emitter.emit(
+                    "component.message.received",
+                    {"component": self.name, "message": message},
+                )
+        elif bus is not None and bus.has_subscribers("component.message.received"):
+            await bus.publish(
                 "component.message.received",
                 {"component": self.name, "message": message},
             )
@@ -45,8 +57,54 @@ class AsyncComponent:
                 )
 
             # Emit state changed event with from/to states
-            if self.event_bus:
-                await self.event_bus.publish(
+            if emitter is not None:
+                if emitter.has_subscribers("state.changed"):
+                    emitter.emit(
+                        "state.changed",
+                        {
+                            "component": self.name,
+                            "from_state": from_state.__class__.__name__,
+                            "to_state": to_state,
+                        },
+                    )
+            elif bus is not None and bus.has_subscribers("state.changed"):
+                await bus.publish(
                     "state.changed",
-                    {"component": self.name, "from_state": from_state, "to_state": to_state},
+                    {
+                        "component": self.name,
+                        "from_state": from_state.__class__.__name__,
+                        "to_state": to_state,
+                    },
                 )
+
+    async def handle_messages(self, messages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Handle a batch of messages in order, without per-message events or log lines.
+
+        A message that raises is counted and skipped; later messages are still
+        handled. Used by FlexiFlowEngine.dispatch_many(), which reports the
+        whole batch in one observability event.
+
+        Returns:
+            Dict with 'processed', 'failed', 'transitions', 'from_state',
+            'to_state' and 'errors' (list of (index, exception)) keys
+        """
+        from_state = self.state_machine.current_state.__class__.__name__
+        processed = 0
+        transitions = 0
+        errors: List[Tuple[int, Exception]] = []
+        for i, message in enumerate(messages):
+            processed += 1
+            try:
+                if await self.state_machine.handle_message(message, self):
+                    transitions += 1
+            except Exception as e:
+                errors.append((i, e))
+        return {
+            "processed": processed,
+            "failed": len(errors),
+            "transitions": transitions,
+            "from_state": from_state,
+            "to_state": self.state_machine.current_state.__class__.__name__,
+            "errors": errors,
+        }
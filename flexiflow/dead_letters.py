@@ -0,0 +1,183 @@
+"""Bounded dead-letter store for failed event deliveries.
+
+Letters are kept in memory. When an SQLite connection is given, letters that
+no longer fit in memory spill to a ``flexiflow_dead_letters`` table instead of
+being dropped, following the conventions of ``flexiflow.extras.persist_sqlite``
+(the caller owns the connection; the table is created on first use).
+
+Spilled letters store the payload as JSON and the exception as its repr, so
+payloads must be JSON-serializable to survive a spill; letters that are not
+are dropped and counted.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass
+class DeadLetter:
+    """One failed delivery of an event to a subscription."""
+    event_name: str
+    data: Any
+    component_name: str
+    subscription_id: str
+    exception: Any  # the exception, or its repr once spilled to SQLite
+    attempts: int = 1
+    failed_at: float = field(default_factory=time.time)  # unix time of the last failure
+
+
+def _ensure_table(conn: sqlite3.Connection) -> None:
+    """Create the dead-letter table if it doesn't exist."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS flexiflow_dead_letters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_name TEXT NOT NULL,
+            component_name TEXT NOT NULL,
+            subscription_id TEXT NOT NULL,
+            data_json TEXT NOT NULL,
+            exception TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            failed_at REAL NOT NULL
+        )
+        """
+    )
+
+
+class DeadLetterStore:
+    """Oldest-first store of DeadLetters with a bounded in-memory buffer.
+
+    Args:
+        maxsize: Letters kept in memory
+        conn: Optional SQLite connection; when the buffer is full the oldest
+            letter spills there instead of being dropped
+
+    Attributes:
+        added: Letters added since creation
+        dropped: Letters discarded (buffer full without SQLite, or payload
+            not JSON-serializable)
+    """
+
+    def __init__(self, maxsize: int = 10_000, *, conn: Optional[sqlite3.Connection] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._conn = conn
+        self._buffer: Deque[DeadLetter] = deque()
+        self._spilled = 0
+        self.added = 0
+        self.dropped = 0
+        if conn is not None:
+            _ensure_table(conn)
+            # Letters spilled by a previous process are redriven first
+            self._spilled = conn.execute("SELECT COUNT(*) FROM flexiflow_dead_letters").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._buffer)
+
+    def add(self, letter: DeadLetter) -> None:
+        """Store a letter, spilling or dropping the oldest one if memory is full."""
+        self.added += 1
+        buffer = self._buffer
+        if len(buffer) >= self.maxsize:
+            oldest = buffer.popleft()
+            if self._conn is None or not self._spill(oldest):
+                self.dropped += 1
+        buffer.append(letter)
+
+    def take(self, limit: int) -> List[DeadLetter]:
+        """Remove and return up to limit letters, oldest (spilled) first."""
+        letters: List[DeadLetter] = []
+        if self._spilled and limit > 0:
+            letters = self._unspill(limit)
+        buffer = self._buffer
+        while buffer and len(letters) < limit:
+            letters.append(buffer.popleft())
+        return letters
+
+    def peek(self, limit: int = 10) -> List[DeadLetter]:
+        """Return up to limit of the newest in-memory letters without removing them."""
+        return list(self._buffer)[-limit:] if limit > 0 else []
+
+    def clear(self) -> int:
+        """Discard every letter, including spilled ones. Returns how many were removed."""
+        removed = len(self)
+        self._buffer.clear()
+        if self._conn is not None and self._spilled:
+            self._conn.execute("DELETE FROM flexiflow_dead_letters")
+            self._conn.commit()
+        self._spilled = 0
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters: buffered, spilled, maxsize, added, dropped."""
+        return {
+            "buffered": len(self._buffer),
+            "spilled": self._spilled,
+            "maxsize": self.maxsize,
+            "added": self.added,
+            "dropped": self.dropped,
+        }
+
+    def _spill(self, letter: DeadLetter) -> bool:
+        try:
+            data_json = json.dumps(letter.data)
+        except (TypeError, ValueError):
+            return False
+        exception = letter.exception if isinstance(letter.exception, str) else repr(letter.exception)
+        self._conn.execute(  # type: ignore[union-attr]
+            """
+            INSERT INTO flexiflow_dead_letters
+                (event_name, component_name, subscription_id, data_json, exception, attempts, failed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                letter.event_name,
+                letter.component_name,
+                letter.subscription_id,
+                data_json,
+                exception,
+                letter.attempts,
+                letter.failed_at,
+            ),
+        )
+        self._conn.commit()  # type: ignore[union-attr]
+        self._spilled += 1
+        return True
+
+    def _unspill(self, limit: int) -> List[DeadLetter]:
+        conn = self._conn
+        rows = conn.execute(  # type: ignore[union-attr]
+            """
+            SELECT id, event_name, component_name, subscription_id, data_json,
+                   exception, attempts, failed_at
+            FROM flexiflow_dead_letters
+            ORDER BY id
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        if not rows:
+            self._spilled = 0
+            return []
+        conn.execute("DELETE FROM flexiflow_dead_letters WHERE id <= ?", (rows[-1][0],))  # type: ignore[union-attr]
+        conn.commit()  # type: ignore[union-attr]
+        self._spilled = max(self._spilled - len(rows), 0)
+        return [
+            DeadLetter(
+                event_name=row[1],
+                data=json.loads(row[4]),
+                component_name=row[2],
+                subscription_id=row[3],
+                exception=row[5],
+                attempts=row[6],
+                failed_at=row[7],
+            )
+            for row in rows
+        ]
@@ -0,0 +1,98 @@
+"""Background emitter that takes observability events off the critical path."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from .event_manager import AsyncEventManager
+
+
+class ObservabilityEmitter:
+    """Ring-buffered, batched publisher for observability events.
+
+    emit() appends to a bounded ring buffer and returns immediately; a single
+    drain task publishes buffered events to the bus in batches with
+    publish_many(). Events are delivered in emit order, so ordering per
+    component is preserved. When the buffer is full the oldest event is
+    discarded and counted in ``dropped``.
+
+    The drain task starts on the first emit() from a running loop and exits
+    once the buffer is empty.
+    """
+
+    def __init__(
+        self,
+        bus: AsyncEventManager,
+        *,
+        capacity: int = 10_000,
+        batch_size: int = 256,
+        logger: Any = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.bus = bus
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self._logger = logger
+        self._buffer: Deque[Tuple[str, Any]] = deque(maxlen=capacity)
+        self._task: Optional[asyncio.Task] = None
+        self.emitted = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def has_subscribers(self, event_name: str) -> bool:
+        """Return True if the underlying bus has subscribers for event_name."""
+        return self.bus.has_subscribers(event_name)
+
+    def emit(self, event_name: str, data: Any = None) -> None:
+        """Buffer an event for background delivery. Never blocks, never raises for a full buffer."""
+        buffer = self._buffer
+        if len(buffer) == self.capacity:
+            self.dropped += 1
+        buffer.append((event_name, data))
+        self.emitted += 1
+
+        if self._task is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # drained by the next emit() or flush() inside a loop
+            self._task = loop.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until every buffered event has been published."""
+        while self._buffer or self._task is not None:
+            task = self._task
+            if task is None:
+                self._task = task = asyncio.get_running_loop().create_task(self._drain())
+            await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters: buffered, capacity, emitted, delivered, dropped."""
+        return {
+            "buffered": len(self._buffer),
+            "capacity": self.capacity,
+            "emitted": self.emitted,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+    async def _drain(self) -> None:
+        buffer = self._buffer
+        try:
+            while buffer:
+                n = min(self.batch_size, len(buffer))
+                batch = [buffer.popleft() for _ in range(n)]
+                try:
+                    await self.bus.publish_many(batch)
+                except Exception as e:
+                    if self._logger:
+                        self._logger.error("Error publishing observability batch: %s", e)
+                self.delivered += n
+        finally:
+            self._task = None
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from .emitter import ObservabilityEmitter
 from .event_manager import AsyncEventManager
+from .extras.persist_json import build_component
 from .logger import get_logger
+from .mailbox import Mailbox
+
+_OBSERVABILITY_MODES = ("inline", "background")
+
+
+class _Batch:
+    """A group of messages for one component, queued as a single mailbox item."""
+
+    __slots__ = ("messages",)
+
+    def __init__(self, messages: List[Any]) -> None:
+        self.messages = messages
 
 
 @dataclass
@@ -13,18 +29,62 @@ class FlexiFlowEngine:
     logger: Any = field(default_factory=lambda: get_logger("flexiflow"))
     event_bus: AsyncEventManager = field(init=False)
     components: Dict[str, Any] = field(default_factory=dict)
+    # "inline" awaits observability publishes in the caller; "background" hands
+    # them to an ObservabilityEmitter ring buffer drained by its own task
+    observability: str = "inline"
+    observability_buffer: int = 10_000
+    emitter: Optional[ObservabilityEmitter] = field(init=False, default=None)
+    # Capacity of each component's mailbox used by send(); senders wait when it is full
+    mailbox_size: int = 1000
+    _mailboxes: Dict[str, Mailbox] = field(init=False, default_factory=dict, repr=False)
+    # Component cache: with a snapshot store (see flexiflow.extras.snapshot_store),
+    # least recently used components beyond max_resident, or idle for idle_ttl
+    # seconds, are saved and dropped from memory, then restored on next use
+    component_store: Any = None
+    max_resident: Optional[int] = None
+    idle_ttl: Optional[float] = None
+    # name -> last use (time.monotonic()), oldest first; only kept with a component_store
+    _last_used: Dict[str, float] = field(init=False, default_factory=dict, repr=False)
+    # Components found busy or subscribed when due for eviction, kept out of
+    # _last_used so every touch doesn't rescan them; back in on next use or evict_idle()
+    _pinned: Dict[str, float] = field(init=False, default_factory=dict, repr=False)
+    evictions: int = field(init=False, default=0)
+    hydrations: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
+        if self.observability not in _OBSERVABILITY_MODES:
+            raise ValueError("observability must be 'inline' or 'background'")
+        if self.mailbox_size < 1:
+            raise ValueError("mailbox_size must be >= 1")
+        if self.max_resident is not None and self.max_resident < 1:
+            raise ValueError("max_resident must be >= 1")
+        if self.idle_ttl is not None and self.idle_ttl <= 0:
+            raise ValueError("idle_ttl must be > 0")
+        if (self.max_resident is not None or self.idle_ttl is not None) and self.component_store is None:
+            raise ValueError("max_resident/idle_ttl require a component_store")
+
         self.event_bus = AsyncEventManager(logger=self.logger)
+        if self.observability == "background":
+            self.emitter = ObservabilityEmitter(
+                self.event_bus,
+                capacity=self.observability_buffer,
+                logger=self.logger,
+            )
 
-    def register(self, component: Any) -> None:
+    def _attach(self, component: Any) -> None:
         if getattr(component, "logger", None) is None:
             component.logger = self.logger
         if getattr(component, "event_bus", None) is None:
             component.event_bus = self.event_bus
+        if self.emitter is not None and getattr(component, "emitter", None) is None:
+            component.emitter = self.emitter
 
+    def register(self, component: Any) -> None:
+        self._attach(component)
         self.components[component.name] = component
         self.logger.info("Registered component: %s", component.name)
+        if self.component_store is not None:
+            self._touch(component.name)
 
         try:
             loop = asyncio.get_running_loop()
@@ -32,6 +92,10 @@ class FlexiFlowEngine:
             loop = None
 
         if loop is not None:
+            if self.emitter is not None:
+                if self.emitter.has_subscribers("engine.component.registered"):
+                    self.emitter.emit("engine.component.registered", {"component": component.name})
+                return
             loop.create_task(
                 self.event_bus.publish(
                     "engine.component.registered",
@@ -41,10 +105,386 @@ class FlexiFlowEngine:
 
     async def register_async(self, component: Any) -> None:
         self.register(component)
+        if self.emitter is not None:
+            return  # already handed to the background emitter by register()
         await self.event_bus.publish(
             "engine.component.registered",
             {"component": component.name},
         )
 
+    def register_many(self, components: Iterable[Any], *, chunk_size: int = 10_000) -> int:
+        """
+        Register a batch of components, e.g. all those restored at startup.
+
+        Instead of one ``engine.component.registered`` event and one log line
+        per component, publishes one ``engine.components.registered`` event
+        per chunk of up to chunk_size names (from a single background task,
+        only if something subscribes) and logs one summary line.
+
+        Returns:
+            Number of components registered
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        names = self._insert_many(components)
+        self.logger.info("Registered %d components", len(names))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        event = "engine.components.registered"
+        if loop is not None and names:
+            if self.emitter is not None:
+                if self.emitter.has_subscribers(event):
+                    for report in self._registration_reports(names, chunk_size):
+                        self.emitter.emit(event, report)
+            elif self.event_bus.has_subscribers(event):
+                loop.create_task(
+                    self.event_bus.publish_many(
+                        (event, report) for report in self._registration_reports(names, chunk_size)
+                    )
+                )
+        return len(names)
+
+    async def register_many_async(self, components: Iterable[Any], *, chunk_size: int = 10_000) -> int:
+        """Like register_many(), but publishes the registration events before returning."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        names = self._insert_many(components)
+        self.logger.info("Registered %d components", len(names))
+
+        event = "engine.components.registered"
+        if names:
+            if self.emitter is not None:
+                if self.emitter.has_subscribers(event):
+                    for report in self._registration_reports(names, chunk_size):
+                        self.emitter.emit(event, report)
+            elif self.event_bus.has_subscribers(event):
+                await self.event_bus.publish_many(
+                    (event, report) for report in self._registration_reports(names, chunk_size)
+                )
+        return len(names)
+
+    def _insert_many(self, components: Iterable[Any]) -> List[str]:
+        registered = {}
+        for component in components:
+            self._attach(component)
+            registered[component.name] = component
+        self.components.update(registered)
+        if self.component_store is not None:
+            for name in registered:
+                self._touch(name)
+        return list(registered)
+
+    @staticmethod
+    def _registration_reports(names: List[str], chunk_size: int) -> List[Dict[str, Any]]:
+        chunks = range(0, len(names), chunk_size)
+        return [
+            {
+                "components": names[start : start + chunk_size],
+                "count": min(chunk_size, len(names) - start),
+                "chunk": index,
+                "chunks": len(chunks),
+            }
+            for index, start in enumerate(chunks)
+        ]
+
     def get(self, name: str) -> Optional[Any]:
-        return self.components.get(name)
+        """
+        Return a registered component, or None.
+
+        With a component_store, an evicted component is restored from its
+        snapshot (and re-registered) first.
+        """
+        component = self.components.get(name)
+        if self.component_store is None:
+            return component
+        if component is None:
+            return self._hydrate(name)
+        self._touch(name)
+        return component
+
+    async def handle_message(self, name: str, message: Union[str, Dict[str, Any]], **fields: Any) -> None:
+        """
+        Handle one message for a component, through its mailbox (see send()).
+
+        message may be a message dict or just its type, with extra fields as
+        keyword arguments: ``handle_message("c", "confirm", content="confirmed")``.
+        """
+        if isinstance(message, str):
+            message = {"type": message, **fields}
+        await self.send(name, message)
+
+    def evict(self, name: str) -> bool:
+        """
+        Save a component to the component_store and drop it from memory.
+
+        Returns False if it is not resident, still has queued messages, or
+        owns event bus subscriptions (their handlers may be bound to this
+        instance, which a rehydrated copy would not replace).
+        """
+        if self.component_store is None:
+            raise RuntimeError("evict() requires a component_store")
+        component = self.components.get(name)
+        if component is None or not self._evictable(name):
+            return False
+
+        self.component_store.save(component)
+        del self.components[name]
+        self._mailboxes.pop(name, None)
+        self._last_used.pop(name, None)
+        self._pinned.pop(name, None)
+        self.evictions += 1
+        return True
+
+    def evict_idle(self) -> int:
+        """
+        Evict components over the max_resident budget or idle past idle_ttl. Returns how many.
+
+        Also reconsiders components skipped earlier because they were busy
+        or had subscriptions.
+        """
+        if self._pinned:
+            # Back at the least recently used end, in the order they were last used
+            pinned, self._pinned = self._pinned, {}
+            self._last_used = {**dict(sorted(pinned.items(), key=lambda item: item[1])), **self._last_used}
+        return self._evict_idle()
+
+    def _evict_idle(self, keep: Optional[str] = None) -> int:
+        if self.component_store is None:
+            return 0
+        over = len(self.components) - self.max_resident if self.max_resident is not None else 0
+        cutoff = time.monotonic() - self.idle_ttl if self.idle_ttl is not None else None
+        if over <= 0 and cutoff is None:
+            return 0
+
+        candidates = []
+        pinned = []
+        for name, used in self._last_used.items():  # least recently used first
+            if over <= len(candidates) and (cutoff is None or used >= cutoff):
+                break
+            if name == keep:
+                continue
+            # Busy or subscribed components stay; look further to meet the budget
+            if self._evictable(name):
+                candidates.append(name)
+            else:
+                pinned.append(name)
+        for name in pinned:
+            self._pinned[name] = self._last_used.pop(name)
+        return sum(1 for name in candidates if self.evict(name))
+
+    def _evictable(self, name: str) -> bool:
+        mailbox = self._mailboxes.get(name)
+        if mailbox is not None and (mailbox.active or len(mailbox)):
+            return False
+        return not self.event_bus.subscription_count(name)
+
+    def _touch(self, name: str) -> None:
+        last_used = self._last_used
+        if last_used.pop(name, None) is None and self._pinned:
+            self._pinned.pop(name, None)
+        last_used[name] = time.monotonic()
+        if self.max_resident is not None or self.idle_ttl is not None:
+            first = next(iter(last_used.values()))
+            if (self.max_resident is not None and len(self.components) > self.max_resident) or (
+                self.idle_ttl is not None and first < last_used[name] - self.idle_ttl
+            ):
+                # Never the component being touched: its caller is about to use it
+                self._evict_idle(keep=name)
+
+    def _hydrate(self, name: str, snapshot: Any = None) -> Optional[Any]:
+        if snapshot is None:
+            snapshot = self.component_store.load(name)
+        if snapshot is None:
+            return None
+        component = build_component(snapshot, registry=self.component_store.registry)
+        # Not register(): a rehydrated component is not a new one, so no log
+        # line or engine.component.registered event
+        self._attach(component)
+        self.components[name] = component
+        self.hydrations += 1
+        self._touch(name)
+        return component
+
+    async def send(self, name: str, message: Any, *, wait: bool = True) -> None:
+        """
+        Deliver a message to a component through its mailbox.
+
+        Messages sent to one component are handled strictly one at a time, in
+        send order, so concurrent callers never interleave on its state
+        machine; different components proceed concurrently. Each mailbox's
+        worker task starts on demand and exits when the mailbox is empty.
+
+        With wait=True (default) this returns once the message has been
+        handled and re-raises the component's exception. Use wait=False from
+        event handlers that run inside the component's own processing, which
+        would otherwise wait on themselves.
+
+        Raises:
+            KeyError: If no component with that name is registered
+        """
+        await self._mailbox(name).put(message, wait=wait)
+
+    async def dispatch_many(
+        self,
+        messages: Iterable[Tuple[str, Any]],
+        *,
+        max_concurrency: int = 64,
+    ) -> Dict[str, Any]:
+        """
+        Deliver a batch of (component_name, message) pairs.
+
+        Messages are grouped by component. Each group is handled in input
+        order as a single item in the component's mailbox, so it is still
+        serialized with concurrent send() calls. Up to max_concurrency
+        components are processed at once.
+
+        Per-message observability events and transition log lines are
+        replaced by one ``engine.messages.dispatched`` event and one log line
+        for the whole batch. A failing message does not stop its group.
+
+        Returns:
+            Dict with 'messages', 'components', 'transitions', 'failed' and
+            'errors' ({component_name: [(index_in_group, exception)]}) keys
+
+        Raises:
+            KeyError: If any message targets an unregistered component
+                (nothing is dispatched)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        groups: Dict[str, List[Any]] = {}
+        for name, message in messages:
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = []
+            group.append(message)
+        # Check evicted components without restoring them yet: restoring them
+        # all up front could evict them again before their turn
+        snapshots: Dict[str, Any] = {}
+        unknown = []
+        for name in groups:
+            if name in self.components:
+                continue
+            snapshot = self.component_store.load(name) if self.component_store is not None else None
+            if snapshot is None:
+                unknown.append(name)
+            else:
+                snapshots[name] = snapshot
+        if unknown:
+            raise KeyError(f"Components not registered: {', '.join(map(repr, unknown[:5]))}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = iter(groups.items())
+
+        async def worker() -> None:
+            for name, group in pending:
+                mailbox = self._mailbox(name, snapshots.pop(name, None))
+                results[name] = await mailbox.put(_Batch(group))
+
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(groups)))))
+
+        total = sum(len(group) for group in groups.values())
+        transitions = sum(r["transitions"] for r in results.values())
+        failed = sum(r["failed"] for r in results.values())
+        errors = {name: r["errors"] for name, r in results.items() if r["errors"]}
+
+        self.logger.info(
+            "Dispatched %d messages to %d components (%d transitions, %d failed)",
+            total,
+            len(groups),
+            transitions,
+            failed,
+        )
+        if errors:
+            name, ((index, exc), *_) = next(iter(errors.items()))
+            self.logger.error("First dispatch failure: %s message %d: %r", name, index, exc)
+
+        event = "engine.messages.dispatched"
+        if self.emitter is not None:
+            if self.emitter.has_subscribers(event):
+                self.emitter.emit(event, self._dispatch_report(total, transitions, failed, results))
+        elif self.event_bus.has_subscribers(event):
+            await self.event_bus.publish(event, self._dispatch_report(total, transitions, failed, results))
+
+        return {
+            "messages": total,
+            "components": len(groups),
+            "transitions": transitions,
+            "failed": failed,
+            "errors": errors,
+        }
+
+    @staticmethod
+    def _dispatch_report(
+        total: int,
+        transitions: int,
+        failed: int,
+        results: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {
+            "messages": total,
+            "components": len(results),
+            "transitions": transitions,
+            "failed": failed,
+            "results": {
+                name: {
+                    "processed": r["processed"],
+                    "failed": r["failed"],
+                    "transitions": r["transitions"],
+                    "from_state": r["from_state"],
+                    "to_state": r["to_state"],
+                }
+                for name, r in results.items()
+            },
+        }
+
+    def _mailbox(self, name: str, snapshot: Any = None) -> Mailbox:
+        mailbox = self._mailboxes.get(name)
+        if mailbox is not None:
+            if self.component_store is not None:
+                self._touch(name)
+        else:
+            if snapshot is not None and name not in self.components:
+                component = self._hydrate(name, snapshot)
+            else:
+                component = self.get(name)
+            if component is None:
+                raise KeyError(f"Component not registered: {name!r}")
+            mailbox = self._mailboxes[name] = Mailbox(
+                functools.partial(self._handle, name),
+                maxsize=self.mailbox_size,
+                logger=self.logger,
+            )
+        return mailbox
+
+    async def _handle(self, name: str, item: Any) -> Any:
+        # Looked up per item: registering the name again replaces the
+        # component, and queued messages go to the new one
+        component = self.components[name]
+        if type(item) is _Batch:
+            return await component.handle_messages(item.messages)
+        return await component.handle_message(item)
+
+    def mailbox_stats(self) -> Dict[str, int]:
+        """Return totals across mailboxes: mailboxes, active_workers, queued, processed, failed."""
+        boxes = self._mailboxes.values()
+        return {
+            "mailboxes": len(self._mailboxes),
+            "active_workers": sum(1 for m in boxes if m.active),
+            "queued": sum(len(m) for m in boxes),
+            "processed": sum(m.processed for m in boxes),
+            "failed": sum(m.failed for m in boxes),
+        }
+
+    async def aclose(self) -> None:
+        """Drain mailboxes, flush pending observability events and stop the event bus's dispatchers."""
+        for mailbox in list(self._mailboxes.values()):
+            await mailbox.join()
+        if self.emitter is not None:
+            await self.emitter.flush()
+        await self.event_bus.aclose()
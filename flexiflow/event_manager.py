@@ -1,13 +1,80 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import itertools
+import random
+import time
 import uuid
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Optional
+import weakref
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .bus_stats import LATENCY_BUCKETS, BusStats
+from .dead_letters import DeadLetter, DeadLetterStore
+from .extras.retry import RetryConfig, retry_delay, validate_config
+from .rate_gates import RateGate
+from .streams import EventStream
+from .topics import TopicTrie, is_pattern
 
 Handler = Callable[[Any], Awaitable[None]]
+SyncHandler = Callable[[Any], None]  # for executor="thread" / executor="inline"
 FilterFn = Callable[[str, Any], bool]
+MatchItems = Tuple[Tuple[str, Hashable], ...]
+
+PRIORITIES = (1, 2, 3, 4, 5)
+_DELIVERY_MODES = ("sequential", "concurrent", "tiered", "partitioned")
+_ERROR_POLICIES = ("continue", "raise")
+_OVERFLOW_POLICIES = ("block", "drop_oldest", "reject")
+_EXECUTORS = (None, "thread", "inline")
+# Upper bound on cached per-name plans; wildcard subscribers can make the set of names open-ended
+_PLAN_CACHE_LIMIT = 10_000
+_REQUEST_MODES = ("first", "gather")
+# Events a partition worker delivers from one lane before yielding to other lanes
+_LANE_BATCH = 32
+
+PartitionKeyFn = Callable[[Any], Hashable]
+
+# Correlation id of the request() being served, visible to handlers it invokes
+_current_correlation_id: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "flexiflow_correlation_id", default=None
+)
+
+# Partition key of the lane whose event the current handler is serving, if any
+_current_partition: contextvars.ContextVar[Optional[Tuple[Hashable]]] = contextvars.ContextVar(
+    "flexiflow_partition", default=None
+)
+
+
+async def _dead_handler() -> None:
+    """Stand-in coroutine for a weak async handler whose owner was collected."""
+
+
+def current_correlation_id() -> Optional[int]:
+    """Return the correlation id of the request() the current handler is serving, if any.
+
+    Handlers that cannot answer by returning a value can pass it to
+    AsyncEventManager.reply() later.
+    """
+    return _current_correlation_id.get()
 
 
 @dataclass(frozen=True)
@@ -22,48 +89,472 @@ class Subscription:
     subscription_id: str
     priority: int
     component_name: str
-    handler: Handler
+    handler: Union[Handler, SyncHandler]
     filter_fn: Optional[FilterFn] = None
+    timeout: Optional[float] = None  # seconds; overrides the publish-level timeout
+    executor: Optional[str] = None  # None (async handler) | "thread" | "inline"
+    match: Optional[MatchItems] = None  # declarative payload filter, sorted (key, value) pairs
+    seq: int = field(default=0, compare=False, repr=False)  # subscription order across patterns
+    # debounce/throttle/coalesce: handler is gate.push and the gate calls the real handler
+    gate: Optional[RateGate] = field(default=None, compare=False, repr=False)
+    retry: Optional[RetryConfig] = None  # failed deliveries are re-scheduled on a timer
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """Immutable, priority-ordered snapshot of an event's subscribers.
+
+    Rebuilt only after subscriptions change so publish() only has to iterate.
+    Subscriptions with a declarative ``match`` are kept out of ``ordered`` and
+    indexed by the payload values they require instead.
+    """
+    tiers: Tuple[Tuple[Subscription, ...], ...]  # non-empty tiers, highest priority first
+    ordered: Tuple[Subscription, ...]  # every subscription without a match
+    filtered: bool  # True if any subscription carries a filter_fn
+    # match keys -> {payload values -> subscriptions}, or None if nothing uses match
+    match_index: Optional[Dict[Tuple[str, ...], Dict[Tuple[Any, ...], Tuple[Subscription, ...]]]]
+    simple: bool  # no filters and no match index: ordered is the delivery list
+
+    @classmethod
+    def build(cls, sources: List[List[Dict[str, Subscription]]]) -> "_DispatchPlan":
+        """Merge the priority slots of an exact name and any matching patterns."""
+        if len(sources) == 1:
+            tiers = tuple(tuple(slot.values()) for slot in sources[0] if slot)
+        else:
+            merged = []
+            for i in range(len(PRIORITIES)):
+                tier = [s for slots in sources for s in slots[i].values()]
+                if tier:
+                    tier.sort(key=lambda s: s.seq)
+                    merged.append(tuple(tier))
+            tiers = tuple(merged)
+
+        filtered = any(s.filter_fn is not None for tier in tiers for s in tier)
+        match_index = None
+        if any(s.match is not None for tier in tiers for s in tier):
+            index: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], List[Subscription]]] = {}
+            for tier in tiers:
+                for s in tier:
+                    if s.match is not None:
+                        keys = tuple(k for k, _ in s.match)
+                        values = tuple(v for _, v in s.match)
+                        index.setdefault(keys, {}).setdefault(values, []).append(s)
+            match_index = {
+                keys: {values: tuple(subs) for values, subs in table.items()}
+                for keys, table in index.items()
+            }
+            tiers = tuple(
+                t for t in (tuple(s for s in tier if s.match is None) for tier in tiers) if t
+            )
+
+        return cls(
+            tiers=tiers,
+            ordered=tuple(s for tier in tiers for s in tier),
+            filtered=filtered,
+            match_index=match_index,
+            simple=not filtered and match_index is None,
+        )
+
+    def select(self, event_name: str, data: Any) -> Sequence[Subscription]:
+        """Return the subscriptions that should receive this payload, in priority order."""
+        ordered: Sequence[Subscription] = self.ordered
+        if self.match_index is not None and isinstance(data, Mapping):
+            hits: List[Subscription] = []
+            for keys, table in self.match_index.items():
+                try:
+                    found = table.get(tuple(data[k] for k in keys))
+                except (KeyError, TypeError):  # missing key or unhashable value
+                    continue
+                if found:
+                    hits.extend(found)
+            if hits:
+                ordered = sorted((*ordered, *hits), key=lambda s: (s.priority, s.seq))
+        if self.filtered:
+            ordered = [s for s in ordered if s.filter_fn is None or s.filter_fn(event_name, data)]
+        return ordered
 
 
 class AsyncEventManager:
-    """Async pub/sub bus with priorities, optional filters, and sequential/concurrent delivery."""
+    """Async pub/sub bus with priorities, optional filters, and sequential/concurrent/tiered delivery.
+
+    Event names passed to subscribe() may be hierarchical patterns: ``*``
+    matches one dot-separated segment and ``#`` matches zero or more
+    (see flexiflow.topics).
+    """
 
-    def __init__(self, logger: Any = None) -> None:
-        self._events: DefaultDict[str, List[Subscription]] = defaultdict(list)
+    def __init__(
+        self,
+        logger: Any = None,
+        *,
+        queue_maxsize: int = 1000,
+        dispatch_workers: int = 1,
+        overflow: str = "block",        # "block" | "drop_oldest" | "reject"
+        max_in_flight: Optional[int] = None,
+        slow_handler_threshold: Optional[float] = None,
+        thread_workers: int = 4,
+        collect_stats: bool = False,
+        partition_key: Optional[PartitionKeyFn] = None,
+        partition_workers: int = 8,
+        failure_interval: Optional[float] = None,
+        failure_exemplars: int = 3,
+        dead_letters: Optional[DeadLetterStore] = None,
+        max_pending_retries: int = 10_000,
+    ) -> None:
+        if queue_maxsize < 1:
+            raise ValueError("queue_maxsize must be >= 1")
+        if dispatch_workers < 1:
+            raise ValueError("dispatch_workers must be >= 1")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError("overflow must be 'block', 'drop_oldest' or 'reject'")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if slow_handler_threshold is not None and slow_handler_threshold < 0:
+            raise ValueError("slow_handler_threshold must be >= 0")
+        if thread_workers < 1:
+            raise ValueError("thread_workers must be >= 1")
+        if partition_workers < 1:
+            raise ValueError("partition_workers must be >= 1")
+        if failure_interval is not None and failure_interval <= 0:
+            raise ValueError("failure_interval must be > 0")
+        if failure_exemplars < 1:
+            raise ValueError("failure_exemplars must be >= 1")
+        if max_pending_retries < 1:
+            raise ValueError("max_pending_retries must be >= 1")
+
+        # event name or pattern -> one {subscription_id: Subscription} slot per priority tier
+        self._events: Dict[str, List[Dict[str, Subscription]]] = {}
         self._logger = logger
-        # Reverse index to speed up component-wide unsubscribe
-        self._by_component: Dict[str, List[SubscriptionHandle]] = defaultdict(list)
+        # Default cap on handlers running at once in a concurrent/tiered publish
+        self._max_in_flight = max_in_flight
+        # Handlers taking at least this many seconds emit event.handler.slow
+        self._slow_threshold = slow_handler_threshold
+        # Latency/throughput statistics; None when disabled so the hot path skips them
+        self._stats: Optional[BusStats] = BusStats() if collect_stats else None
+        # True when every delivery must be timed (slow threshold or stats)
+        self._instrumented = slow_handler_threshold is not None or collect_stats
+        # Per-event dispatch plans, dropped on subscribe/unsubscribe and rebuilt on next publish
+        self._plans: Dict[str, _DispatchPlan] = {}
+        # subscription_id -> (event_name, component_name, slot) for constant-time removal
+        self._index: Dict[str, Tuple[str, str, int]] = {}
+        # Reverse index to speed up component-wide unsubscribe (subscription_id -> event_name)
+        self._by_component: DefaultDict[str, Dict[str, str]] = defaultdict(dict)
+        # Wildcard patterns; exact names never touch the trie
+        self._topics = TopicTrie()
+        self._seq = itertools.count()
+        # Ids of weak=True subscriptions whose handler was collected, appended by weakref callbacks
+        self._dead_subscriptions: Deque[str] = deque()
+        # Bounded pool for executor="thread" handlers, created on first use
+        self._thread_workers = thread_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+        # Queued publish (enqueue/publish_nowait); queue and workers start lazily
+        self._queue_maxsize = queue_maxsize
+        self._dispatch_workers = dispatch_workers
+        self._overflow = overflow
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._queue_counters = {
+            "enqueued": 0,
+            "dispatched": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "high_water": 0,
+        }
+
+        # request()/reply(): correlation id -> future awaiting the first reply
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._correlation_ids = itertools.count(1)
+        # Strong references to fire-and-forget tasks started by the bus
+        self._background: Set[asyncio.Task] = set()
+
+        # delivery="partitioned": one FIFO lane per key, served by at most
+        # partition_workers tasks; a lane is owned by one worker at a time
+        self._partition_key = partition_key
+        self._partition_workers = partition_workers
+        self._lanes: Dict[Hashable, Deque[tuple]] = {}
+        self._ready_lanes: Deque[Hashable] = deque()
+        self._active_partition_workers = 0
+
+        # event.handler.failed aggregation: with an interval, failures are counted
+        # per (event_name, component_name) and published once per interval with
+        # up to failure_exemplars sampled exceptions, formatted only at flush time
+        self._failure_interval = failure_interval
+        self._failure_exemplars = failure_exemplars
+        self._failures: Dict[Tuple[str, str], List[Any]] = {}  # key -> [count, exemplars]
+        self._failure_timer: Optional[asyncio.TimerHandle] = None
+
+        # Failed deliveries under on_error="continue" are kept here for redrive()
+        self.dead_letters = dead_letters
+
+        # subscribe(retry=...): retry id -> (timer, (event_name, subscription, data, exception, attempts)).
+        # An entry lives from scheduling until its attempt has finished.
+        self._max_pending_retries = max_pending_retries
+        self._retries: Dict[int, Tuple[Optional[asyncio.TimerHandle], tuple]] = {}
+        self._retry_ids = itertools.count(1)
+        self._retry_counters = {"scheduled": 0, "succeeded": 0, "exhausted": 0, "rejected": 0, "cancelled": 0}
 
     async def subscribe(
         self,
         event_name: str,
         component_name: str,
-        handler: Handler,
+        handler: Union[Handler, SyncHandler],
         priority: int = 3,
         filter_fn: Optional[FilterFn] = None,
+        *,
+        timeout: Optional[float] = None,
+        executor: Optional[str] = None,
+        match: Optional[Mapping[str, Hashable]] = None,
+        debounce: Optional[float] = None,
+        throttle: Optional[float] = None,
+        coalesce_key: Optional[Callable[[Any], Hashable]] = None,
+        retry: Optional[RetryConfig] = None,
+        weak: bool = False,
     ) -> SubscriptionHandle:
         """
-        Subscribe a handler to an event.
+        Subscribe a handler to an event name or wildcard pattern
+        (``state.*``, ``component.#``).
+
+        A timeout (seconds) bounds each call of this handler; a handler that
+        exceeds it fails with asyncio.TimeoutError like any other exception.
+
+        By default handler is an async callable. With executor="thread" it is a
+        plain sync callable run on the bus's bounded thread pool, so blocking
+        work does not stall the event loop. With executor="inline" it is a
+        cheap sync callable invoked directly in the delivery loop, without
+        creating a coroutine (timeouts do not apply to inline handlers).
+
+        match is a declarative filter on dict payloads, e.g.
+        ``match={"component": "orders-17"}``: the handler only receives events
+        whose payload has equal values for every key. Unlike filter_fn it is
+        resolved with a hash lookup, so it costs nothing per non-matching
+        subscriber. If both are given, filter_fn is applied to matching events.
+
+        debounce, throttle and coalesce_key bound how often the handler runs
+        for high-rate events. publish() only records the payload; a loop timer
+        later calls the handler with the latest payload:
+
+            debounce=0.25: once 0.25s after the last event
+            throttle=0.25: at most once every 0.25s
+            coalesce_key=fn: with either of the above, the latest payload per
+                fn(data), one call per key; on its own, the latest payload per
+                key is delivered on the next loop iteration
+
+        Rate-limited handlers run outside publish(), so failures are always
+        reported as with on_error="continue". See flexiflow.rate_gates.
+
+        retry takes a flexiflow.extras.retry.RetryConfig. A delivery that fails
+        with one of its retry_on exceptions is re-scheduled on a loop timer
+        with the config's backoff, and publish() carries on as if it had
+        succeeded; only the final failure is reported (as with
+        on_error="continue"). The bus caps outstanding retries with
+        max_pending_retries.
+
+        With weak=True the bus only holds a weak reference to the handler (a
+        weakref.WeakMethod for bound methods), so subscribing does not keep
+        the owning component alive. Once the owner is garbage collected the
+        handler is skipped and the subscription is removed the next time a
+        dispatch plan is looked up. Plain functions must be kept alive by
+        the caller.
 
         Returns a SubscriptionHandle that can be passed to unsubscribe().
         """
+        return self._subscribe(
+            event_name,
+            component_name,
+            handler,
+            priority,
+            filter_fn,
+            timeout=timeout,
+            executor=executor,
+            match=match,
+            debounce=debounce,
+            throttle=throttle,
+            coalesce_key=coalesce_key,
+            retry=retry,
+            weak=weak,
+        )
+
+    def stream(
+        self,
+        event_name: str,
+        *,
+        maxsize: int = 1000,
+        overflow: str = "drop_oldest",  # "drop_oldest" | "drop_newest" | "coalesce"
+        key: Optional[Callable[[Any], Hashable]] = None,
+        component_name: str = "stream",
+        priority: int = 5,
+        match: Optional[Mapping[str, Hashable]] = None,
+    ) -> EventStream:
+        """
+        Subscribe to an event (or pattern) and consume payloads as an async iterator.
+
+        The subscription is active as soon as this returns. Payloads are pushed
+        into a bounded buffer without awaiting the consumer, so a slow consumer
+        loses or coalesces events according to ``overflow`` instead of stalling
+        publish() for everyone. Closing the stream (or leaving its ``async
+        with`` block) unsubscribes it.
+
+            async with bus.stream("state.changed", maxsize=100) as events:
+                async for data in events:
+                    ...
+
+        Overflow policies:
+            "drop_oldest": discard the oldest buffered payload (default)
+            "drop_newest": discard the incoming payload
+            "coalesce": keep only the latest payload per key(data); requires key
+        """
+        stream = EventStream(maxsize=maxsize, overflow=overflow, key=key)
+        handle = self._subscribe(
+            event_name,
+            component_name,
+            stream._push,
+            priority,
+            None,
+            executor="inline",
+            match=match,
+        )
+        stream._attach(self, handle)
+        return stream
+
+    def _subscribe(
+        self,
+        event_name: str,
+        component_name: str,
+        handler: Union[Handler, SyncHandler],
+        priority: int,
+        filter_fn: Optional[FilterFn],
+        *,
+        timeout: Optional[float] = None,
+        executor: Optional[str] = None,
+        match: Optional[Mapping[str, Hashable]] = None,
+        debounce: Optional[float] = None,
+        throttle: Optional[float] = None,
+        coalesce_key: Optional[Callable[[Any], Hashable]] = None,
+        retry: Optional[RetryConfig] = None,
+        weak: bool = False,
+    ) -> SubscriptionHandle:
         if not (1 <= priority <= 5):
             raise ValueError("priority must be an integer between 1 and 5")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be > 0")
+        if executor not in _EXECUTORS:
+            raise ValueError("executor must be None, 'thread' or 'inline'")
+        if executor is not None and asyncio.iscoroutinefunction(handler):
+            raise ValueError(f"executor={executor!r} requires a synchronous handler")
+        match_items = None
+        if match is not None:
+            if not match:
+                raise ValueError("match must name at least one payload key")
+            try:
+                if not all(isinstance(k, str) for k in match):
+                    raise TypeError
+                match_items = tuple(sorted(match.items()))
+                hash(match_items)
+            except TypeError:
+                raise ValueError("match keys must be strings and values must be hashable") from None
+        if debounce is not None and throttle is not None:
+            raise ValueError("debounce and throttle are mutually exclusive")
+        if (debounce is not None and debounce <= 0) or (throttle is not None and throttle <= 0):
+            raise ValueError("debounce/throttle interval must be > 0")
+        if retry is not None:
+            validate_config(retry)
 
         subscription_id = str(uuid.uuid4())
+        if weak:
+            handler = self._weak_handler(handler, executor, subscription_id)
         sub = Subscription(
             subscription_id=subscription_id,
             priority=priority,
             component_name=component_name,
             handler=handler,
             filter_fn=filter_fn,
+            timeout=timeout,
+            executor=executor,
+            match=match_items,
+            seq=next(self._seq),
+            retry=retry,
         )
-        self._events[event_name].append(sub)
+        if debounce is not None or throttle is not None or coalesce_key is not None:
+            sub = self._gated(event_name, sub, debounce, throttle, coalesce_key)
+        slot = priority - 1
+        tiers = self._events.get(event_name)
+        if tiers is None:
+            tiers = self._events[event_name] = [{} for _ in PRIORITIES]
+            if is_pattern(event_name):
+                self._topics.add(event_name)
+        tiers[slot][subscription_id] = sub
+        self._invalidate(event_name)
+
+        self._index[subscription_id] = (event_name, component_name, slot)
+        self._by_component[component_name][subscription_id] = event_name
+        return SubscriptionHandle(event_name=event_name, subscription_id=subscription_id)
+
+    def _gated(
+        self,
+        event_name: str,
+        sub: Subscription,
+        debounce: Optional[float],
+        throttle: Optional[float],
+        coalesce_key: Optional[Callable[[Any], Hashable]],
+    ) -> Subscription:
+        """Wrap a subscription so publish() feeds a RateGate that calls the real handler."""
+
+        async def deliver(data: Any) -> None:
+            try:
+                await self._call(event_name, sub, data, None)
+            except Exception as e:
+                if sub.retry is None or not self._schedule_retry(event_name, sub, data, e, 1):
+                    self._handler_error(event_name, sub, e)
+                    self._dead_letter(event_name, sub, data, e)
+
+        if debounce is not None:
+            gate = RateGate(deliver, mode="debounce", interval=debounce, key=coalesce_key, spawn=self._spawn)
+        elif throttle is not None:
+            gate = RateGate(deliver, mode="throttle", interval=throttle, key=coalesce_key, spawn=self._spawn)
+        else:
+            gate = RateGate(deliver, mode="coalesce", key=coalesce_key, spawn=self._spawn)
+        return replace(sub, handler=gate.push, executor="inline", timeout=None, gate=gate, retry=None)
+
+    def _weak_handler(
+        self,
+        handler: Union[Handler, SyncHandler],
+        executor: Optional[str],
+        subscription_id: str,
+    ) -> Union[Handler, SyncHandler]:
+        """Wrap a handler in a weak reference that reports its death for pruning."""
+        dead = self._dead_subscriptions
+
+        # Runs inside garbage collection: only record the id, prune later
+        def on_collected(_: Any) -> None:
+            dead.append(subscription_id)
+
+        try:
+            ref: Callable[[], Any] = (
+                weakref.WeakMethod(handler, on_collected)  # type: ignore[arg-type]
+                if hasattr(handler, "__self__") and hasattr(handler, "__func__")
+                else weakref.ref(handler, on_collected)
+            )
+        except TypeError:
+            raise ValueError("weak=True requires a handler that supports weak references") from None
 
-        handle = SubscriptionHandle(event_name=event_name, subscription_id=subscription_id)
-        self._by_component[component_name].append(handle)
-        return handle
+        if executor is None:
+            def call(data: Any) -> Awaitable[None]:
+                fn = ref()
+                return fn(data) if fn is not None else _dead_handler()
+        else:
+            def call(data: Any) -> Any:  # type: ignore[misc]
+                fn = ref()
+                return fn(data) if fn is not None else None
+        return call
+
+    def _prune_dead(self) -> None:
+        """Remove weak subscriptions whose handlers were garbage collected."""
+        dead = self._dead_subscriptions
+        while dead:
+            subscription_id = dead.popleft()
+            entry = self._index.get(subscription_id)
+            if entry is not None:
+                self.unsubscribe(SubscriptionHandle(entry[0], subscription_id))
 
     def unsubscribe(self, handle: SubscriptionHandle) -> bool:
         """
@@ -72,29 +563,25 @@ class AsyncEventManager:
         Returns True if something was removed, False otherwise.
         Safe to call multiple times (idempotent).
         """
-        subs = self._events.get(handle.event_name)
-        if not subs:
+        entry = self._index.get(handle.subscription_id)
+        if entry is None or entry[0] != handle.event_name:
             return False
+        del self._index[handle.subscription_id]
 
-        before = len(subs)
-        subs[:] = [s for s in subs if s.subscription_id != handle.subscription_id]
-        removed = len(subs) != before
+        event_name, component_name, slot = entry
+        sub = self._events[event_name][slot].pop(handle.subscription_id)
+        if sub.gate is not None:
+            sub.gate.close()
+        self._drop_plan(event_name)
 
         # Clean up reverse index
-        if removed:
-            for comp, handles in list(self._by_component.items()):
-                new_list = [h for h in handles if h != handle]
-                if len(new_list) != len(handles):
-                    self._by_component[comp] = new_list
-                    if not new_list:
-                        self._by_component.pop(comp, None)
-                    break
-
-        # Clean up empty event lists
-        if not subs:
-            self._events.pop(handle.event_name, None)
+        owned = self._by_component.get(component_name)
+        if owned is not None:
+            owned.pop(handle.subscription_id, None)
+            if not owned:
+                del self._by_component[component_name]
 
-        return removed
+        return True
 
     def unsubscribe_all(self, component_name: str) -> int:
         """
@@ -102,20 +589,90 @@ class AsyncEventManager:
 
         Returns the number of subscriptions removed.
         """
-        handles = self._by_component.pop(component_name, [])
-        count = 0
-        for h in handles:
-            if self.unsubscribe(h):
-                count += 1
-        return count
+        owned = self._by_component.pop(component_name, None)
+        if not owned:
+            return 0
+
+        touched = set()
+        for subscription_id, event_name in owned.items():
+            _, _, slot = self._index.pop(subscription_id)
+            sub = self._events[event_name][slot].pop(subscription_id)
+            if sub.gate is not None:
+                sub.gate.close()
+            touched.add(event_name)
+
+        # Plans and empty events are cleaned up once per event, not once per handle
+        for event_name in touched:
+            self._drop_plan(event_name)
+
+        return len(owned)
+
+    def subscription_count(self, component_name: str) -> int:
+        """Return the number of subscriptions a component currently owns."""
+        owned = self._by_component.get(component_name)
+        return len(owned) if owned else 0
+
+    def has_subscribers(self, event_name: str) -> bool:
+        """
+        Return True if publishing event_name would reach at least one subscription.
+
+        Cheap enough for hot paths: callers can skip building payloads for
+        events nobody listens to. Filters are not evaluated.
+        """
+        if self._dead_subscriptions:
+            self._prune_dead()
+        return event_name in self._plans or self._plan_for(event_name) is not None
+
+    def _invalidate(self, event_name: str) -> None:
+        """Drop cached plans affected by a change to an event name or pattern."""
+        if self._topics and is_pattern(event_name):
+            # A pattern can feed any number of concrete names
+            self._plans.clear()
+        else:
+            self._plans.pop(event_name, None)
+
+    def _drop_plan(self, event_name: str) -> None:
+        """Invalidate an event's dispatch plan and forget the event once it has no subscribers."""
+        self._invalidate(event_name)
+        tiers = self._events.get(event_name)
+        if tiers is not None and not any(tiers):
+            del self._events[event_name]
+            self._topics.remove(event_name)
+
+    def _plan_for(self, event_name: str) -> Optional[_DispatchPlan]:
+        """Return the cached dispatch plan for an event, building it if needed."""
+        if self._dead_subscriptions:
+            self._prune_dead()
+        plan = self._plans.get(event_name)
+        if plan is not None:
+            return plan
+
+        sources = []
+        tiers = self._events.get(event_name)
+        if tiers is not None:
+            sources.append(tiers)
+        if self._topics:
+            for pattern in self._topics.match(event_name):
+                if pattern != event_name:
+                    sources.append(self._events[pattern])
+        if not sources:
+            return None
+
+        if len(self._plans) >= _PLAN_CACHE_LIMIT:
+            self._plans.clear()
+        plan = self._plans[event_name] = _DispatchPlan.build(sources)
+        return plan
 
     async def publish(
         self,
         event_name: str,
         data: Any = None,
         *,
-        delivery: str = "sequential",   # "sequential" | "concurrent"
+        delivery: str = "sequential",   # "sequential" | "concurrent" | "tiered" | "partitioned"
         on_error: str = "continue",     # "continue" | "raise"
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+        partition_key: Optional[PartitionKeyFn] = None,
     ) -> None:
         """
         Publish an event to all subscribed handlers.
@@ -123,53 +680,880 @@ class AsyncEventManager:
         Args:
             event_name: The event to publish
             data: Optional data payload
-            delivery: "sequential" (default) or "concurrent"
+            delivery: "sequential" (default), "concurrent", "tiered" (each
+                priority tier concurrently, tiers in order), or "partitioned"
+                (sequential per partition key, partitions in parallel)
             on_error: "continue" (default, log and proceed) or "raise" (propagate first exception)
+            max_in_flight: Cap on handlers running at once for concurrent/tiered
+                delivery (defaults to the bus's max_in_flight; None means no cap)
+            timeout: Per-handler timeout in seconds for handlers that do not set
+                their own; timed-out handlers are treated as failed
+            partition_key: For partitioned delivery, maps the payload to its
+                partition (e.g. ``lambda d: d["component"]``); defaults to the
+                bus's partition_key. Events with the same key are delivered one
+                at a time in publish order, even across concurrent publishers.
         """
-        if delivery not in ("sequential", "concurrent"):
-            raise ValueError("delivery must be 'sequential' or 'concurrent'")
-        if on_error not in ("continue", "raise"):
+        if delivery not in _DELIVERY_MODES:
+            raise ValueError("delivery must be 'sequential', 'concurrent', 'tiered' or 'partitioned'")
+        if on_error not in _ERROR_POLICIES:
             raise ValueError("on_error must be 'continue' or 'raise'")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be > 0")
+        if self._stats is not None:
+            self._stats.record_publish(event_name)
+        if self._dead_subscriptions:
+            self._prune_dead()
 
-        subs = self._events.get(event_name, [])
-        if not subs:
+        plan = self._plans.get(event_name) or self._plan_for(event_name)
+        if plan is None:
             return
 
-        eligible = [s for s in subs if s.filter_fn is None or s.filter_fn(event_name, data)]
-        ordered = sorted(eligible, key=lambda s: s.priority)
+        ordered = plan.ordered if plan.simple else plan.select(event_name, data)
+
+        if delivery == "sequential":
+            await self._deliver_sequential(event_name, data, ordered, on_error, timeout)
+            return
+        if delivery == "partitioned":
+            key_fn = self._key_fn(partition_key)
+            if ordered:
+                await self._partition(key_fn(data), event_name, data, ordered, on_error, timeout)
+            return
 
+        limit = self._limit(max_in_flight)
         if delivery == "concurrent":
-            tasks = [asyncio.create_task(s.handler(data)) for s in ordered]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            await self._deliver_concurrent([(event_name, data, ordered)], on_error, limit, timeout)
+        else:
+            await self._deliver_tiered(event_name, data, plan, ordered, on_error, limit, timeout)
 
-            if on_error == "raise":
-                for r in results:
-                    if isinstance(r, Exception):
-                        raise r
+    async def publish_many(
+        self,
+        events: Iterable[Tuple[str, Any]],
+        *,
+        delivery: str = "sequential",   # "sequential" | "concurrent" | "tiered" | "partitioned"
+        on_error: str = "continue",     # "continue" | "raise"
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = None,
+        partition_key: Optional[PartitionKeyFn] = None,
+    ) -> None:
+        """
+        Publish a burst of events in one call.
 
-            # Log and emit failure events for exceptions (continue mode)
-            for s, r in zip(ordered, results):
-                if isinstance(r, Exception):
-                    if self._logger:
-                        self._logger.error("Error handling event %s: %s", event_name, r)
-                    # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
-                    if event_name != "event.handler.failed":
-                        await self._emit_handler_failed(event_name, s.component_name, r)
-            return
+        Options are validated once and each distinct event name is looked up
+        once for the whole batch. Sequential delivery keeps the order of
+        ``events``; concurrent delivery runs every handler of every event in a
+        single gather. Tiered delivery handles events in order, each one tier
+        by tier. Partitioned delivery keeps input order per partition key.
 
-        # sequential delivery
-        for s in ordered:
+        Args:
+            events: Iterable of (event_name, data) pairs
+            delivery: "sequential" (default), "concurrent", "tiered" (each
+                priority tier concurrently, tiers in order), or "partitioned"
+                (sequential per partition key, partitions in parallel)
+            on_error: "continue" (default, log and proceed) or "raise" (propagate first exception)
+            max_in_flight: Cap on handlers running at once (see publish())
+            timeout: Per-handler timeout in seconds (see publish())
+            partition_key: Partition key function for partitioned delivery (see publish())
+        """
+        if delivery not in _DELIVERY_MODES:
+            raise ValueError("delivery must be 'sequential', 'concurrent', 'tiered' or 'partitioned'")
+        if on_error not in _ERROR_POLICIES:
+            raise ValueError("on_error must be 'continue' or 'raise'")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be > 0")
+        limit = self._limit(max_in_flight)
+        key_fn = self._key_fn(partition_key) if delivery == "partitioned" else None
+
+        plans: Dict[str, Optional[_DispatchPlan]] = {}
+        batch: List[Tuple[str, Any, Sequence[Subscription]]] = []
+        batch_plans: List[_DispatchPlan] = []
+        stats = self._stats
+        for event_name, data in events:
+            if stats is not None:
+                stats.record_publish(event_name)
             try:
-                await s.handler(data)
+                plan = plans[event_name]
+            except KeyError:
+                plan = plans[event_name] = self._plan_for(event_name)
+            if plan is None:
+                continue
+            ordered = plan.ordered if plan.simple else plan.select(event_name, data)
+            if ordered:
+                batch.append((event_name, data, ordered))
+                batch_plans.append(plan)
+
+        if delivery == "concurrent":
+            await self._deliver_concurrent(batch, on_error, limit, timeout)
+        elif delivery == "partitioned":
+            await asyncio.gather(
+                *(
+                    self._partition(key_fn(data), event_name, data, ordered, on_error, timeout)  # type: ignore[misc]
+                    for event_name, data, ordered in batch
+                )
+            )
+        elif delivery == "tiered":
+            for (event_name, data, ordered), plan in zip(batch, batch_plans):
+                await self._deliver_tiered(event_name, data, plan, ordered, on_error, limit, timeout)
+        else:
+            for event_name, data, ordered in batch:
+                await self._deliver_sequential(event_name, data, ordered, on_error, timeout)
+
+    def _key_fn(self, partition_key: Optional[PartitionKeyFn]) -> PartitionKeyFn:
+        key_fn = partition_key or self._partition_key
+        if key_fn is None:
+            raise ValueError("delivery='partitioned' requires a partition_key")
+        return key_fn
+
+    def _partition(
+        self,
+        key: Hashable,
+        event_name: str,
+        data: Any,
+        subs: Sequence[Subscription],
+        on_error: str,
+        timeout: Optional[float],
+    ) -> Awaitable[None]:
+        """
+        Append a delivery to its key's lane; the returned awaitable resolves once it ran.
+
+        From inside a lane's handler, a publish for the same key is delivered
+        inline (the lane is busy with that handler), and a publish for another
+        key is queued without waiting: a worker blocked on another lane could
+        deadlock with that lane's worker doing the same, or with no worker free.
+        """
+        loop = asyncio.get_running_loop()
+        serving = _current_partition.get()
+        if serving is not None and serving[0] == key:
+            return self._deliver_sequential(event_name, data, subs, on_error, timeout)
+
+        done = loop.create_future()
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            self._ready_lanes.append(key)
+            if self._active_partition_workers < self._partition_workers:
+                self._active_partition_workers += 1
+                self._spawn(self._partition_worker())
+        if serving is None:
+            lane.append((event_name, data, subs, on_error, timeout, done))
+        else:
+            lane.append((event_name, data, subs, on_error, timeout, None))
+            done.set_result(None)
+        return done
+
+    async def _partition_worker(self) -> None:
+        """Serve ready lanes until none are left, then exit."""
+        lanes = self._lanes
+        ready = self._ready_lanes
+        try:
+            while ready:
+                key = ready.popleft()
+                lane = lanes[key]
+                for _ in range(_LANE_BATCH):
+                    if not lane:
+                        break
+                    event_name, data, subs, on_error, timeout, done = lane.popleft()
+                    token = _current_partition.set((key,))
+                    try:
+                        await self._deliver_sequential(event_name, data, subs, on_error, timeout)
+                    except Exception as e:
+                        if done is None:
+                            # Nobody waits for a cross-lane publish from a handler
+                            if self._logger:
+                                self._logger.error("Error delivering partitioned event %s: %s", event_name, e)
+                        elif not done.done():
+                            done.set_exception(e)
+                    else:
+                        if done is not None and not done.done():
+                            done.set_result(None)
+                    finally:
+                        _current_partition.reset(token)
+                # Requeue a busy lane behind the others, or retire an empty one
+                if lane:
+                    ready.append(key)
+                else:
+                    del lanes[key]
+        finally:
+            self._active_partition_workers -= 1
+
+    def _limit(self, max_in_flight: Optional[int]) -> Optional[int]:
+        if max_in_flight is None:
+            return self._max_in_flight
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        return max_in_flight
+
+    async def _deliver_sequential(
+        self,
+        event_name: str,
+        data: Any,
+        subs: Sequence[Subscription],
+        on_error: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        inline_ok = not self._instrumented
+        for s in subs:
+            try:
+                if s.executor == "inline" and inline_ok:
+                    s.handler(data)
+                else:
+                    await self._call(event_name, s, data, timeout)
             except Exception as e:
+                if s.retry is not None and self._schedule_retry(event_name, s, data, e, 1):
+                    continue
                 if self._logger:
                     self._logger.error("Error handling event %s: %s", event_name, e)
+                if on_error == "continue":
+                    self._dead_letter(event_name, s, data, e)
                 # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
                 if on_error == "continue" and event_name != "event.handler.failed":
                     await self._emit_handler_failed(event_name, s.component_name, e)
                 if on_error == "raise":
                     raise
 
+    async def _deliver_tiered(
+        self,
+        event_name: str,
+        data: Any,
+        plan: _DispatchPlan,
+        ordered: Sequence[Subscription],
+        on_error: str,
+        limit: Optional[int],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Run each priority tier concurrently, waiting for a tier before starting the next."""
+        if not plan.simple:
+            tiers: Any = [tuple(tier) for _, tier in itertools.groupby(ordered, key=lambda s: s.priority)]
+        else:
+            tiers = plan.tiers
+        for tier in tiers:
+            await self._deliver_concurrent([(event_name, data, tier)], on_error, limit, timeout)
+
+    async def _deliver_concurrent(
+        self,
+        batch: List[Tuple[str, Any, Sequence[Subscription]]],
+        on_error: str,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Run every (event, subscription) delivery in the batch under one gather.
+
+        With a limit, at most ``limit`` worker tasks pull deliveries from the
+        batch, so large fan-outs never spawn one task per subscriber.
+        """
+        calls = [(event_name, data, s) for event_name, data, subs in batch for s in subs]
+        results: List[Any] = [None] * len(calls)
+        inline_ok = not self._instrumented
+        if limit is None or len(calls) <= limit:
+            tasks = []
+            positions = []
+            for i, (event_name, data, s) in enumerate(calls):
+                if s.executor == "inline" and inline_ok:
+                    # Cheap sync handlers run right here instead of in a task
+                    try:
+                        s.handler(data)
+                    except Exception as e:
+                        results[i] = e
+                    continue
+                tasks.append(asyncio.ensure_future(self._call(event_name, s, data, timeout)))
+                positions.append(i)
+            if tasks:
+                gathered = await asyncio.gather(*tasks, return_exceptions=True)
+                for i, r in zip(positions, gathered):
+                    results[i] = r
+        else:
+            pending = iter(enumerate(calls))
+
+            async def worker() -> None:
+                for i, (event_name, data, s) in pending:
+                    try:
+                        if s.executor == "inline" and inline_ok:
+                            s.handler(data)
+                        else:
+                            await self._call(event_name, s, data, timeout)
+                    except Exception as e:
+                        results[i] = e
+
+            await asyncio.gather(*(worker() for _ in range(limit)))
+
+        for i, r in enumerate(results):
+            if isinstance(r, Exception):
+                event_name, data, s = calls[i]
+                if s.retry is not None and self._schedule_retry(event_name, s, data, r, 1):
+                    results[i] = None
+
+        if on_error == "raise":
+            for r in results:
+                if isinstance(r, Exception):
+                    raise r
+
+        # Log and emit failure events for exceptions (continue mode)
+        for (event_name, data, s), r in zip(calls, results):
+            if isinstance(r, Exception):
+                if self._logger:
+                    self._logger.error("Error handling event %s: %s", event_name, r)
+                self._dead_letter(event_name, s, data, r)
+                # Emit handler.failed event (avoid recursion by not emitting for handler.failed itself)
+                if event_name != "event.handler.failed":
+                    await self._emit_handler_failed(event_name, s.component_name, r)
+
+    def _call(
+        self,
+        event_name: str,
+        s: Subscription,
+        data: Any,
+        timeout: Optional[float],
+    ) -> Awaitable[Any]:
+        """Return the awaitable for one delivery; plain handlers are called directly."""
+        if s.timeout is not None:
+            timeout = s.timeout
+        if timeout is None and not self._instrumented:
+            return s.handler(data) if s.executor is None else self._start(s, data)
+        return self._call_timed(event_name, s, data, timeout)
+
+    def _start(self, s: Subscription, data: Any) -> Awaitable[Any]:
+        """Start a delivery according to the subscription's executor."""
+        if s.executor is None:
+            return s.handler(data)  # type: ignore[return-value]
+        loop = asyncio.get_running_loop()
+        if s.executor == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self._thread_workers,
+                    thread_name_prefix="flexiflow-bus",
+                )
+            return loop.run_in_executor(self._thread_pool, s.handler, data)
+        # "inline" reached through a timed/slow-tracked path or request()
+        done = loop.create_future()
+        try:
+            result = s.handler(data)
+        except Exception as e:
+            done.set_exception(e)
+        else:
+            done.set_result(result)  # the answer, for request()
+        return done
+
+    async def _call_timed(
+        self,
+        event_name: str,
+        s: Subscription,
+        data: Any,
+        timeout: Optional[float],
+    ) -> Any:
+        threshold = self._slow_threshold
+        stats = self._stats
+        start = time.perf_counter()
+        try:
+            if timeout is None or s.executor == "inline":
+                result = await self._start(s, data)
+            else:
+                try:
+                    result = await asyncio.wait_for(self._start(s, data), timeout)
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(
+                        f"handler for {event_name!r} ({s.component_name}) timed out after {timeout}s"
+                    ) from None
+        except Exception:
+            if stats is not None:
+                stats.record_call(event_name, s.component_name, time.perf_counter() - start, True)
+            raise
+
+        duration = time.perf_counter() - start
+        if stats is not None:
+            stats.record_call(event_name, s.component_name, duration, False)
+        if threshold is not None and duration >= threshold and event_name != "event.handler.slow":
+            await self._emit_handler_slow(event_name, s.component_name, duration)
+        return result
+
+    # --- Scheduled retries ---
+
+    def _schedule_retry(
+        self,
+        event_name: str,
+        s: Subscription,
+        data: Any,
+        exc: Exception,
+        attempts: int,
+    ) -> bool:
+        """Re-schedule a failed delivery. Returns False if the failure is final."""
+        config = s.retry
+        if config is None or attempts >= config.max_attempts or not isinstance(exc, config.retry_on):
+            return False
+        if len(self._retries) >= self._max_pending_retries:
+            self._retry_counters["rejected"] += 1
+            return False
+
+        retry_id = next(self._retry_ids)
+        args = (event_name, s, data, exc, attempts)
+        timer = asyncio.get_running_loop().call_later(
+            retry_delay(config, attempts), self._fire_retry, retry_id
+        )
+        self._retries[retry_id] = (timer, args)
+        self._retry_counters["scheduled"] += 1
+        return True
+
+    def _fire_retry(self, retry_id: int) -> None:
+        _, args = self._retries[retry_id]
+        self._retries[retry_id] = (None, args)  # still outstanding while it runs
+        self._spawn(self._run_retry(retry_id))
+
+    async def _run_retry(self, retry_id: int) -> None:
+        event_name, s, data, exc, attempts = self._retries[retry_id][1]
+        try:
+            if s.subscription_id not in self._index:
+                # Unsubscribed while waiting: settle it like aclose() does
+                self._retry_counters["cancelled"] += 1
+                self._dead_letter(event_name, s, data, exc, attempts)
+                return
+            attempts += 1
+            try:
+                await self._call(event_name, s, data, None)
+            except Exception as e:
+                # Release this retry's slot first, so its own reschedule is not
+                # counted against max_pending_retries
+                del self._retries[retry_id]
+                if not self._schedule_retry(event_name, s, data, e, attempts):
+                    self._retry_counters["exhausted"] += 1
+                    self._handler_error(event_name, s, e)
+                    self._dead_letter(event_name, s, data, e, attempts)
+            else:
+                self._retry_counters["succeeded"] += 1
+        finally:
+            self._retries.pop(retry_id, None)
+
+    def _cancel_retries(self) -> None:
+        """Cancel retries still waiting for their timer, dead-lettering them."""
+        for retry_id, (timer, args) in list(self._retries.items()):
+            if timer is None:
+                continue  # already running
+            timer.cancel()
+            del self._retries[retry_id]
+            self._retry_counters["cancelled"] += 1
+            event_name, s, data, exc, attempts = args
+            self._dead_letter(event_name, s, data, exc, attempts)
+
+    def retry_stats(self) -> Dict[str, int]:
+        """Return retry counters: pending, max_pending, scheduled, succeeded, exhausted, rejected, cancelled."""
+        return {
+            "pending": len(self._retries),
+            "max_pending": self._max_pending_retries,
+            **self._retry_counters,
+        }
+
+    # --- Dead letters ---
+
+    def _dead_letter(
+        self,
+        event_name: str,
+        s: Subscription,
+        data: Any,
+        exc: Exception,
+        attempts: int = 1,
+    ) -> None:
+        store = self.dead_letters
+        if store is not None:
+            store.add(DeadLetter(event_name, data, s.component_name, s.subscription_id, exc, attempts))
+
+    async def redrive(self, limit: Optional[int] = None, *, batch_size: int = 100) -> Dict[str, int]:
+        """
+        Re-deliver dead letters to the subscriptions that failed them.
+
+        Letters are taken from the store oldest first, batch_size at a time,
+        and delivered one by one in that order. A letter goes back to its
+        original subscription, or, if that is gone (e.g. after a restart),
+        to the same component's current subscriptions for the event. A
+        delivery that fails again returns to the store with attempts + 1 and
+        is not retried within the same call; a letter with no matching
+        subscription is discarded.
+
+        Args:
+            limit: Maximum number of letters to take (default: all currently stored)
+            batch_size: Letters taken from the store per round trip
+
+        Returns:
+            Counts: {"redriven", "failed", "skipped"}
+        """
+        store = self.dead_letters
+        if store is None:
+            raise RuntimeError("redrive() requires AsyncEventManager(dead_letters=...)")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        counts = {"redriven": 0, "failed": 0, "skipped": 0}
+        remaining = len(store) if limit is None else min(limit, len(store))
+        while remaining > 0:
+            batch = store.take(min(batch_size, remaining))
+            if not batch:
+                break
+            remaining -= len(batch)
+            for letter in batch:
+                targets = self._redrive_targets(letter)
+                if not targets:
+                    counts["skipped"] += 1
+                    continue
+                failed = False
+                for s in targets:
+                    try:
+                        await self._call(letter.event_name, s, letter.data, None)
+                    except Exception as e:
+                        failed = True
+                        if self._logger:
+                            self._logger.error("Error redriving event %s: %s", letter.event_name, e)
+                        self._dead_letter(letter.event_name, s, letter.data, e, letter.attempts + 1)
+                counts["failed" if failed else "redriven"] += 1
+        return counts
+
+    def _redrive_targets(self, letter: DeadLetter) -> List[Subscription]:
+        entry = self._index.get(letter.subscription_id)
+        if entry is not None:
+            event_name, _, slot = entry
+            return [self._events[event_name][slot][letter.subscription_id]]
+        plan = self._plan_for(letter.event_name)
+        if plan is None:
+            return []
+        subs = plan.ordered if plan.simple else plan.select(letter.event_name, letter.data)
+        return [s for s in subs if s.component_name == letter.component_name]
+
+    # --- Statistics ---
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        """Turn statistics collection on or off. Disabling discards collected data."""
+        if enabled and self._stats is None:
+            self._stats = BusStats()
+        elif not enabled:
+            self._stats = None
+        self._instrumented = self._slow_threshold is not None or self._stats is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of per-event and per-(event, component) statistics.
+
+        Each event reports published/calls/errors and, per subscribing
+        component, call and error counts, total/max/mean latency and a
+        fixed-bucket latency histogram aligned with ``buckets``. Returns an
+        empty snapshot when statistics are disabled.
+        """
+        if self._stats is None:
+            return {"buckets": list(LATENCY_BUCKETS), "events": {}}
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Clear collected statistics, keeping collection enabled."""
+        if self._stats is not None:
+            self._stats.reset()
+
+    # --- Request/reply ---
+
+    async def request(
+        self,
+        event_name: str,
+        data: Any = None,
+        *,
+        timeout: Optional[float] = None,
+        mode: str = "first",            # "first" | "gather"
+        on_error: str = "continue",     # "continue" | "raise"
+    ) -> Any:
+        """
+        Call the subscribers of an event and return their results.
+
+        Handlers run concurrently and answer by returning a value. In "first"
+        mode the first non-None result is returned as soon as it arrives;
+        handlers can also answer later with reply(current_correlation_id(), value).
+        If every handler fails, the first exception is raised. When every
+        handler has finished without an answer, a deferred reply is awaited
+        until timeout; without a timeout, None is returned (or the first
+        failure raised) at once instead of waiting forever. In "gather" mode
+        the results of all successful handlers are returned as a list in
+        priority order.
+
+        Raises:
+            LookupError: No subscription would receive the event
+            asyncio.TimeoutError: No answer arrived within timeout seconds
+        """
+        if mode not in _REQUEST_MODES:
+            raise ValueError("mode must be 'first' or 'gather'")
+        if on_error not in _ERROR_POLICIES:
+            raise ValueError("on_error must be 'continue' or 'raise'")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be > 0")
+
+        plan = self._plans.get(event_name) or self._plan_for(event_name)
+        subs = () if plan is None else (plan.ordered if plan.simple else plan.select(event_name, data))
+        if not subs:
+            raise LookupError(f"no subscribers for request {event_name!r}")
+
+        loop = asyncio.get_running_loop()
+        correlation_id = next(self._correlation_ids)
+        reply = self._pending[correlation_id] = loop.create_future()
+        token = _current_correlation_id.set(correlation_id)
+        try:
+            # Tasks copy the current context, so handlers see the correlation id
+            tasks = [asyncio.ensure_future(self._call(event_name, s, data, None)) for s in subs]
+        finally:
+            _current_correlation_id.reset(token)
+
+        try:
+            if mode == "gather":
+                return await self._gather_replies(event_name, subs, tasks, timeout, on_error)
+
+            outstanding = [len(tasks)]
+            failures: List[BaseException] = []
+
+            def settle(task: asyncio.Future, s: Subscription) -> None:
+                outstanding[0] -= 1
+                if task.cancelled():
+                    return
+                exc = task.exception()
+                if exc is None:
+                    result = task.result()
+                    if result is not None and not reply.done():
+                        reply.set_result(result)
+                    return
+
+                failures.append(exc)
+                if on_error == "continue":
+                    self._handler_error(event_name, s, exc)  # type: ignore[arg-type]
+                all_failed = outstanding[0] == 0 and len(failures) == len(tasks)
+                if not reply.done() and (on_error == "raise" or all_failed):
+                    reply.set_exception(failures[0])
+
+            def finished(task: asyncio.Future, s: Subscription) -> None:
+                settle(task, s)
+                # Everyone is done without answering; only reply() can still
+                # answer, which nothing bounds without a timeout
+                if outstanding[0] == 0 and timeout is None and not reply.done():
+                    if failures:
+                        reply.set_exception(failures[0])
+                    else:
+                        reply.set_result(None)
+
+            for task, s in zip(tasks, subs):
+                task.add_done_callback(lambda t, s=s: finished(t, s))
+            try:
+                return await asyncio.wait_for(reply, timeout)
+            except asyncio.TimeoutError:
+                for task in tasks:
+                    task.cancel()
+                if outstanding[0] == 0 and failures:
+                    raise failures[0] from None
+                raise asyncio.TimeoutError(
+                    f"request {event_name!r} got no reply within {timeout}s"
+                ) from None
+        finally:
+            self._pending.pop(correlation_id, None)
+
+    async def _gather_replies(
+        self,
+        event_name: str,
+        subs: Sequence[Subscription],
+        tasks: List[asyncio.Future],
+        timeout: Optional[float],
+        on_error: str,
+    ) -> List[Any]:
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(
+                f"request {event_name!r} did not complete within {timeout}s"
+            ) from None
+
+        answers = []
+        for s, r in zip(subs, results):
+            if isinstance(r, Exception):
+                if on_error == "raise":
+                    raise r
+                self._handler_error(event_name, s, r)
+            else:
+                answers.append(r)
+        return answers
+
+    def reply(self, correlation_id: int, result: Any) -> bool:
+        """
+        Answer a pending request() out of band.
+
+        Returns True if the request was still waiting, False if it already had
+        an answer, timed out, or never existed.
+        """
+        future = self._pending.get(correlation_id)
+        if future is None or future.done():
+            return False
+        future.set_result(result)
+        return True
+
+    def _handler_error(self, event_name: str, s: Subscription, exc: Exception) -> None:
+        """Log a failed delivery and report it from a background task (for sync callers)."""
+        if self._logger:
+            self._logger.error("Error handling event %s: %s", event_name, exc)
+        if event_name == "event.handler.failed":
+            return
+        if self._failure_interval is not None:
+            self._record_failure(event_name, s.component_name, exc)
+        elif self.has_subscribers("event.handler.failed"):
+            self._spawn(self._emit_handler_failed(event_name, s.component_name, exc))
+
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Start a bus-owned background task, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    # --- Queued publish ---
+
+    async def enqueue(
+        self,
+        event_name: str,
+        data: Any = None,
+        *,
+        delivery: str = "sequential",
+        partition_key: Optional[PartitionKeyFn] = None,
+    ) -> bool:
+        """
+        Queue an event for background delivery and return without awaiting handlers.
+
+        When the queue is full the bus's overflow policy applies: "block" waits
+        for space, "drop_oldest" discards the oldest queued event, and "reject"
+        refuses the new one. partition_key is as for publish().
+
+        Returns True if the event was queued, False if it was rejected.
+        """
+        item = self._queue_item(event_name, data, delivery, partition_key)
+        queue = self._ensure_dispatchers()
+        if queue.full() and self._overflow == "block":
+            await queue.put(item)
+            self._record_enqueued(queue)
+            return True
+        return self._offer(queue, item)
+
+    def publish_nowait(
+        self,
+        event_name: str,
+        data: Any = None,
+        *,
+        delivery: str = "sequential",
+        partition_key: Optional[PartitionKeyFn] = None,
+    ) -> bool:
+        """
+        Queue an event for background delivery without ever waiting.
+
+        Must be called from a running event loop. With the "block" overflow
+        policy a full queue rejects the event, since this call cannot wait.
+        partition_key is as for publish().
+
+        Returns True if the event was queued, False if it was rejected.
+        """
+        item = self._queue_item(event_name, data, delivery, partition_key)
+        return self._offer(self._ensure_dispatchers(), item)
+
+    def queue_stats(self) -> Dict[str, int]:
+        """
+        Return queue metrics for load shedding.
+
+        Keys: depth, maxsize, high_water, enqueued, dispatched, dropped,
+        rejected, workers.
+        """
+        stats = dict(self._queue_counters)
+        stats["depth"] = self._queue.qsize() if self._queue is not None else 0
+        stats["maxsize"] = self._queue_maxsize
+        stats["workers"] = sum(1 for t in self._workers if not t.done())
+        return stats
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Deliver queued events and pending failure reports, then stop the dispatcher tasks and the handler thread pool."""
+        await self.join()
+        if self._failure_timer is not None:
+            self._failure_timer.cancel()
+            self._failure_timer = None
+        self._cancel_retries()
+        await self._publish_failures(self._take_failures())
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+
+        pool, self._thread_pool = self._thread_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _ensure_dispatchers(self) -> asyncio.Queue:
+        queue = self._queue
+        if queue is None:
+            queue = self._queue = asyncio.Queue(maxsize=self._queue_maxsize)
+        if len(self._workers) < self._dispatch_workers:
+            loop = asyncio.get_running_loop()
+            while len(self._workers) < self._dispatch_workers:
+                self._workers.append(loop.create_task(self._dispatch_loop(queue)))
+        return queue
+
+    def _queue_item(
+        self,
+        event_name: str,
+        data: Any,
+        delivery: str,
+        partition_key: Optional[PartitionKeyFn],
+    ) -> tuple:
+        if delivery not in _DELIVERY_MODES:
+            raise ValueError("delivery must be 'sequential', 'concurrent', 'tiered' or 'partitioned'")
+        # Fail here rather than in the dispatcher, where the event would be dropped
+        key_fn = self._key_fn(partition_key) if delivery == "partitioned" else None
+        return (event_name, data, delivery, key_fn)
+
+    def _offer(self, queue: asyncio.Queue, item: tuple) -> bool:
+        if queue.full():
+            if self._overflow != "drop_oldest":
+                self._queue_counters["rejected"] += 1
+                return False
+            queue.get_nowait()
+            queue.task_done()
+            self._queue_counters["dropped"] += 1
+        queue.put_nowait(item)
+        self._record_enqueued(queue)
+        return True
+
+    def _record_enqueued(self, queue: asyncio.Queue) -> None:
+        counters = self._queue_counters
+        counters["enqueued"] += 1
+        depth = queue.qsize()
+        if depth > counters["high_water"]:
+            counters["high_water"] = depth
+
+    async def _dispatch_loop(self, queue: asyncio.Queue) -> None:
+        while True:
+            event_name, data, delivery, key_fn = await queue.get()
+            try:
+                await self.publish(event_name, data, delivery=delivery, partition_key=key_fn)
+            except Exception as e:
+                if self._logger:
+                    self._logger.error("Error dispatching queued event %s: %s", event_name, e)
+            finally:
+                self._queue_counters["dispatched"] += 1
+                queue.task_done()
+
+    async def _emit_handler_slow(
+        self,
+        event_name: str,
+        component_name: str,
+        duration: float,
+    ) -> None:
+        """Emit event.handler.slow observability event. Never raises."""
+        try:
+            await self.publish(
+                "event.handler.slow",
+                {
+                    "event_name": event_name,
+                    "component_name": component_name,
+                    "duration": duration,
+                    "threshold": self._slow_threshold,
+                },
+            )
+        except Exception:
+            pass
+
     async def _emit_handler_failed(
         self,
         event_name: str,
@@ -177,6 +1561,11 @@ class AsyncEventManager:
         exception: Exception,
     ) -> None:
         """Emit event.handler.failed observability event. Fire-and-forget, never raises."""
+        if self._failure_interval is not None:
+            self._record_failure(event_name, component_name, exception)
+            return
+        if not self.has_subscribers("event.handler.failed"):
+            return  # nobody listens: skip formatting the exception
         try:
             await self.publish(
                 "event.handler.failed",
@@ -189,3 +1578,62 @@ class AsyncEventManager:
         except Exception:
             # Swallow any errors from observability handlers to avoid cascading failures
             pass
+
+    def _record_failure(self, event_name: str, component_name: str, exception: Exception) -> None:
+        """Count a failure for the current interval, keeping a uniform sample of exceptions."""
+        key = (event_name, component_name)
+        entry = self._failures.get(key)
+        if entry is None:
+            entry = self._failures[key] = [0, []]
+        entry[0] += 1
+        exemplars = entry[1]
+        if len(exemplars) < self._failure_exemplars:
+            exemplars.append(exception)
+        else:
+            # Reservoir sampling: every failure in the interval is equally likely to be kept
+            j = random.randrange(entry[0])
+            if j < self._failure_exemplars:
+                exemplars[j] = exception
+
+        if self._failure_timer is None:
+            loop = asyncio.get_running_loop()
+            self._failure_timer = loop.call_later(self._failure_interval, self._flush_failures)  # type: ignore[arg-type]
+
+    def _take_failures(self) -> List[Tuple[str, Any]]:
+        """Drain the current interval into event.handler.failed payloads."""
+        failures, self._failures = self._failures, {}
+        if not failures or not self.has_subscribers("event.handler.failed"):
+            return []
+        interval = self._failure_interval
+        events: List[Tuple[str, Any]] = []
+        for (event_name, component_name), (count, exemplars) in failures.items():
+            formatted = [repr(e) for e in exemplars]
+            events.append(
+                (
+                    "event.handler.failed",
+                    {
+                        "event_name": event_name,
+                        "component_name": component_name,
+                        "exception": formatted[0],
+                        "count": count,
+                        "exemplars": formatted,
+                        "interval": interval,
+                    },
+                )
+            )
+        return events
+
+    def _flush_failures(self) -> None:
+        self._failure_timer = None
+        events = self._take_failures()
+        if events:
+            self._spawn(self._publish_failures(events))
+
+    async def _publish_failures(self, events: List[Tuple[str, Any]]) -> None:
+        """Publish aggregated failure reports. Never raises."""
+        if not events:
+            return
+        try:
+            await self.publish_many(events)
+        except Exception:
+            pass
@@ -5,6 +5,7 @@ from .persist_json import (
     save_component,
     load_snapshot,
     restore_component,
+    build_component,
     ComponentSnapshot,
 )
 from .persist_sqlite import (
@@ -22,6 +23,7 @@ __all__ = [
     "save_component",
     "load_snapshot",
     "restore_component",
+    "build_component",
     "ComponentSnapshot",
     # SQLite persistence
     "save_snapshot_sqlite",
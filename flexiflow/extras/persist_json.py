@@ -134,17 +134,15 @@ def load_snapshot(path: str | Path) -> ComponentSnapshot:
     )
 
 
-def restore_component(
+def build_component(
     snapshot: ComponentSnapshot,
-    engine: Any,
     registry: Optional[Any] = None,
 ) -> Any:
     """
-    Restore a component from a snapshot and register it with an engine.
+    Build a component from a snapshot without registering it.
 
     Args:
         snapshot: ComponentSnapshot to restore from
-        engine: FlexiFlowEngine to register with
         registry: Optional StateRegistry (uses DEFAULT_REGISTRY if not provided)
 
     Returns:
@@ -162,11 +160,32 @@ def restore_component(
     if snapshot.current_state not in reg.names():
         raise state_not_found(snapshot.current_state, reg.names())
 
-    component = AsyncComponent(
+    return AsyncComponent(
         name=snapshot.name,
         rules=list(snapshot.rules),
         state_machine=StateMachine.from_name(snapshot.current_state, registry=reg),
     )
 
+
+def restore_component(
+    snapshot: ComponentSnapshot,
+    engine: Any,
+    registry: Optional[Any] = None,
+) -> Any:
+    """
+    Restore a component from a snapshot and register it with an engine.
+
+    Args:
+        snapshot: ComponentSnapshot to restore from
+        engine: FlexiFlowEngine to register with
+        registry: Optional StateRegistry (uses DEFAULT_REGISTRY if not provided)
+
+    Returns:
+        The restored AsyncComponent
+
+    Raises:
+        StateError: If the state class is not found in the registry
+    """
+    component = build_component(snapshot, registry)
     engine.register(component)
     return component
@@ -31,14 +31,8 @@ class RetryConfig:
     retry_on: tuple[Type[BaseException], ...] = (Exception,)
 
 
-def retry_async(config: RetryConfig) -> Callable[[AsyncFn], AsyncFn]:
-    """Decorator that retries an async function with exponential backoff.
-
-    Example:
-        @retry_async(RetryConfig(max_attempts=3, base_delay=0.2))
-        async def flaky_handler(data):
-            ...
-    """
+def validate_config(config: RetryConfig) -> None:
+    """Raise ValueError if a RetryConfig is out of range."""
     if config.max_attempts < 1:
         raise ValueError("max_attempts must be >= 1")
     if config.base_delay < 0 or config.max_delay < 0:
@@ -48,10 +42,44 @@ def retry_async(config: RetryConfig) -> Callable[[AsyncFn], AsyncFn]:
     if not (0.0 <= config.jitter <= 1.0):
         raise ValueError("jitter must be between 0.0 and 1.0")
 
+
+def retry_delay(config: RetryConfig, attempt: int) -> float:
+    """Seconds to wait after the given failed attempt (1-based) before the next one.
+
+    The delay starts at base_delay, is multiplied by backoff after each retry
+    and is capped at max_delay; jitter adds up to ``jitter * delay`` on top,
+    still within max_delay.
+    """
+    delay = config.base_delay
+    for _ in range(attempt - 1):
+        delay = min(config.max_delay, delay * config.backoff)
+        if delay >= config.max_delay:
+            break
+    if delay <= 0:
+        return 0.0
+    # Apply jitter as a fraction of delay
+    jitter_amt = delay * config.jitter * random.random() if config.jitter else 0.0
+    return min(config.max_delay, delay + jitter_amt)
+
+
+def retry_async(config: RetryConfig) -> Callable[[AsyncFn], AsyncFn]:
+    """Decorator that retries an async function with exponential backoff.
+
+    The decorated function sleeps between attempts, so everything awaiting it
+    waits too. For event bus handlers, prefer
+    ``bus.subscribe(..., retry=RetryConfig(...))``, which schedules retries
+    without holding up publish().
+
+    Example:
+        @retry_async(RetryConfig(max_attempts=3, base_delay=0.2))
+        async def flaky_handler(data):
+            ...
+    """
+    validate_config(config)
+
     def decorator(fn: AsyncFn) -> AsyncFn:
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             attempt = 0
-            delay = config.base_delay
 
             while True:
                 attempt += 1
@@ -61,16 +89,9 @@ def retry_async(config: RetryConfig) -> Callable[[AsyncFn], AsyncFn]:
                     if attempt >= config.max_attempts:
                         raise
 
+                    delay = retry_delay(config, attempt)
                     if delay > 0:
-                        # Apply jitter as a fraction of delay
-                        if config.jitter:
-                            jitter_amt = delay * config.jitter * random.random()
-                        else:
-                            jitter_amt = 0.0
-
-                        await asyncio.sleep(min(config.max_delay, delay + jitter_amt))
-
-                    delay = min(config.max_delay, delay * config.backoff)
+                        await asyncio.sleep(delay)
 
         return wrapper  # type: ignore[return-value]
 
@@ -0,0 +1,81 @@
+"""Snapshot stores used by FlexiFlowEngine to evict and rehydrate components.
+
+A store saves a component's snapshot when the engine evicts it and loads the
+snapshot again the next time the component is needed. Both stores are thin
+wrappers over the existing persistence adapters.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import quote
+
+from .persist_json import ComponentSnapshot, load_snapshot, save_component
+from .persist_sqlite import load_latest_snapshot, prune_snapshots, save_snapshot
+
+
+class SqliteSnapshotStore:
+    """Keeps evicted components in the flexiflow_snapshots table.
+
+    Args:
+        conn: SQLite connection (owned by the caller)
+        registry: StateRegistry used to rehydrate (DEFAULT_REGISTRY if None)
+        keep_last: Snapshots kept per component after each save; None keeps all
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        registry: Optional[Any] = None,
+        keep_last: Optional[int] = 1,
+    ) -> None:
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be >= 1")
+        self.conn = conn
+        self.registry = registry
+        self.keep_last = keep_last
+
+    def save(self, component: Any) -> None:
+        save_snapshot(
+            self.conn,
+            ComponentSnapshot(
+                name=component.name,
+                current_state=component.state_machine.current_state.__class__.__name__,
+                rules=list(component.rules),
+                metadata={},
+            ),
+        )
+        if self.keep_last is not None:
+            prune_snapshots(self.conn, component.name, keep_last=self.keep_last)
+
+    def load(self, name: str) -> Optional[ComponentSnapshot]:
+        return load_latest_snapshot(self.conn, name)
+
+
+class JsonSnapshotStore:
+    """Keeps evicted components as one JSON file per component in a directory.
+
+    Args:
+        directory: Directory for the files (created on first save)
+        registry: StateRegistry used to rehydrate (DEFAULT_REGISTRY if None)
+    """
+
+    def __init__(self, directory: str | Path, *, registry: Optional[Any] = None) -> None:
+        self.directory = Path(directory)
+        self.registry = registry
+
+    def _path(self, name: str) -> Path:
+        # Component names may contain path separators
+        return self.directory / f"{quote(name, safe='')}.json"
+
+    def save(self, component: Any) -> None:
+        save_component(component, self._path(component.name))
+
+    def load(self, name: str) -> Optional[ComponentSnapshot]:
+        path = self._path(name)
+        if not path.exists():
+            return None
+        return load_snapshot(path)
@@ -0,0 +1,88 @@
+"""Per-component mailboxes that serialize message handling."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+
+class Mailbox:
+    """Bounded FIFO of messages for one component, processed one at a time.
+
+    put() appends a message and starts a worker task if none is running; the
+    worker hands messages to ``handler`` in order and exits as soon as the
+    mailbox is empty, so idle components cost no task. When the mailbox is
+    full, put() waits for space.
+
+    Attributes:
+        processed: Messages handled (successfully or not)
+        failed: Messages whose handler raised
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[Any]],
+        *,
+        maxsize: int = 1000,
+        logger: Any = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._handler = handler
+        self._logger = logger
+        self._queue: "asyncio.Queue[Tuple[Any, Optional[asyncio.Future]]]" = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def active(self) -> bool:
+        """True while a worker task is running."""
+        return self._task is not None
+
+    async def put(self, message: Any, *, wait: bool = True) -> Any:
+        """
+        Queue a message.
+
+        With wait=True, return the handler's result once the message has been
+        handled and re-raise its exception; otherwise return None as soon as
+        it is queued (failures are logged).
+        """
+        done = asyncio.get_running_loop().create_future() if wait else None
+        await self._queue.put((message, done))
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if done is not None:
+            return await done
+        return None
+
+    async def join(self) -> None:
+        """Wait until every queued message has been handled."""
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        queue = self._queue
+        try:
+            # No await between the empty() check and clearing _task, so a
+            # concurrent put() either lands before the check or starts a new worker
+            while not queue.empty():
+                message, done = queue.get_nowait()
+                try:
+                    result = await self._handler(message)
+                except Exception as e:
+                    self.failed += 1
+                    if done is not None and not done.done():
+                        done.set_exception(e)
+                    elif self._logger:
+                        self._logger.error("Error handling queued message: %s", e)
+                else:
+                    if done is not None and not done.done():
+                        done.set_result(result)
+                finally:
+                    self.processed += 1
+                    queue.task_done()
+        finally:
+            self._task = None
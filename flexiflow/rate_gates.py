@@ -0,0 +1,131 @@
+"""Debounce, throttle and coalesce gates for rate-limited subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_GATE_MODES = ("debounce", "throttle", "coalesce")
+
+
+class RateGate:
+    """Buffers an event's payloads and calls a handler at a bounded rate.
+
+    Created by AsyncEventManager.subscribe() when debounce, throttle or
+    coalesce_key is given. The bus registers push() as an inline handler, so
+    publish() only records the payload; loop timers decide when the real
+    handler runs:
+
+    - "debounce": once ``interval`` seconds after the last payload
+    - "throttle": at most once per ``interval`` seconds; the first payload
+      after a quiet period is delivered on the next loop iteration
+    - "coalesce": on the next loop iteration (``interval`` is 0)
+
+    Each run receives the latest payload, or with a key function the latest
+    payload per key (one call per key, in first-seen order). Runs never
+    overlap: payloads arriving while the handler runs are held for the next
+    run.
+
+    Attributes:
+        received: Payloads pushed by the bus
+        delivered: Handler calls made
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Any], Any],
+        *,
+        mode: str,
+        interval: float = 0.0,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        spawn: Callable[[Any], Any] = asyncio.ensure_future,
+    ) -> None:
+        if mode not in _GATE_MODES:
+            raise ValueError("mode must be 'debounce', 'throttle' or 'coalesce'")
+        if interval < 0:
+            raise ValueError("interval must be >= 0")
+
+        self.mode = mode
+        self.interval = interval
+        self._deliver = deliver  # async callable(data); must not raise
+        self._key = key
+        self._spawn = spawn
+        self._latest: Any = None
+        self._has_latest = False
+        self._keyed: Dict[Hashable, Any] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = False
+        self._last_run = float("-inf")
+        self.closed = False
+        self.received = 0
+        self.delivered = 0
+
+    def __len__(self) -> int:
+        """Number of handler calls the next run would make."""
+        return len(self._keyed) if self._key is not None else int(self._has_latest)
+
+    def push(self, data: Any) -> None:
+        """Inline subscription handler: record a payload and arm the timer."""
+        if self.closed:
+            return
+        self.received += 1
+        if self._key is not None:
+            self._keyed[self._key(data)] = data
+        else:
+            self._latest = data
+            self._has_latest = True
+
+        if self.mode == "debounce":
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_later(self.interval, self._fire)
+        elif self._timer is None and not self._running:
+            self._arm(asyncio.get_running_loop())
+
+    def close(self) -> None:
+        """Cancel the pending timer and discard buffered payloads. Idempotent."""
+        self.closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._take()
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        delay = self._last_run + self.interval - loop.time()
+        self._timer = loop.call_later(max(delay, 0.0), self._fire)
+
+    def _take(self) -> List[Any]:
+        if self._key is not None:
+            batch = list(self._keyed.values())
+            self._keyed.clear()
+        elif self._has_latest:
+            batch = [self._latest]
+            self._latest = None
+            self._has_latest = False
+        else:
+            batch = []
+        return batch
+
+    def _fire(self) -> None:
+        self._timer = None
+        if self._running or self.closed:
+            return  # a running flush re-arms when it finishes
+        self._running = True
+        self._spawn(self._flush())
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            self._last_run = loop.time()
+            for data in self._take():
+                if self.closed:
+                    break
+                self.delivered += 1
+                await self._deliver(data)
+        finally:
+            self._running = False
+        if len(self) and self._timer is None and not self.closed:
+            if self.mode == "debounce":
+                self._timer = loop.call_later(0, self._fire)
+            else:
+                self._arm(loop)
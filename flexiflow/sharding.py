@@ -0,0 +1,531 @@
+"""Multi-process engine front-end that shards components by name.
+
+ShardedEngine starts N worker processes, each running its own
+FlexiFlowEngine on its own event loop, and routes every component to one
+shard by a stable hash of its name. Operations travel over
+multiprocessing pipes in batches: everything queued for a shard during one
+event loop iteration (up to ``batch_size`` operations) is sent as a single
+pickled list, and replies come back batched the same way.
+
+Selected observability events raised inside the shards are forwarded, in
+the same reply batches, and re-published on the parent's ``event_bus``.
+Shards only listen for the ones the parent bus has subscribers for, so
+events nobody watches keep their no-listener fast path inside the shards.
+
+Components, messages, event payloads and handler exceptions cross process
+boundaries, so they must be picklable (custom states must be importable
+module-level classes). Exceptions that cannot be pickled are re-raised as
+RuntimeError with the original repr.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import pickle
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .event_manager import AsyncEventManager
+from .logger import get_logger
+
+# Events forwarded from the shards to the parent bus by default (while subscribed there)
+DEFAULT_FORWARD_EVENTS: Tuple[str, ...] = (
+    "engine.component.registered",
+    "engine.components.registered",
+    "state.changed",
+    "event.handler.failed",
+)
+
+
+def shard_for(name: str, shards: int) -> int:
+    """Return the shard index of a component name; stable across processes and runs."""
+    return zlib.crc32(name.encode("utf-8")) % shards
+
+
+# --- Shard process ---
+
+
+def _shard_main(conn: Any, engine_options: Dict[str, Any]) -> None:
+    """Entry point of a shard process."""
+    asyncio.run(_serve(conn, engine_options))
+
+
+async def _serve(conn: Any, engine_options: Dict[str, Any]) -> None:
+    from .engine import FlexiFlowEngine
+
+    loop = asyncio.get_running_loop()
+    engine = FlexiFlowEngine(**engine_options)
+    inbox: "asyncio.Queue[Optional[list]]" = asyncio.Queue()
+    outbox: List[tuple] = []
+    flush_scheduled = False
+    tasks = set()
+
+    def flush() -> None:
+        nonlocal flush_scheduled
+        flush_scheduled = False
+        if outbox:
+            batch = outbox[:]
+            outbox.clear()
+            try:
+                conn.send(batch)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                conn.send([_portable_item(item) for item in batch])
+
+    def post(item: tuple) -> None:
+        nonlocal flush_scheduled
+        outbox.append(item)
+        if not flush_scheduled:
+            flush_scheduled = True
+            loop.call_soon(flush)
+
+    forwarders: Dict[str, Any] = {}
+
+    async def forward(event_names: Sequence[str]) -> None:
+        for event_name in set(forwarders) - set(event_names):
+            engine.event_bus.unsubscribe(forwarders.pop(event_name))
+        for event_name in set(event_names) - set(forwarders):
+            forwarders[event_name] = await engine.event_bus.subscribe(
+                event_name,
+                "sharding.forward",
+                lambda data, event_name=event_name: post(("event", event_name, data)),
+                priority=5,
+                executor="inline",
+            )
+
+    def read() -> None:
+        while True:
+            try:
+                batch = conn.recv()
+            except (EOFError, OSError):
+                batch = None
+            loop.call_soon_threadsafe(inbox.put_nowait, batch)
+            if batch is None:
+                return
+
+    threading.Thread(target=read, name="flexiflow-shard-reader", daemon=True).start()
+
+    async def run(request_id: int, name: str, message: Any) -> None:
+        try:
+            await engine.send(name, message)
+        except Exception as e:
+            post(("error", request_id, _portable(e)))
+        else:
+            post(("ok", request_id, None))
+
+    def finished(task: asyncio.Task) -> None:
+        tasks.discard(task)
+
+    while True:
+        batch = await inbox.get()
+        if batch is None:
+            break  # parent went away
+        closing = None
+        for op in batch:
+            kind = op[0]
+            if kind == "message":
+                task = loop.create_task(run(op[1], op[2], op[3]))
+                tasks.add(task)
+                task.add_done_callback(finished)
+            elif kind == "register" or kind == "register_many":
+                try:
+                    if kind == "register":
+                        engine.register(op[2])
+                    else:
+                        engine.register_many(op[2], chunk_size=op[3])
+                except Exception as e:
+                    post(("error", op[1], _portable(e)))
+                else:
+                    post(("ok", op[1], None))
+            elif kind == "forward":
+                await forward(op[2])
+            elif kind == "close":
+                closing = op[1]
+        if closing is not None:
+            if tasks:
+                await asyncio.gather(*tasks)
+            await engine.aclose()
+            post(("ok", closing, None))
+            flush()
+            break
+    conn.close()
+
+
+def _portable(exc: BaseException) -> BaseException:
+    """Return the exception if it survives pickling, else a RuntimeError carrying its repr."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return RuntimeError(repr(exc))
+    return exc
+
+
+def _portable_item(item: tuple) -> tuple:
+    """Make one reply or forwarded event picklable, replacing what isn't with its repr."""
+    if item[0] != "event":
+        return item
+    data = item[2]
+    if isinstance(data, dict):
+        data = {key: value if _picklable(value) else repr(value) for key, value in data.items()}
+    elif not _picklable(data):
+        data = repr(data)
+    return (item[0], item[1], data)
+
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+# --- Parent side ---
+
+
+class _Shard:
+    """Parent-side connection to one shard process."""
+
+    def __init__(self, index: int, process: Any, conn: Any) -> None:
+        self.index = index
+        self.process = process
+        self.conn = conn
+        # One writer thread keeps sends ordered without blocking the event loop
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"flexiflow-shard-{index}")
+        self.reader: Optional[threading.Thread] = None
+
+
+class ShardedEngine:
+    """FlexiFlowEngine front-end spreading components over worker processes.
+
+    Keeps the engine's ``register()`` / ``register_async()`` /
+    ``register_many()`` / ``handle_message()`` surface. Each component
+    lives in exactly one shard, chosen by ``shard_for(name, shards)``, so
+    its messages are handled in order by that shard's engine (through its
+    mailbox) while different shards use different cores.
+
+    Args:
+        shards: Number of worker processes
+        engine_options: Keyword arguments for each shard's FlexiFlowEngine
+            (must be picklable)
+        forward_events: Event names re-published on ``event_bus`` when they
+            happen inside a shard (exact names, no wildcards); each is only
+            forwarded while ``event_bus`` has subscribers for it
+        batch_size: Most operations sent to a shard in one pipe message
+        start_method: multiprocessing start method ("spawn" by default)
+        logger: Logger for the parent (defaults to the "flexiflow" logger)
+
+    Use as ``async with ShardedEngine(shards=4) as engine:`` or call
+    ``await start()`` and ``await aclose()``.
+    """
+
+    def __init__(
+        self,
+        shards: int = 2,
+        *,
+        engine_options: Optional[Dict[str, Any]] = None,
+        forward_events: Sequence[str] = DEFAULT_FORWARD_EVENTS,
+        batch_size: int = 256,
+        start_method: str = "spawn",
+        logger: Any = None,
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.shards = shards
+        self.batch_size = batch_size
+        self.logger = logger or get_logger("flexiflow")
+        self.event_bus = AsyncEventManager(logger=self.logger)
+        self._engine_options = dict(engine_options or {})
+        self._forward_events = tuple(forward_events)
+        self._forwarding: Tuple[str, ...] = ()  # forward_events the shards currently listen for
+        self._context = multiprocessing.get_context(start_method)
+        self._shards: List[_Shard] = []
+        self._starting: Optional[asyncio.Task] = None
+        # Operations waiting to be sent, per shard (kept while the processes start)
+        self._outboxes: List[List[tuple]] = [[] for _ in range(shards)]
+        # request id -> (shard index, future)
+        self._pending: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._request_ids = itertools.count(1)
+        self._flush_scheduled = False
+        self._background: set = set()
+        self._closed = False
+
+    def shard_for(self, name: str) -> int:
+        """Return the index of the shard that owns a component name."""
+        return shard_for(name, self.shards)
+
+    async def start(self) -> None:
+        """Start the shard processes. Called automatically on first use."""
+        if self._closed:
+            raise RuntimeError("ShardedEngine is closed")
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        await asyncio.shield(self._starting)
+
+    async def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        shards = []
+        for index in range(self.shards):
+            parent_conn, child_conn = self._context.Pipe(duplex=True)
+            process = self._context.Process(
+                target=_shard_main,
+                args=(child_conn, self._engine_options),
+                name=f"flexiflow-shard-{index}",
+                daemon=True,
+            )
+            # Spawning re-imports flexiflow in the child; keep that off the loop
+            await loop.run_in_executor(None, process.start)
+            child_conn.close()
+            shard = _Shard(index, process, parent_conn)
+            shard.reader = threading.Thread(
+                target=self._read,
+                args=(shard, loop),
+                name=f"flexiflow-shard-{index}-reader",
+                daemon=True,
+            )
+            shard.reader.start()
+            shards.append(shard)
+        self._shards = shards
+        self.logger.info("Started %d engine shards", self.shards)
+        self._flush()
+
+    def register(self, component: Any) -> None:
+        """
+        Register a component with its shard without waiting.
+
+        Like FlexiFlowEngine.register(), the component reaches its shard
+        ahead of any message sent after this call. Must be called from a
+        running event loop (it starts the shards if needed); use
+        register_async() to wait for the shard and see its errors.
+        """
+        index = self.shard_for(component.name)
+        future = self._submit(index, lambda request_id: ("register", request_id, component))
+        future.add_done_callback(self._log_failure)
+        if self._starting is None and not self._closed:
+            self._spawn(self.start())
+
+    async def register_async(self, component: Any) -> None:
+        """Register a component and wait until its shard has it."""
+        await self.start()
+        index = self.shard_for(component.name)
+        await self._submit(index, lambda request_id: ("register", request_id, component))
+
+    def register_many(self, components: Iterable[Any], *, chunk_size: int = 10_000) -> int:
+        """
+        Register a batch of components without waiting, one
+        FlexiFlowEngine.register_many() call per shard.
+
+        Like register(), must be called from a running event loop; use
+        register_many_async() to wait for the shards and see their errors.
+
+        Returns:
+            Number of components submitted
+        """
+        futures, count = self._submit_many(components, chunk_size)
+        for future in futures:
+            future.add_done_callback(self._log_failure)
+        if self._starting is None and not self._closed:
+            self._spawn(self.start())
+        return count
+
+    async def register_many_async(self, components: Iterable[Any], *, chunk_size: int = 10_000) -> int:
+        """Like register_many(), but returns once every shard has its components."""
+        await self.start()
+        futures, count = self._submit_many(components, chunk_size)
+        await asyncio.gather(*futures)
+        return count
+
+    def _submit_many(self, components: Iterable[Any], chunk_size: int) -> Tuple[List[asyncio.Future], int]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        groups: List[List[Any]] = [[] for _ in range(self.shards)]
+        for component in components:
+            groups[self.shard_for(component.name)].append(component)
+        futures = [
+            self._submit(
+                index,
+                lambda request_id, group=group: ("register_many", request_id, group, chunk_size),
+            )
+            for index, group in enumerate(groups)
+            if group
+        ]
+        count = sum(map(len, groups))
+        self.logger.info("Registering %d components across %d shards", count, self.shards)
+        return futures, count
+
+    async def handle_message(self, name: str, message: Union[str, Dict[str, Any]], **fields: Any) -> None:
+        """
+        Handle one message in the component's shard.
+
+        Accepts the same arguments as FlexiFlowEngine.handle_message() and
+        re-raises the shard's exception (KeyError for unknown components).
+        """
+        if isinstance(message, str):
+            message = {"type": message, **fields}
+        await self.start()
+        await self._submit(self.shard_for(name), lambda request_id: ("message", request_id, name, message))
+
+    async def aclose(self) -> None:
+        """Let every shard finish its queued messages, then stop the processes."""
+        if self._closed:
+            return
+        if self._starting is not None:
+            await asyncio.shield(self._starting)
+            closing = [
+                self._submit(shard.index, lambda request_id: ("close", request_id))
+                for shard in self._shards
+            ]
+            self._closed = True
+            self._flush()
+            await asyncio.gather(*closing, return_exceptions=True)
+
+            loop = asyncio.get_running_loop()
+            for shard in self._shards:
+                await loop.run_in_executor(None, shard.process.join, 5)
+                if shard.process.is_alive():
+                    shard.process.terminate()
+                shard.writer.shutdown(wait=True)
+                shard.conn.close()
+        self._closed = True
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self.event_bus.aclose()
+
+    async def __aenter__(self) -> "ShardedEngine":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    # --- Internals ---
+
+    def _submit(self, index: int, make_op: Any) -> asyncio.Future:
+        """Queue an operation for a shard and return the future of its reply."""
+        if self._closed:
+            raise RuntimeError("ShardedEngine is closed")
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (index, future)
+        outbox = self._outboxes[index]
+        outbox.append(make_op(request_id))
+        if len(outbox) >= self.batch_size and self._shards:
+            self._flush_shard(self._shards[index])
+        elif not self._flush_scheduled:
+            # Everything queued during this loop iteration goes out as one batch
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        for shard in self._shards:  # empty until the processes have started
+            self._flush_shard(shard)
+
+    def _sync_forwarding(self) -> None:
+        """Tell the shards which forward_events the parent bus now has subscribers for."""
+        bus = self.event_bus
+        wanted = tuple(name for name in self._forward_events if bus.has_subscribers(name))
+        if wanted != self._forwarding:
+            self._forwarding = wanted
+            for outbox in self._outboxes:
+                outbox.insert(0, ("forward", 0, wanted))
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush_shard(self, shard: _Shard) -> None:
+        if self._forward_events:
+            self._sync_forwarding()
+        outbox = self._outboxes[shard.index]
+        while outbox:
+            batch = outbox[: self.batch_size]
+            del outbox[: self.batch_size]
+            # Pickle here, so one bad operation fails its own caller instead
+            # of losing the batch in the writer thread
+            try:
+                payload = pickle.dumps(batch)
+            except Exception:
+                batch = [op for op in batch if self._picklable_op(op)]
+                if not batch:
+                    continue
+                payload = pickle.dumps(batch)
+            sent = shard.writer.submit(shard.conn.send_bytes, payload)
+            sent.add_done_callback(
+                functools.partial(asyncio.get_running_loop().call_soon_threadsafe, self._sent, batch)
+            )
+
+    def _picklable_op(self, op: tuple) -> bool:
+        try:
+            pickle.dumps(op)
+        except Exception as e:
+            self._fail(op[1], e)
+            return False
+        return True
+
+    def _sent(self, batch: List[tuple], sent: Any) -> None:
+        """Fail every request of a batch the writer thread could not send."""
+        error = sent.exception()
+        if error is None:
+            return
+        self.logger.error("Error sending %d operations to engine shard: %s", len(batch), error)
+        for op in batch:
+            self._fail(op[1], error)
+
+    def _fail(self, request_id: int, error: BaseException) -> None:
+        entry = self._pending.pop(request_id, None)
+        if entry is not None and not entry[1].done():
+            entry[1].set_exception(error)
+
+    def _read(self, shard: _Shard, loop: asyncio.AbstractEventLoop) -> None:
+        """Reader thread: hand every reply batch from a shard to the event loop."""
+        while True:
+            try:
+                batch = shard.conn.recv()
+            except (EOFError, OSError):
+                loop.call_soon_threadsafe(self._shard_exited, shard.index)
+                return
+            loop.call_soon_threadsafe(self._receive, batch)
+
+    def _receive(self, batch: List[tuple]) -> None:
+        events = []
+        for kind, key, value in batch:
+            if kind == "event":
+                events.append((key, value))
+                continue
+            entry = self._pending.pop(key, None)
+            if entry is None or entry[1].done():
+                continue
+            if kind == "ok":
+                entry[1].set_result(value)
+            else:
+                entry[1].set_exception(value)
+        if events:
+            self._spawn(self.event_bus.publish_many(events))
+
+    def _shard_exited(self, index: int) -> None:
+        """Fail the requests still waiting on a shard whose pipe closed."""
+        lost = [request_id for request_id, (shard, _) in self._pending.items() if shard == index]
+        if lost:
+            error = RuntimeError(f"Engine shard {index} exited")
+            for request_id in lost:
+                future = self._pending.pop(request_id)[1]
+                if not future.done():
+                    future.set_exception(error)
+            self.logger.error("Engine shard %d exited with %d requests pending", index, len(lost))
+
+    def _log_failure(self, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error("Error registering component in shard: %s", future.exception())
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
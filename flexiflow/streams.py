@@ -0,0 +1,109 @@
+"""Async-iterator event streams backed by bounded buffers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Hashable, Optional
+
+_STREAM_OVERFLOW = ("drop_oldest", "drop_newest", "coalesce")
+
+
+class EventStream:
+    """Bounded buffer of event payloads, consumed with ``async for``.
+
+    Created by AsyncEventManager.stream(). The bus pushes payloads with an
+    inline handler that never awaits, so a slow consumer only affects its own
+    buffer. The stream is also an async context manager that unsubscribes on
+    exit.
+
+    Attributes:
+        dropped: Payloads discarded because the buffer was full
+        coalesced: Payloads replaced by a newer one with the same key
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1000,
+        overflow: str = "drop_oldest",
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if overflow not in _STREAM_OVERFLOW:
+            raise ValueError("overflow must be 'drop_oldest', 'drop_newest' or 'coalesce'")
+        if overflow == "coalesce" and key is None:
+            raise ValueError("overflow='coalesce' requires a key function")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._key = key
+        self._buffer: Deque[Any] = deque()
+        self._latest: "OrderedDict[Hashable, Any]" = OrderedDict()  # coalesce mode
+        self._ready = asyncio.Event()
+        self._bus: Any = None
+        self._handle: Any = None
+        self.closed = False
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.overflow == "coalesce" else len(self._buffer)
+
+    def _attach(self, bus: Any, handle: Any) -> None:
+        self._bus = bus
+        self._handle = handle
+
+    def _push(self, data: Any) -> None:
+        """Inline subscription handler: buffer a payload without ever waiting."""
+        if self.closed:
+            return
+        if self.overflow == "coalesce":
+            latest = self._latest
+            k = self._key(data)  # type: ignore[misc]
+            if k in latest:
+                self.coalesced += 1
+            elif len(latest) >= self.maxsize:
+                latest.popitem(last=False)
+                self.dropped += 1
+            latest[k] = data
+        else:
+            buffer = self._buffer
+            if len(buffer) >= self.maxsize:
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return
+                buffer.popleft()
+            buffer.append(data)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Unsubscribe and end iteration once the buffer is drained. Idempotent."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._bus is not None:
+            self._bus.unsubscribe(self._handle)
+        self._ready.set()
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        while True:
+            if self.overflow == "coalesce":
+                if self._latest:
+                    return self._latest.popitem(last=False)[1]
+            elif self._buffer:
+                return self._buffer.popleft()
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.close()
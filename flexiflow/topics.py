@@ -0,0 +1,114 @@
+"""Hierarchical topic patterns for event subscriptions.
+
+Event names are dot-separated segments (``state.changed``). A subscription
+pattern may use two wildcard segments:
+
+- ``*`` matches exactly one segment (``state.*`` matches ``state.changed``)
+- ``#`` matches zero or more segments (``component.#`` matches
+  ``component``, ``component.message`` and ``component.message.received``)
+
+Wildcards only apply to whole segments; ``state*`` is a literal name.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set
+
+SEPARATOR = "."
+ONE = "*"
+MANY = "#"
+
+
+def is_pattern(name: str) -> bool:
+    """Return True if an event name contains a wildcard segment."""
+    if ONE not in name and MANY not in name:
+        return False
+    return any(seg in (ONE, MANY) for seg in name.split(SEPARATOR))
+
+
+class _Node:
+    __slots__ = ("children", "pattern")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        self.pattern: Optional[str] = None
+
+
+class TopicTrie:
+    """Segment trie of subscription patterns.
+
+    Patterns are inserted at subscribe time; match() walks the trie once per
+    event name, so its cost depends on the name's depth rather than on the
+    number of registered patterns.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str) -> None:
+        """Insert a pattern. Adding an existing pattern is a no-op."""
+        node = self._root
+        for seg in pattern.split(SEPARATOR):
+            child = node.children.get(seg)
+            if child is None:
+                child = node.children[seg] = _Node()
+            node = child
+        if node.pattern is None:
+            node.pattern = pattern
+            self._size += 1
+
+    def remove(self, pattern: str) -> bool:
+        """Remove a pattern and prune empty branches. Returns True if it was present."""
+        path = [self._root]
+        for seg in pattern.split(SEPARATOR):
+            child = path[-1].children.get(seg)
+            if child is None:
+                return False
+            path.append(child)
+        if path[-1].pattern is None:
+            return False
+
+        path[-1].pattern = None
+        self._size -= 1
+
+        segs = pattern.split(SEPARATOR)
+        for depth in range(len(segs), 0, -1):
+            node = path[depth]
+            if node.pattern is not None or node.children:
+                break
+            del path[depth - 1].children[segs[depth - 1]]
+        return True
+
+    def match(self, name: str) -> List[str]:
+        """Return every registered pattern that matches a concrete event name."""
+        if not self._size:
+            return []
+        found: Set[str] = set()
+        self._walk(self._root, name.split(SEPARATOR), 0, found)
+        return list(found)
+
+    def _walk(self, node: _Node, segs: List[str], i: int, found: Set[str]) -> None:
+        children = node.children
+        many = children.get(MANY)
+
+        if i == len(segs):
+            if node.pattern is not None:
+                found.add(node.pattern)
+            if many is not None:
+                # A trailing '#' also matches zero remaining segments
+                self._walk(many, segs, i, found)
+            return
+
+        child = children.get(segs[i])
+        if child is not None:
+            self._walk(child, segs, i + 1, found)
+        child = children.get(ONE)
+        if child is not None:
+            self._walk(child, segs, i + 1, found)
+        if many is not None:
+            for j in range(i, len(segs) + 1):
+                self._walk(many, segs, j, found)
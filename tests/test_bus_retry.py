@@ -0,0 +1,173 @@
+"""Tests for scheduled retries on bus subscriptions (subscribe(retry=...))."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.dead_letters import DeadLetterStore
+from flexiflow.event_manager import AsyncEventManager
+from flexiflow.extras.retry import RetryConfig
+
+FAST = RetryConfig(max_attempts=3, base_delay=0.01, max_delay=0.05)
+
+
+class FailTimes:
+    """Handler that fails the first `n` calls."""
+
+    def __init__(self, n: int, exc: type = ConnectionError) -> None:
+        self.n = n
+        self.exc = exc
+        self.calls = 0
+        self.seen = []
+
+    async def __call__(self, data):
+        self.calls += 1
+        if self.calls <= self.n:
+            raise self.exc("down")
+        self.seen.append(data)
+
+
+async def test_publish_returns_before_retry_runs():
+    bus = AsyncEventManager()
+    handler = FailTimes(1)
+    after = []
+
+    async def later(data):
+        after.append(data)
+
+    await bus.subscribe("order.placed", "billing", handler, priority=1,
+                        retry=RetryConfig(max_attempts=2, base_delay=10))
+    await bus.subscribe("order.placed", "audit", later, priority=2)
+
+    await asyncio.wait_for(bus.publish("order.placed", 1, on_error="raise"), 1)
+
+    assert after == [1]
+    assert bus.retry_stats()["pending"] == 1
+    await bus.aclose()
+
+
+async def test_retry_succeeds_without_reporting_failure():
+    bus = AsyncEventManager()
+    handler = FailTimes(2)
+    failures = []
+
+    async def capture(data):
+        failures.append(data)
+
+    await bus.subscribe("order.placed", "billing", handler, retry=FAST)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("order.placed", {"id": 1}, delivery="concurrent")
+    await asyncio.sleep(0.1)
+
+    assert handler.seen == [{"id": 1}]
+    assert failures == []
+    stats = bus.retry_stats()
+    assert stats["scheduled"] == 2
+    assert stats["succeeded"] == 1
+    assert stats["pending"] == 0
+
+
+async def test_exhausted_retry_is_reported_and_dead_lettered():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handler = FailTimes(10)
+    failures = []
+
+    async def capture(data):
+        failures.append(data)
+
+    await bus.subscribe("order.placed", "billing", handler, retry=FAST)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("order.placed", {"id": 1})
+    await asyncio.sleep(0.15)
+
+    assert handler.calls == 3
+    assert len(failures) == 1
+    assert bus.dead_letters.peek()[0].attempts == 3
+    assert bus.retry_stats()["exhausted"] == 1
+
+
+async def test_non_retryable_exception_fails_immediately():
+    bus = AsyncEventManager()
+    handler = FailTimes(1, exc=KeyError)
+    config = RetryConfig(max_attempts=3, base_delay=0.01, retry_on=(ConnectionError,))
+    await bus.subscribe("order.placed", "billing", handler, retry=config)
+
+    with pytest.raises(KeyError):
+        await bus.publish("order.placed", {}, on_error="raise")
+
+    assert bus.retry_stats()["scheduled"] == 0
+
+
+async def test_pending_retries_are_capped():
+    bus = AsyncEventManager(max_pending_retries=2)
+    await bus.subscribe("order.placed", "billing", FailTimes(100),
+                        retry=RetryConfig(max_attempts=5, base_delay=10))
+
+    for i in range(5):
+        await bus.publish("order.placed", i)
+
+    stats = bus.retry_stats()
+    assert stats["pending"] == 2
+    assert stats["rejected"] == 3
+    await bus.aclose()
+
+
+async def test_running_retry_can_reschedule_at_the_cap():
+    bus = AsyncEventManager(max_pending_retries=1)
+    handler = FailTimes(10)
+    await bus.subscribe("order.placed", "billing", handler, retry=FAST)
+
+    await bus.publish("order.placed", 1)
+    await asyncio.sleep(0.15)
+
+    assert handler.calls == 3
+    stats = bus.retry_stats()
+    assert stats["rejected"] == 0
+    assert stats["scheduled"] == 2
+    assert stats["exhausted"] == 1
+    assert stats["pending"] == 0
+
+
+async def test_unsubscribe_cancels_pending_retry():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handler = FailTimes(1)
+    handle = await bus.subscribe("order.placed", "billing", handler, retry=FAST)
+
+    await bus.publish("order.placed", {"id": 1})
+    bus.unsubscribe(handle)
+    await asyncio.sleep(0.05)
+
+    assert handler.calls == 1
+    stats = bus.retry_stats()
+    assert stats["pending"] == 0
+    assert stats["scheduled"] == stats["cancelled"] == 1
+    assert [letter.data for letter in bus.dead_letters.peek()] == [{"id": 1}]
+
+
+async def test_aclose_dead_letters_waiting_retries():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    await bus.subscribe("order.placed", "billing", FailTimes(1),
+                        retry=RetryConfig(max_attempts=2, base_delay=10))
+    await bus.publish("order.placed", {"id": 1})
+
+    await bus.aclose()
+
+    assert bus.retry_stats()["pending"] == 0
+    assert bus.retry_stats()["cancelled"] == 1
+    assert [letter.data for letter in bus.dead_letters.peek()] == [{"id": 1}]
+
+
+async def test_retry_config_validated_at_subscribe():
+    bus = AsyncEventManager()
+
+    async def handler(data):
+        pass
+
+    with pytest.raises(ValueError, match="max_attempts"):
+        await bus.subscribe("e", "c", handler, retry=RetryConfig(max_attempts=0))
+    with pytest.raises(ValueError, match="max_pending_retries"):
+        AsyncEventManager(max_pending_retries=0)
@@ -0,0 +1,114 @@
+"""Tests for opt-in event bus statistics."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.bus_stats import LATENCY_BUCKETS, HandlerStats
+from flexiflow.event_manager import AsyncEventManager
+
+
+async def test_stats_disabled_by_default():
+    """Without collect_stats, nothing is recorded."""
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    await bus.subscribe("x", "c", h)
+    await bus.publish("x")
+
+    assert bus.stats()["events"] == {}
+
+
+async def test_stats_count_publishes_calls_and_errors():
+    """Counts are kept per event and per (event, component)."""
+    bus = AsyncEventManager(collect_stats=True)
+
+    async def ok(_):
+        pass
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    await bus.subscribe("x", "good", ok)
+    await bus.subscribe("x", "flaky", bad)
+
+    for _ in range(3):
+        await bus.publish("x")
+    await bus.publish("nobody.listens")
+
+    events = bus.stats()["events"]
+    assert events["x"]["published"] == 3
+    assert events["x"]["calls"] == 6
+    assert events["x"]["errors"] == 3
+    assert events["x"]["handlers"]["good"]["calls"] == 3
+    assert events["x"]["handlers"]["good"]["errors"] == 0
+    assert events["x"]["handlers"]["flaky"]["errors"] == 3
+    assert events["nobody.listens"] == {"published": 1, "calls": 0, "errors": 0, "handlers": {}}
+
+
+async def test_stats_histogram_and_latency():
+    """Latencies land in the fixed histogram buckets."""
+    bus = AsyncEventManager(collect_stats=True)
+
+    async def slow(_):
+        await asyncio.sleep(0.02)
+
+    await bus.subscribe("x", "slow", slow)
+    await bus.publish("x")
+
+    snapshot = bus.stats()
+    handler = snapshot["events"]["x"]["handlers"]["slow"]
+    assert snapshot["buckets"] == list(LATENCY_BUCKETS)
+    assert sum(handler["histogram"]) == 1
+    assert handler["max_seconds"] >= 0.02
+    bucket = handler["histogram"].index(1)
+    assert LATENCY_BUCKETS[bucket] >= 0.02
+
+
+async def test_stats_cover_inline_thread_and_wildcard_handlers():
+    """Every executor is measured, keyed by the concrete event name."""
+    bus = AsyncEventManager(collect_stats=True)
+
+    await bus.subscribe("state.*", "inline", lambda d: None, executor="inline")
+    await bus.subscribe("state.changed", "thread", lambda d: None, executor="thread")
+
+    await bus.publish_many([("state.changed", 1), ("state.changed", 2)])
+
+    handlers = bus.stats()["events"]["state.changed"]["handlers"]
+    assert handlers["inline"]["calls"] == 2
+    assert handlers["thread"]["calls"] == 2
+    await bus.aclose()
+
+
+async def test_reset_and_toggle_stats():
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    await bus.subscribe("x", "c", h)
+
+    bus.enable_stats()
+    await bus.publish("x")
+    assert bus.stats()["events"]["x"]["calls"] == 1
+
+    bus.reset_stats()
+    assert bus.stats()["events"] == {}
+
+    bus.enable_stats(False)
+    await bus.publish("x")
+    assert bus.stats()["events"] == {}
+
+
+@pytest.mark.parametrize(
+    "duration, bucket",
+    [(0.0, 0), (0.0001, 0), (0.0002, 1), (0.75, 8), (60.0, len(LATENCY_BUCKETS) - 1)],
+)
+def test_handler_stats_bucketing(duration, bucket):
+    stats = HandlerStats()
+    stats.record(duration, failed=False)
+    assert stats.histogram[bucket] == 1
@@ -0,0 +1,186 @@
+"""Tests for component eviction and rehydration (FlexiFlowEngine component cache)."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+
+import pytest
+
+import flexiflow.engine as engine_module
+from flexiflow.component import AsyncComponent
+from flexiflow.engine import FlexiFlowEngine
+from flexiflow.extras.snapshot_store import JsonSnapshotStore, SqliteSnapshotStore
+from flexiflow.state_machine import StateMachine
+
+
+@pytest.fixture
+def conn():
+    """In-memory SQLite connection for testing."""
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def state_of(component) -> str:
+    return type(component.state_machine.current_state).__name__
+
+
+def register(engine: FlexiFlowEngine, *names: str) -> None:
+    for name in names:
+        engine.register(AsyncComponent(name=name, state_machine=StateMachine.from_name("InitialState")))
+
+
+async def test_lru_budget_evicts_least_recently_used(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), max_resident=2)
+    register(engine, "a", "b")
+    engine.get("a")  # b is now least recently used
+    register(engine, "c")
+
+    assert set(engine.components) == {"a", "c"}
+    assert engine.evictions == 1
+
+
+async def test_evicted_component_rehydrates_with_its_state(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), max_resident=1)
+    register(engine, "a")
+    await engine.handle_message("a", "start")
+    register(engine, "b")
+    assert "a" not in engine.components
+
+    await engine.handle_message("a", "confirm", content="confirmed")
+
+    assert state_of(engine.components["a"]) == "ProcessingRequest"
+    assert engine.hydrations == 1
+    assert "b" not in engine.components  # evicted to make room
+
+
+async def test_rehydration_is_not_a_registration(conn, caplog):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn))
+    register(engine, "a")
+    await asyncio.sleep(0)  # let register()'s own event go out first
+    engine.evict("a")
+    registered = []
+    await engine.event_bus.subscribe(
+        "engine.component.registered", "observer", registered.append, executor="inline"
+    )
+
+    caplog.clear()
+    with caplog.at_level("INFO", logger="flexiflow"):
+        component = engine.get("a")
+        await asyncio.sleep(0)
+
+    assert component.event_bus is engine.event_bus
+    assert engine.hydrations == 1
+    assert registered == []
+    assert not [r for r in caplog.records if "Registered" in r.getMessage()]
+
+
+async def test_component_with_subscriptions_is_not_evicted(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), max_resident=1)
+    register(engine, "a")
+    handle = await engine.event_bus.subscribe("tick", "a", lambda _: None, executor="inline")
+
+    register(engine, "b")  # over budget, but a is pinned by its subscription
+    assert set(engine.components) == {"a", "b"}
+    assert engine.evict("a") is False
+
+    engine.event_bus.unsubscribe(handle)
+    assert engine.evict("a") is True
+
+
+async def test_pinned_components_are_not_rescanned_on_every_touch(conn, monkeypatch):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), max_resident=10)
+    names = [f"c{i}" for i in range(50)]
+    handles = []
+    for name in names:
+        register(engine, name)
+        handles.append(await engine.event_bus.subscribe("tick", name, lambda _: None, executor="inline"))
+    register(engine, "hot")
+
+    checks = []
+    evictable = engine._evictable
+    monkeypatch.setattr(engine, "_evictable", lambda name: checks.append(name) or evictable(name))
+    for _ in range(100):
+        await engine.send("hot", {"type": "noop"})
+
+    assert len(checks) < 50
+    assert set(names) <= set(engine.components)
+
+    for handle in handles:
+        engine.event_bus.unsubscribe(handle)
+    assert engine.evict_idle() == 41
+    assert len(engine.components) == 10
+
+
+async def test_json_store_roundtrip(tmp_path):
+    engine = FlexiFlowEngine(component_store=JsonSnapshotStore(tmp_path / "snapshots"), max_resident=1)
+    register(engine, "orders/17")
+    await engine.send("orders/17", {"type": "start"})
+    register(engine, "orders/18")
+
+    assert engine.get("orders/17") is not None
+    assert state_of(engine.get("orders/17")) == "AwaitingConfirmation"
+
+
+async def test_idle_ttl_evicts_idle_components(conn, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(engine_module.time, "monotonic", lambda: now[0])
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), idle_ttl=60)
+    register(engine, "a", "b")
+
+    now[0] += 30
+    engine.get("b")
+    now[0] += 45  # a idle for 75s, b for 45s
+
+    assert engine.evict_idle() == 1
+    assert set(engine.components) == {"b"}
+
+
+async def test_busy_component_is_not_evicted(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn))
+    register(engine, "a")
+    await engine.send("a", {"type": "start"}, wait=False)
+
+    assert engine.evict("a") is False
+    await engine.aclose()
+    assert engine.evict("a") is True
+
+
+async def test_unknown_component_is_not_hydrated(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn))
+    assert engine.get("ghost") is None
+    with pytest.raises(KeyError):
+        await engine.send("ghost", {})
+
+
+async def test_dispatch_many_hydrates_each_component_once(conn):
+    engine = FlexiFlowEngine(component_store=SqliteSnapshotStore(conn), max_resident=3)
+    names = [f"c{i}" for i in range(6)]
+    register(engine, *names)
+    for name in names:
+        engine.evict(name)
+
+    summary = await engine.dispatch_many([(name, {"type": "start"}) for name in names])
+
+    assert summary["transitions"] == 6
+    assert engine.hydrations == 6
+    for name in names:
+        assert state_of(engine.get(name)) == "AwaitingConfirmation"
+
+
+def test_sqlite_store_keeps_last_snapshot(conn):
+    store = SqliteSnapshotStore(conn)
+    component = AsyncComponent(name="a", state_machine=StateMachine.from_name("InitialState"))
+    store.save(component)
+    store.save(component)
+
+    assert conn.execute("SELECT COUNT(*) FROM flexiflow_snapshots").fetchone()[0] == 1
+    assert store.load("a").current_state == "InitialState"
+
+
+def test_cache_options_validated():
+    with pytest.raises(ValueError, match="component_store"):
+        FlexiFlowEngine(max_resident=10)
+    with pytest.raises(ValueError, match="max_resident"):
+        FlexiFlowEngine(component_store=object(), max_resident=0)
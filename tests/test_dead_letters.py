@@ -0,0 +1,189 @@
+"""Tests for the dead-letter store and redrive()."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from flexiflow.dead_letters import DeadLetter, DeadLetterStore
+from flexiflow.event_manager import AsyncEventManager
+
+
+@pytest.fixture
+def conn():
+    """In-memory SQLite connection for testing."""
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def letter(n: int) -> DeadLetter:
+    return DeadLetter("order.placed", {"n": n}, "billing", "sid", ValueError(n))
+
+
+class Flaky:
+    """Handler that fails until `healthy` is set."""
+
+    def __init__(self) -> None:
+        self.healthy = False
+        self.seen = []
+
+    async def __call__(self, data):
+        if not self.healthy:
+            raise ConnectionError("downstream unavailable")
+        self.seen.append(data)
+
+
+def test_store_drops_oldest_without_sqlite():
+    store = DeadLetterStore(maxsize=2)
+    for n in range(3):
+        store.add(letter(n))
+
+    assert len(store) == 2
+    assert store.stats()["dropped"] == 1
+    assert [entry.data["n"] for entry in store.take(10)] == [1, 2]
+
+
+def test_store_spills_to_sqlite_and_takes_oldest_first(conn):
+    store = DeadLetterStore(maxsize=2, conn=conn)
+    for n in range(5):
+        store.add(letter(n))
+
+    assert store.stats() == {"buffered": 2, "spilled": 3, "maxsize": 2, "added": 5, "dropped": 0}
+    taken = store.take(4)
+    assert [entry.data["n"] for entry in taken] == [0, 1, 2, 3]
+    # Spilled letters keep the exception as its repr
+    assert taken[0].exception == "ValueError(0)"
+    assert isinstance(taken[3].exception, ValueError)
+    assert len(store) == 1
+
+
+def test_store_recovers_spilled_letters_on_new_store(conn):
+    store = DeadLetterStore(maxsize=1, conn=conn)
+    store.add(letter(0))
+    store.add(letter(1))
+
+    reopened = DeadLetterStore(maxsize=1, conn=conn)
+    assert len(reopened) == 1
+    assert reopened.take(1)[0].data == {"n": 0}
+
+
+def test_store_drops_unserializable_payload_on_spill(conn):
+    store = DeadLetterStore(maxsize=1, conn=conn)
+    store.add(DeadLetter("e", object(), "c", "sid", ValueError()))
+    store.add(letter(1))
+
+    assert store.stats()["dropped"] == 1
+    assert store.stats()["spilled"] == 0
+
+
+def test_store_validates_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        DeadLetterStore(maxsize=0)
+
+
+async def test_failed_delivery_is_dead_lettered():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handler = Flaky()
+    await bus.subscribe("order.placed", "billing", handler)
+
+    await bus.publish("order.placed", {"id": 1})
+    await bus.publish("order.placed", {"id": 2}, delivery="concurrent")
+
+    letters = bus.dead_letters.peek()
+    assert [entry.data for entry in letters] == [{"id": 1}, {"id": 2}]
+    assert letters[0].component_name == "billing"
+    assert isinstance(letters[0].exception, ConnectionError)
+    assert letters[0].attempts == 1
+
+
+async def test_raise_mode_is_not_dead_lettered():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    await bus.subscribe("order.placed", "billing", Flaky())
+
+    with pytest.raises(ConnectionError):
+        await bus.publish("order.placed", {}, on_error="raise")
+
+    assert len(bus.dead_letters) == 0
+
+
+async def test_redrive_delivers_only_to_failed_subscription():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handler = Flaky()
+    other = []
+
+    async def audit(data):
+        other.append(data)
+
+    await bus.subscribe("order.placed", "billing", handler)
+    await bus.subscribe("order.placed", "audit", audit)
+    for i in range(5):
+        await bus.publish("order.placed", i)
+
+    handler.healthy = True
+    counts = await bus.redrive(batch_size=2)
+
+    assert counts == {"redriven": 5, "failed": 0, "skipped": 0}
+    assert handler.seen == [0, 1, 2, 3, 4]
+    assert other == [0, 1, 2, 3, 4]  # not replayed
+    assert len(bus.dead_letters) == 0
+
+
+async def test_redrive_failure_increments_attempts():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    await bus.subscribe("order.placed", "billing", Flaky())
+    await bus.publish("order.placed", {})
+
+    counts = await bus.redrive()
+
+    assert counts == {"redriven": 0, "failed": 1, "skipped": 0}
+    assert bus.dead_letters.peek()[0].attempts == 2
+
+
+async def test_redrive_falls_back_to_component_subscription(conn):
+    store = DeadLetterStore(maxsize=1, conn=conn)
+    bus = AsyncEventManager(dead_letters=store)
+    handle = await bus.subscribe("order.placed", "billing", Flaky())
+    await bus.publish("order.placed", {"id": 1})
+    await bus.publish("order.placed", {"id": 2})
+    bus.unsubscribe(handle)
+
+    # A new process: same component, new subscription
+    restarted = AsyncEventManager(dead_letters=DeadLetterStore(maxsize=1, conn=conn))
+    handler = Flaky()
+    handler.healthy = True
+    await restarted.subscribe("order.placed", "billing", handler)
+
+    counts = await restarted.redrive()
+
+    assert counts == {"redriven": 1, "failed": 0, "skipped": 0}
+    assert handler.seen == [{"id": 1}]
+
+
+async def test_redrive_skips_letters_without_subscription():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handle = await bus.subscribe("order.placed", "billing", Flaky())
+    await bus.publish("order.placed", {})
+    bus.unsubscribe(handle)
+
+    assert await bus.redrive() == {"redriven": 0, "failed": 0, "skipped": 1}
+
+
+async def test_redrive_limit():
+    bus = AsyncEventManager(dead_letters=DeadLetterStore())
+    handler = Flaky()
+    await bus.subscribe("order.placed", "billing", handler)
+    for i in range(3):
+        await bus.publish("order.placed", i)
+
+    handler.healthy = True
+    assert (await bus.redrive(limit=2))["redriven"] == 2
+    assert handler.seen == [0, 1]
+    assert len(bus.dead_letters) == 1
+
+
+async def test_redrive_requires_store():
+    bus = AsyncEventManager()
+    with pytest.raises(RuntimeError, match="dead_letters"):
+        await bus.redrive()
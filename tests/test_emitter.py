@@ -0,0 +1,122 @@
+"""Tests for the background observability emitter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.component import AsyncComponent
+from flexiflow.emitter import ObservabilityEmitter
+from flexiflow.engine import FlexiFlowEngine
+from flexiflow.event_manager import AsyncEventManager
+from flexiflow.state_machine import StateMachine
+
+
+async def test_emit_returns_before_listeners_run():
+    """emit() only buffers; listeners run on the emitter's drain task."""
+    bus = AsyncEventManager()
+    emitter = ObservabilityEmitter(bus)
+    seen = []
+
+    async def capture(data):
+        seen.append(data)
+
+    await bus.subscribe("x", "observer", capture)
+
+    emitter.emit("x", 1)
+    emitter.emit("x", 2)
+    assert seen == []
+
+    await emitter.flush()
+    assert seen == [1, 2]
+    assert emitter.stats()["delivered"] == 2
+
+
+async def test_batches_preserve_emit_order():
+    """Events drained across several batches keep their emit order."""
+    bus = AsyncEventManager()
+    emitter = ObservabilityEmitter(bus, batch_size=3)
+    seen = []
+
+    async def capture(data):
+        seen.append(data)
+
+    await bus.subscribe("state.changed", "observer", capture)
+
+    for i in range(10):
+        emitter.emit("state.changed", {"component": f"c{i % 2}", "seq": i})
+    await emitter.flush()
+
+    for comp in ("c0", "c1"):
+        seqs = [d["seq"] for d in seen if d["component"] == comp]
+        assert seqs == sorted(seqs)
+    assert [d["seq"] for d in seen] == list(range(10))
+
+
+async def test_full_ring_buffer_drops_oldest_and_counts():
+    """A full buffer discards its oldest event and reports it as dropped."""
+    bus = AsyncEventManager()
+    emitter = ObservabilityEmitter(bus, capacity=3)
+    seen = []
+
+    async def capture(data):
+        seen.append(data)
+
+    await bus.subscribe("x", "observer", capture)
+
+    for i in range(5):
+        emitter.emit("x", i)  # drain task has not run yet
+
+    assert emitter.stats()["dropped"] == 2
+    await emitter.flush()
+    assert seen == [2, 3, 4]
+
+
+def test_emitter_options_validated():
+    bus = AsyncEventManager()
+    with pytest.raises(ValueError, match="capacity"):
+        ObservabilityEmitter(bus, capacity=0)
+    with pytest.raises(ValueError, match="batch_size"):
+        ObservabilityEmitter(bus, batch_size=0)
+
+
+async def test_engine_background_observability():
+    """Components registered with a background engine emit through the ring buffer."""
+    engine = FlexiFlowEngine(observability="background")
+    events = []
+    release = asyncio.Event()
+
+    async def capture(data):
+        await release.wait()
+        events.append(data)
+
+    await engine.event_bus.subscribe("state.changed", "observer", capture)
+    await engine.event_bus.subscribe("engine.component.registered", "observer", capture)
+
+    component = AsyncComponent(
+        name="comp",
+        state_machine=StateMachine.from_name("InitialState"),
+    )
+    engine.register(component)
+    assert component.emitter is engine.emitter
+
+    # A blocked listener does not hold up the state transition
+    await component.handle_message({"type": "start"})
+    assert component.state_machine.current_state.__class__.__name__ == "AwaitingConfirmation"
+
+    release.set()
+    await engine.aclose()
+
+    assert events == [
+        {"component": "comp"},
+        {"component": "comp", "from_state": "InitialState", "to_state": "AwaitingConfirmation"},
+    ]
+
+
+def test_engine_inline_observability_is_default():
+    engine = FlexiFlowEngine()
+    assert engine.emitter is None
+
+    with pytest.raises(ValueError, match="observability must be"):
+        FlexiFlowEngine(observability="async")
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from flexiflow.engine import FlexiFlowEngine
 from flexiflow.component import AsyncComponent
-from flexiflow.state_machine import StateMachine
+from flexiflow.state_machine import State, StateMachine
 
 
 def test_register_attaches_logger_and_bus():
@@ -45,3 +49,158 @@ def test_multiple_components():
     assert engine.get("comp1") is c1
     assert engine.get("comp2") is c2
     assert len(engine.components) == 2
+
+
+def _engine_with(*names: str) -> FlexiFlowEngine:
+    engine = FlexiFlowEngine()
+    for name in names:
+        engine.register(AsyncComponent(name=name, state_machine=StateMachine.from_name("InitialState")))
+    return engine
+
+
+async def test_dispatch_many_groups_by_component_in_order():
+    """dispatch_many handles each component's messages in input order."""
+    engine = _engine_with("a", "b")
+
+    summary = await engine.dispatch_many(
+        [
+            ("a", {"type": "start"}),
+            ("b", {"type": "start"}),
+            ("a", {"type": "confirm", "content": "confirmed"}),
+            ("b", {"type": "cancel"}),
+            ("a", {"type": "complete"}),
+        ]
+    )
+
+    assert summary == {"messages": 5, "components": 2, "transitions": 5, "failed": 0, "errors": {}}
+    assert type(engine.get("a").state_machine.current_state).__name__ == "InitialState"
+    assert type(engine.get("b").state_machine.current_state).__name__ == "InitialState"
+
+
+async def test_dispatch_many_emits_one_aggregated_event():
+    """Per-message events are replaced by a single engine.messages.dispatched event."""
+    engine = _engine_with("a", "b")
+    events = []
+
+    async def capture(data):
+        events.append(data)
+
+    await engine.event_bus.subscribe("state.changed", "observer", capture)
+    await engine.event_bus.subscribe("component.message.received", "observer", capture)
+    await engine.event_bus.subscribe("engine.messages.dispatched", "observer", capture)
+
+    await engine.dispatch_many([("a", {"type": "start"}), ("b", {"type": "noop"})])
+
+    assert len(events) == 1
+    report = events[0]
+    assert report["messages"] == 2
+    assert report["transitions"] == 1
+    assert report["results"]["a"] == {
+        "processed": 1,
+        "failed": 0,
+        "transitions": 1,
+        "from_state": "InitialState",
+        "to_state": "AwaitingConfirmation",
+    }
+
+
+async def test_dispatch_many_failure_does_not_stop_group():
+    """A failing message is reported and later messages of the group still run."""
+    engine = _engine_with("a")
+    component = engine.get("a")
+    original = component.state_machine.handle_message
+
+    async def flaky(message, comp):
+        if message.get("boom"):
+            raise RuntimeError("boom")
+        return await original(message, comp)
+
+    component.state_machine.handle_message = flaky
+
+    summary = await engine.dispatch_many([("a", {"boom": True}), ("a", {"type": "start"})])
+
+    assert summary["failed"] == 1
+    assert summary["transitions"] == 1
+    [(index, exc)] = summary["errors"]["a"]
+    assert index == 0 and isinstance(exc, RuntimeError)
+
+
+async def test_dispatch_many_limits_concurrency():
+    """At most max_concurrency components are processed at once."""
+    running = 0
+    peak = 0
+
+    class Slow(State):
+        async def handle_message(self, message, component):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+            return False, self
+
+    engine = FlexiFlowEngine()
+    for i in range(10):
+        engine.register(AsyncComponent(name=f"c{i}", state_machine=StateMachine(current_state=Slow())))
+
+    await engine.dispatch_many([(f"c{i}", {}) for i in range(10)], max_concurrency=3)
+
+    assert peak == 3
+
+
+async def test_dispatch_many_unknown_component_dispatches_nothing():
+    """Unknown names are rejected before any message is handled."""
+    engine = _engine_with("a")
+
+    with pytest.raises(KeyError, match="ghost"):
+        await engine.dispatch_many([("a", {"type": "start"}), ("ghost", {})])
+
+    assert type(engine.get("a").state_machine.current_state).__name__ == "InitialState"
+
+
+def _components(count: int):
+    return [
+        AsyncComponent(name=f"c{i}", state_machine=StateMachine.from_name("InitialState"))
+        for i in range(count)
+    ]
+
+
+def test_register_many_attaches_and_stores():
+    """register_many inserts every component and injects logger and event_bus."""
+    engine = FlexiFlowEngine()
+    components = _components(3)
+
+    assert engine.register_many(components) == 3
+
+    assert list(engine.components) == ["c0", "c1", "c2"]
+    assert all(c.logger is engine.logger and c.event_bus is engine.event_bus for c in components)
+
+
+async def test_register_many_emits_chunked_events():
+    """One engine.components.registered event per chunk, no per-component events."""
+    engine = FlexiFlowEngine()
+    batches = []
+    single = []
+    await engine.event_bus.subscribe(
+        "engine.components.registered", "observer", batches.append, executor="inline"
+    )
+    await engine.event_bus.subscribe(
+        "engine.component.registered", "observer", single.append, executor="inline"
+    )
+
+    await engine.register_many_async(_components(5), chunk_size=2)
+
+    assert [b["components"] for b in batches] == [["c0", "c1"], ["c2", "c3"], ["c4"]]
+    assert [(b["count"], b["chunk"], b["chunks"]) for b in batches] == [(2, 0, 3), (2, 1, 3), (1, 2, 3)]
+    assert single == []
+
+
+async def test_register_many_logs_one_line(caplog):
+    """A batch is logged as one summary line."""
+    engine = FlexiFlowEngine()
+
+    with caplog.at_level("INFO", logger="flexiflow"):
+        engine.register_many(_components(50))
+        await asyncio.sleep(0)
+
+    assert [r.getMessage() for r in caplog.records] == ["Registered 50 components"]
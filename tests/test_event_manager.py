@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import operator
+import threading
+import time
+
 import pytest
 
 from flexiflow.event_manager import AsyncEventManager, SubscriptionHandle
@@ -209,3 +214,750 @@ async def test_unsubscribe_all_unknown_component():
     """unsubscribe_all() with unknown component returns 0."""
     bus = AsyncEventManager()
     assert bus.unsubscribe_all("nonexistent") == 0
+
+
+# --- Dispatch plan tests ---
+
+
+async def test_same_priority_keeps_subscription_order():
+    """Handlers within one priority tier run in the order they subscribed."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+        return h
+
+    await bus.subscribe("x", "c1", make("a3"), priority=3)
+    await bus.subscribe("x", "c2", make("b1"), priority=1)
+    await bus.subscribe("x", "c3", make("c3"), priority=3)
+    await bus.subscribe("x", "c4", make("d5"), priority=5)
+    await bus.subscribe("x", "c5", make("e1"), priority=1)
+
+    await bus.publish("x")
+    assert seen == ["b1", "e1", "a3", "c3", "d5"]
+
+
+async def test_dispatch_plan_rebuilt_after_unsubscribe():
+    """The dispatch plan reflects subscribe/unsubscribe changes immediately."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h1(_):
+        seen.append("h1")
+
+    async def h2(_):
+        seen.append("h2")
+
+    handle = await bus.subscribe("x", "c1", h1, priority=2)
+    await bus.publish("x")
+    await bus.subscribe("x", "c2", h2, priority=1)
+    await bus.publish("x")
+    bus.unsubscribe(handle)
+    await bus.publish("x")
+
+    assert seen == ["h1", "h2", "h1", "h2"]
+
+
+async def test_unsubscribe_handle_with_wrong_event_name():
+    """A handle only removes the subscription for the event it was issued for."""
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    handle = await bus.subscribe("x", "c", h)
+    forged = SubscriptionHandle(event_name="y", subscription_id=handle.subscription_id)
+
+    assert bus.unsubscribe(forged) is False
+    assert bus.unsubscribe(handle) is True
+
+
+async def test_unsubscribe_all_many_components_leaves_others():
+    """Bulk teardown removes only the named component and empties the bus when done."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    for i in range(200):
+        for event in ("a", "b", "c"):
+            await bus.subscribe(event, f"comp{i}", h, priority=(i % 5) + 1)
+
+    for i in range(199):
+        assert bus.unsubscribe_all(f"comp{i}") == 3
+
+    await bus.publish("a", "a")
+    await bus.publish("b", "b")
+    assert seen == ["a", "b"]
+
+    assert bus.unsubscribe_all("comp199") == 3
+    await bus.publish("c", "c")
+    assert seen == ["a", "b"]
+    assert bus._events == {}
+    assert bus._index == {}
+
+
+# --- Wildcard subscription tests ---
+
+
+async def test_wildcard_single_segment():
+    """'state.*' receives state.changed but not deeper or unrelated events."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    await bus.subscribe("state.*", "metrics", h)
+
+    await bus.publish("state.changed", 1)
+    await bus.publish("state.changed.extra", 2)
+    await bus.publish("component.message.received", 3)
+
+    assert seen == [1]
+
+
+async def test_wildcard_multi_segment_and_exact_share_priority_order():
+    """Pattern and exact subscribers are merged by priority, then subscription order."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+        return h
+
+    await bus.subscribe("component.message.received", "exact3", make("exact3"), priority=3)
+    await bus.subscribe("component.#", "wild3", make("wild3"), priority=3)
+    await bus.subscribe("#", "all1", make("all1"), priority=1)
+
+    await bus.publish("component.message.received")
+    assert seen == ["all1", "exact3", "wild3"]
+
+
+async def test_wildcard_unsubscribe_stops_delivery():
+    """Removing a pattern subscription invalidates plans for names it matched."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    handle = await bus.subscribe("engine.#", "metrics", h)
+    await bus.publish("engine.component.registered", "before")
+
+    assert bus.unsubscribe(handle) is True
+    await bus.publish("engine.component.registered", "after")
+
+    assert seen == ["before"]
+    assert len(bus._topics) == 0
+
+
+# --- Batch publish tests ---
+
+
+async def test_publish_many_sequential_keeps_input_order():
+    """publish_many delivers each event, in input order, with priority order per event."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def low(data):
+        seen.append(("low", data))
+
+    async def high(data):
+        seen.append(("high", data))
+
+    await bus.subscribe("a", "c1", low, priority=5)
+    await bus.subscribe("a", "c2", high, priority=1)
+    await bus.subscribe("b", "c3", low)
+
+    await bus.publish_many([("a", 1), ("b", 2), ("missing", 3), ("a", 4)])
+
+    assert seen == [("high", 1), ("low", 1), ("low", 2), ("high", 4), ("low", 4)]
+
+
+async def test_publish_many_looks_up_each_event_once(monkeypatch):
+    """Each distinct event name is resolved once per batch."""
+    bus = AsyncEventManager()
+    lookups = []
+
+    async def h(_):
+        pass
+
+    await bus.subscribe("a", "c", h)
+    await bus.subscribe("b", "c", h)
+
+    original = bus._plan_for
+
+    def counting(event_name):
+        lookups.append(event_name)
+        return original(event_name)
+
+    monkeypatch.setattr(bus, "_plan_for", counting)
+    await bus.publish_many([("a", i) for i in range(50)] + [("b", 0), ("c", 0)])
+
+    assert sorted(lookups) == ["a", "b", "c"]
+
+
+async def test_publish_many_applies_filters_per_event():
+    """filter_fn still sees each event's own payload."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h, filter_fn=lambda name, data: data % 2 == 0)
+
+    await bus.publish_many(("x", i) for i in range(6))
+    assert seen == [0, 2, 4]
+
+
+async def test_publish_many_concurrent_single_gather(monkeypatch):
+    """Concurrent batches use one gather for every handler of every event."""
+    bus = AsyncEventManager()
+    seen = []
+    gathers = []
+
+    async def h(data):
+        seen.append(data)
+
+    await bus.subscribe("a", "c1", h)
+    await bus.subscribe("b", "c2", h)
+
+    original_gather = asyncio.gather
+
+    def counting_gather(*aws, **kwargs):
+        gathers.append(len(aws))
+        return original_gather(*aws, **kwargs)
+
+    monkeypatch.setattr(asyncio, "gather", counting_gather)
+    await bus.publish_many([("a", 1), ("b", 2), ("a", 3)], delivery="concurrent")
+
+    assert gathers == [3]
+    assert sorted(seen) == [1, 2, 3]
+
+
+async def test_publish_many_concurrent_raise_and_continue():
+    """Error policies apply across the whole batch."""
+    bus = AsyncEventManager()
+    failed = []
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def capture(data):
+        failed.append(data["event_name"])
+
+    await bus.subscribe("a", "c", bad)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish_many([("a", 1), ("a", 2)], delivery="concurrent")
+    assert failed == ["a", "a"]
+
+    with pytest.raises(RuntimeError):
+        await bus.publish_many([("a", 1)], delivery="concurrent", on_error="raise")
+
+
+async def test_publish_many_validates_options_once():
+    """Invalid options raise before any delivery."""
+    bus = AsyncEventManager()
+
+    with pytest.raises(ValueError, match="delivery must be"):
+        await bus.publish_many([("a", 1)], delivery="broadcast")
+    with pytest.raises(ValueError, match="on_error must be"):
+        await bus.publish_many([("a", 1)], on_error="ignore")
+
+
+# --- Tiered delivery and concurrency cap tests ---
+
+
+async def test_tiered_delivery_runs_tier_concurrently_and_tiers_in_order():
+    """Handlers in one tier overlap; the next tier starts only after the first finishes."""
+    bus = AsyncEventManager()
+    log = []
+
+    def make(tag):
+        async def h(_):
+            log.append(("start", tag))
+            await asyncio.sleep(0.01)
+            log.append(("end", tag))
+        return h
+
+    await bus.subscribe("x", "a", make("a1"), priority=1)
+    await bus.subscribe("x", "b", make("b1"), priority=1)
+    await bus.subscribe("x", "c", make("c2"), priority=2)
+
+    await bus.publish("x", delivery="tiered")
+
+    assert log[:2] == [("start", "a1"), ("start", "b1")]
+    assert log[-2:] == [("start", "c2"), ("end", "c2")]
+
+
+async def test_tiered_delivery_respects_filters():
+    """Filtered-out subscribers are skipped without disturbing tier order."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+        return h
+
+    await bus.subscribe("x", "a", make("a1"), priority=1, filter_fn=lambda n, d: False)
+    await bus.subscribe("x", "b", make("b2"), priority=2)
+    await bus.subscribe("x", "c", make("c4"), priority=4)
+
+    await bus.publish("x", delivery="tiered")
+    assert seen == ["b2", "c4"]
+
+
+async def test_tiered_raise_stops_later_tiers():
+    """With on_error='raise', a failure in one tier prevents later tiers from running."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def later(_):
+        seen.append("later")
+
+    await bus.subscribe("x", "a", bad, priority=1)
+    await bus.subscribe("x", "b", later, priority=2)
+
+    with pytest.raises(RuntimeError):
+        await bus.publish("x", delivery="tiered", on_error="raise")
+    assert seen == []
+
+
+async def _peak_concurrency(bus, n_subs, **publish_kwargs):
+    running = 0
+    peak = 0
+
+    async def h(_):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    for i in range(n_subs):
+        await bus.subscribe("x", f"c{i}", h)
+    await bus.publish("x", **publish_kwargs)
+    return peak
+
+
+async def test_concurrent_unbounded_by_default():
+    assert await _peak_concurrency(AsyncEventManager(), 20, delivery="concurrent") == 20
+
+
+async def test_max_in_flight_per_publish():
+    """A per-publish cap bounds how many handlers run at once."""
+    peak = await _peak_concurrency(
+        AsyncEventManager(), 50, delivery="concurrent", max_in_flight=4
+    )
+    assert peak == 4
+
+
+async def test_max_in_flight_bus_default_and_override():
+    """The bus-wide default applies unless a publish overrides it."""
+    peak = await _peak_concurrency(
+        AsyncEventManager(max_in_flight=3), 30, delivery="tiered"
+    )
+    assert peak == 3
+
+    peak = await _peak_concurrency(
+        AsyncEventManager(max_in_flight=3), 30, delivery="concurrent", max_in_flight=10
+    )
+    assert peak == 10
+
+
+async def test_capped_concurrent_reports_failures():
+    """Errors from capped workers still reach event.handler.failed and on_error='raise'."""
+    bus = AsyncEventManager(max_in_flight=2)
+    failed = []
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def ok(_):
+        pass
+
+    async def capture(data):
+        failed.append(data["component_name"])
+
+    for i in range(5):
+        await bus.subscribe("x", f"c{i}", bad if i == 3 else ok)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("x", delivery="concurrent")
+    assert failed == ["c3"]
+
+    with pytest.raises(RuntimeError):
+        await bus.publish("x", delivery="concurrent", on_error="raise")
+
+
+async def test_max_in_flight_validated():
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    await bus.subscribe("x", "c", h)
+    with pytest.raises(ValueError, match="max_in_flight"):
+        await bus.publish("x", delivery="concurrent", max_in_flight=0)
+    with pytest.raises(ValueError, match="max_in_flight"):
+        AsyncEventManager(max_in_flight=0)
+
+
+# --- Timeout tests ---
+
+
+async def test_subscription_timeout_fails_handler_and_continues():
+    """A handler exceeding its own timeout fails; later handlers still run."""
+    bus = AsyncEventManager()
+    seen = []
+    failed = []
+
+    async def stuck(_):
+        await asyncio.sleep(10)
+
+    async def good(_):
+        seen.append("good")
+
+    async def capture(data):
+        failed.append(data)
+
+    await bus.subscribe("x", "stuck", stuck, priority=1, timeout=0.01)
+    await bus.subscribe("x", "good", good, priority=2)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("x")
+
+    assert seen == ["good"]
+    assert failed[0]["component_name"] == "stuck"
+    assert "TimeoutError" in failed[0]["exception"]
+    assert "timed out after 0.01s" in failed[0]["exception"]
+
+
+async def test_publish_timeout_applies_to_handlers_without_their_own():
+    """The publish-level timeout is a default; subscription timeouts take precedence."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def slowish(_):
+        await asyncio.sleep(0.05)
+        seen.append("slowish")
+
+    await bus.subscribe("x", "patient", slowish, timeout=1.0)
+    await bus.subscribe("x", "default", slowish)
+
+    await bus.publish("x", timeout=0.01)
+    assert seen == ["slowish"]
+
+    with pytest.raises(asyncio.TimeoutError):
+        await bus.publish("x", timeout=0.01, delivery="concurrent", on_error="raise")
+
+
+async def test_timeout_validated():
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    with pytest.raises(ValueError, match="timeout must be"):
+        await bus.subscribe("x", "c", h, timeout=0)
+    with pytest.raises(ValueError, match="timeout must be"):
+        await bus.publish("x", timeout=-1)
+
+
+# --- has_subscribers tests ---
+
+
+async def test_has_subscribers_tracks_exact_and_wildcard():
+    """has_subscribers reflects exact and pattern subscriptions as they change."""
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    assert bus.has_subscribers("state.changed") is False
+
+    exact = await bus.subscribe("state.changed", "c", h)
+    assert bus.has_subscribers("state.changed") is True
+
+    bus.unsubscribe(exact)
+    assert bus.has_subscribers("state.changed") is False
+
+    await bus.subscribe("state.*", "c", h)
+    assert bus.has_subscribers("state.changed") is True
+    assert bus.has_subscribers("component.message.received") is False
+
+
+# --- Executor tests ---
+
+
+async def test_thread_executor_runs_blocking_handler_off_loop():
+    """executor='thread' runs sync handlers on worker threads, not the loop thread."""
+    bus = AsyncEventManager(thread_workers=2)
+    threads = []
+    ticks = []
+
+    def blocking(data):
+        time.sleep(0.05)
+        threads.append(threading.current_thread().name)
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append("tick")
+            await asyncio.sleep(0.01)
+
+    await bus.subscribe("x", "writer", blocking, executor="thread")
+
+    ticking = asyncio.create_task(ticker())
+    await bus.publish("x", 1)
+    await ticking
+
+    assert threads and threads[0].startswith("flexiflow-bus")
+    assert ticks == ["tick", "tick", "tick"]  # loop stayed responsive
+    await bus.aclose()
+    assert bus._thread_pool is None
+
+
+async def test_thread_executor_failure_and_timeout():
+    """Thread handlers report failures and honour timeouts like async ones."""
+    bus = AsyncEventManager()
+    failed = []
+
+    def bad(_):
+        raise RuntimeError("boom")
+
+    def stuck(_):
+        time.sleep(0.2)
+
+    async def capture(data):
+        failed.append((data["component_name"], data["exception"]))
+
+    await bus.subscribe("x", "bad", bad, executor="thread")
+    await bus.subscribe("x", "stuck", stuck, executor="thread", timeout=0.01)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("x", delivery="concurrent")
+
+    assert sorted(name for name, _ in failed) == ["bad", "stuck"]
+    assert any("TimeoutError" in exc for _, exc in failed)
+    await bus.aclose()
+
+
+async def test_inline_executor_runs_sync_handler_in_order():
+    """executor='inline' handlers run in priority order alongside async ones."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def fast(data):
+        seen.append(("inline", data))
+
+    async def slow(data):
+        seen.append(("async", data))
+
+    await bus.subscribe("x", "a", fast, priority=1, executor="inline")
+    await bus.subscribe("x", "b", slow, priority=2)
+
+    await bus.publish("x", 1)
+    await bus.publish("x", 2, delivery="concurrent")
+    await bus.publish("x", 3, delivery="concurrent", max_in_flight=1)
+
+    assert seen[:2] == [("inline", 1), ("async", 1)]
+    assert sorted(seen[2:]) == [("async", 2), ("async", 3), ("inline", 2), ("inline", 3)]
+
+
+async def test_inline_executor_errors_follow_error_policy():
+    bus = AsyncEventManager()
+    failed = []
+
+    def bad(_):
+        raise RuntimeError("boom")
+
+    async def capture(data):
+        failed.append(data["component_name"])
+
+    await bus.subscribe("x", "bad", bad, executor="inline")
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    await bus.publish("x")
+    await bus.publish("x", delivery="concurrent")
+    assert failed == ["bad", "bad"]
+
+    with pytest.raises(RuntimeError):
+        await bus.publish("x", on_error="raise")
+
+
+async def test_executor_validated():
+    bus = AsyncEventManager()
+
+    async def async_handler(_):
+        pass
+
+    with pytest.raises(ValueError, match="executor must be"):
+        await bus.subscribe("x", "c", lambda d: None, executor="process")
+    with pytest.raises(ValueError, match="requires a synchronous handler"):
+        await bus.subscribe("x", "c", async_handler, executor="thread")
+
+
+# --- Declarative match filter tests ---
+
+
+async def test_match_delivers_only_to_matching_subscribers():
+    """match={'component': ...} routes state.changed straight to that component's subscriber."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(data):
+            seen.append((tag, data["component"]))
+        return h
+
+    for i in range(50):
+        await bus.subscribe("state.changed", f"watch{i}", make(f"watch{i}"), match={"component": f"orders-{i}"})
+    await bus.subscribe("state.changed", "all", make("all"), priority=5)
+
+    await bus.publish("state.changed", {"component": "orders-17", "to_state": "Done"})
+    await bus.publish("state.changed", {"component": "unknown"})
+
+    assert seen == [("watch17", "orders-17"), ("all", "orders-17"), ("all", "unknown")]
+
+
+async def test_match_multiple_keys_and_priority_merge():
+    """All match keys must be equal; matched and unmatched subscribers share priority order."""
+    bus = AsyncEventManager()
+    seen = []
+
+    def make(tag):
+        async def h(_):
+            seen.append(tag)
+        return h
+
+    await bus.subscribe("x", "plain3", make("plain3"), priority=3)
+    await bus.subscribe("x", "both1", make("both1"), priority=1, match={"a": 1, "b": 2})
+    await bus.subscribe("x", "a4", make("a4"), priority=4, match={"a": 1})
+
+    await bus.publish("x", {"a": 1, "b": 2})
+    await bus.publish("x", {"a": 1, "b": 3})
+    await bus.publish("x", {"b": 2})
+    await bus.publish("x", "not a mapping")
+
+    assert seen == ["both1", "plain3", "a4", "plain3", "a4", "plain3", "plain3"]
+
+
+async def test_match_combines_with_filter_fn_and_tiered_delivery():
+    """filter_fn still applies to matched subscribers; tiered delivery includes matches."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data["n"])
+
+    await bus.subscribe(
+        "x", "c", h, match={"kind": "even"}, filter_fn=lambda name, data: data["n"] > 2
+    )
+
+    for n in (2, 4):
+        await bus.publish("x", {"kind": "even", "n": n}, delivery="tiered")
+    assert seen == [4]
+
+
+async def test_match_unhashable_payload_value_is_ignored():
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h, match={"component": "a"})
+    await bus.publish("x", {"component": ["a"]})
+    assert seen == []
+
+
+async def test_match_validated():
+    bus = AsyncEventManager()
+
+    async def h(_):
+        pass
+
+    with pytest.raises(ValueError, match="match must name"):
+        await bus.subscribe("x", "c", h, match={})
+    with pytest.raises(ValueError, match="hashable"):
+        await bus.subscribe("x", "c", h, match={"component": ["a"]})
+
+
+class _WeakComponent:
+    def __init__(self) -> None:
+        self.seen = []
+
+    async def on_event(self, data):
+        self.seen.append(data)
+
+    def on_event_sync(self, data):
+        self.seen.append(data)
+
+
+async def test_weak_subscription_delivers_while_owner_alive():
+    bus = AsyncEventManager()
+    comp = _WeakComponent()
+    await bus.subscribe("e", "c", comp.on_event, weak=True)
+    await bus.subscribe("e", "c", comp.on_event_sync, executor="inline", weak=True)
+
+    await bus.publish("e", 1)
+
+    assert comp.seen == [1, 1]
+
+
+async def test_weak_subscription_does_not_keep_owner_alive():
+    import gc
+    import weakref
+
+    bus = AsyncEventManager()
+    comp = _WeakComponent()
+    ref = weakref.ref(comp)
+    await bus.subscribe("e", "c", comp.on_event, weak=True)
+    await bus.publish("e", 1)
+
+    del comp
+    gc.collect()
+
+    assert ref() is None
+    await bus.publish("e", 2)  # skipped, then pruned
+    assert not bus.has_subscribers("e")
+    assert bus._index == {}
+    assert "c" not in bus._by_component
+
+
+async def test_weak_subscriptions_do_not_leak_100k_components():
+    """Registering and dropping 100k components leaves no subscriptions behind."""
+    import gc
+    import weakref
+
+    bus = AsyncEventManager()
+    refs = []
+    for i in range(100_000):
+        comp = _WeakComponent()
+        refs.append(weakref.ref(comp))
+        await bus.subscribe("state.changed", f"comp-{i}", comp.on_event, weak=True)
+    del comp
+    gc.collect()
+
+    assert all(r() is None for r in refs)
+    await bus.publish("state.changed", {"component": 1})
+    assert bus._index == {}
+    assert not bus._by_component
+    assert not bus._events.get("state.changed") or not any(bus._events["state.changed"])
+
+
+async def test_weak_rejects_unreferenceable_handler():
+    bus = AsyncEventManager()
+    with pytest.raises(ValueError, match="weak"):
+        await bus.subscribe("e", "c", operator.itemgetter(0), executor="inline", weak=True)
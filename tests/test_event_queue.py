@@ -0,0 +1,186 @@
+"""Tests for queue-backed publishing (enqueue / publish_nowait)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.event_manager import AsyncEventManager
+
+
+async def test_enqueue_returns_before_handlers_run():
+    """enqueue() hands the event to a dispatcher instead of awaiting handlers."""
+    bus = AsyncEventManager()
+    release = asyncio.Event()
+    seen = []
+
+    async def slow(data):
+        await release.wait()
+        seen.append(data)
+
+    await bus.subscribe("x", "c", slow)
+
+    assert await bus.enqueue("x", 1) is True
+    assert seen == []
+
+    release.set()
+    await bus.join()
+    assert seen == [1]
+    await bus.aclose()
+
+
+async def test_single_worker_preserves_fifo_order():
+    """With one dispatcher, queued events are delivered in enqueue order."""
+    bus = AsyncEventManager()
+    seen = []
+
+    async def h(data):
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h)
+    for i in range(20):
+        bus.publish_nowait("x", i)
+
+    await bus.aclose()
+    assert seen == list(range(20))
+
+
+async def test_reject_policy_refuses_when_full():
+    """'reject' refuses new events once the queue is full and counts them."""
+    bus = AsyncEventManager(queue_maxsize=2, overflow="reject")
+    release = asyncio.Event()
+    seen = []
+
+    async def h(data):
+        await release.wait()
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h)
+
+    assert bus.publish_nowait("x", 0) is True
+    await asyncio.sleep(0)  # worker takes event 0 and blocks in the handler
+    assert bus.publish_nowait("x", 1) is True
+    assert bus.publish_nowait("x", 2) is True
+    assert await bus.enqueue("x", 3) is False
+
+    stats = bus.queue_stats()
+    assert stats["depth"] == 2
+    assert stats["rejected"] == 1
+    assert stats["high_water"] == 2
+
+    release.set()
+    await bus.aclose()
+    assert seen == [0, 1, 2]
+
+
+async def test_drop_oldest_policy_keeps_newest():
+    """'drop_oldest' evicts the oldest queued event to make room."""
+    bus = AsyncEventManager(queue_maxsize=2, overflow="drop_oldest")
+    release = asyncio.Event()
+    seen = []
+
+    async def h(data):
+        await release.wait()
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h)
+
+    bus.publish_nowait("x", 0)
+    await asyncio.sleep(0)
+    for i in (1, 2, 3):
+        assert bus.publish_nowait("x", i) is True
+
+    assert bus.queue_stats()["dropped"] == 1
+
+    release.set()
+    await bus.aclose()
+    assert seen == [0, 2, 3]
+
+
+async def test_block_policy_waits_for_space():
+    """'block' makes enqueue() wait, while publish_nowait() rejects."""
+    bus = AsyncEventManager(queue_maxsize=1, overflow="block")
+    release = asyncio.Event()
+    seen = []
+
+    async def h(data):
+        await release.wait()
+        seen.append(data)
+
+    await bus.subscribe("x", "c", h)
+
+    await bus.enqueue("x", 0)
+    await asyncio.sleep(0)
+    await bus.enqueue("x", 1)
+    assert bus.publish_nowait("x", 99) is False
+
+    waiter = asyncio.create_task(bus.enqueue("x", 2))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    release.set()
+    assert await waiter is True
+    await bus.aclose()
+    assert seen == [0, 1, 2]
+
+
+async def test_worker_pool_runs_events_concurrently():
+    """Several dispatcher workers deliver queued events in parallel."""
+    bus = AsyncEventManager(dispatch_workers=3)
+    running = 0
+    peak = 0
+
+    async def h(_):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await bus.subscribe("x", "c", h)
+    for i in range(6):
+        bus.publish_nowait("x", i)
+
+    await bus.join()
+    assert peak == 3
+    assert bus.queue_stats()["workers"] == 3
+    assert bus.queue_stats()["dispatched"] == 6
+
+    await bus.aclose()
+    assert bus.queue_stats()["workers"] == 0
+
+
+async def test_queued_handler_errors_do_not_kill_worker():
+    """A failing handler is reported via event.handler.failed and the worker keeps going."""
+    bus = AsyncEventManager()
+    failed = []
+    seen = []
+
+    async def h(data):
+        if data == "bad":
+            raise RuntimeError("boom")
+        seen.append(data)
+
+    async def capture(data):
+        failed.append(data)
+
+    await bus.subscribe("x", "c", h)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    bus.publish_nowait("x", "bad")
+    bus.publish_nowait("x", "good")
+    await bus.aclose()
+
+    assert seen == ["good"]
+    assert len(failed) == 1
+
+
+def test_queue_options_validated():
+    """Constructor rejects invalid queue settings."""
+    with pytest.raises(ValueError, match="overflow must be"):
+        AsyncEventManager(overflow="spill")
+    with pytest.raises(ValueError, match="queue_maxsize"):
+        AsyncEventManager(queue_maxsize=0)
+    with pytest.raises(ValueError, match="dispatch_workers"):
+        AsyncEventManager(dispatch_workers=0)
@@ -0,0 +1,148 @@
+"""Tests for per-component mailboxes (FlexiFlowEngine.send)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.component import AsyncComponent
+from flexiflow.engine import FlexiFlowEngine
+from flexiflow.mailbox import Mailbox
+from flexiflow.state_machine import State, StateMachine
+
+
+class Counting(State):
+    """Reads the count, yields to the loop, then writes it back: racy without serialization."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.order = []
+
+    async def handle_message(self, message, component):
+        if message.get("type") == "fail":
+            raise RuntimeError("bad message")
+        count = self.count
+        await asyncio.sleep(0)
+        self.count = count + 1
+        self.order.append(message.get("n"))
+        return False, self
+
+
+def make_component(name: str) -> AsyncComponent:
+    return AsyncComponent(name=name, state_machine=StateMachine(current_state=Counting()))
+
+
+async def test_send_serializes_messages_per_component():
+    engine = FlexiFlowEngine()
+    component = make_component("c")
+    engine.register(component)
+
+    await asyncio.gather(*(engine.send("c", {"n": i}) for i in range(50)))
+
+    assert component.state_machine.current_state.count == 50
+    assert component.state_machine.current_state.order == list(range(50))
+
+
+async def test_components_process_concurrently():
+    engine = FlexiFlowEngine()
+    running = 0
+    peak = 0
+
+    class Slow(State):
+        async def handle_message(self, message, component):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return False, self
+
+    for i in range(20):
+        engine.register(AsyncComponent(name=f"c{i}", state_machine=StateMachine(current_state=Slow())))
+
+    await asyncio.gather(*(engine.send(f"c{i}", {}) for i in range(20)))
+
+    assert peak == 20
+
+
+async def test_idle_workers_exit():
+    engine = FlexiFlowEngine()
+    engine.register(make_component("c"))
+
+    await engine.send("c", {"n": 1})
+
+    stats = engine.mailbox_stats()
+    assert stats["mailboxes"] == 1
+    assert stats["active_workers"] == 0
+    assert stats["processed"] == 1
+
+
+async def test_send_raises_handler_error_and_keeps_going():
+    engine = FlexiFlowEngine()
+    component = make_component("c")
+    engine.register(component)
+
+    with pytest.raises(RuntimeError, match="bad message"):
+        await engine.send("c", {"type": "fail"})
+    await engine.send("c", {"n": 1})
+
+    assert component.state_machine.current_state.count == 1
+    assert engine.mailbox_stats()["failed"] == 1
+
+
+async def test_send_without_wait_and_aclose_drains():
+    engine = FlexiFlowEngine()
+    component = make_component("c")
+    engine.register(component)
+
+    for i in range(10):
+        await engine.send("c", {"n": i}, wait=False)
+    await engine.aclose()
+
+    assert component.state_machine.current_state.order == list(range(10))
+
+
+async def test_send_unknown_component():
+    engine = FlexiFlowEngine()
+    with pytest.raises(KeyError, match="nope"):
+        await engine.send("nope", {})
+
+
+async def test_full_mailbox_applies_backpressure():
+    gate = asyncio.Event()
+
+    async def handler(message):
+        await gate.wait()
+
+    mailbox = Mailbox(handler, maxsize=2)
+    for i in range(3):  # one being handled, two queued
+        await mailbox.put(i, wait=False)
+
+    blocked = asyncio.ensure_future(mailbox.put(3, wait=False))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    gate.set()
+    await blocked
+    await mailbox.join()
+    assert mailbox.processed == 4
+
+
+async def test_send_after_reregistering_reaches_new_component():
+    engine = FlexiFlowEngine()
+    old = make_component("c")
+    engine.register(old)
+    await engine.send("c", {"n": 1})
+
+    new = make_component("c")
+    engine.register(new)
+    await engine.send("c", {"n": 2})
+
+    assert old.state_machine.current_state.order == [1]
+    assert new.state_machine.current_state.order == [2]
+
+
+def test_mailbox_size_validated():
+    with pytest.raises(ValueError, match="mailbox_size"):
+        FlexiFlowEngine(mailbox_size=0)
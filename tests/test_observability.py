@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from flexiflow.component import AsyncComponent
@@ -171,3 +173,148 @@ async def test_handler_failed_concurrent_mode():
     assert all(n == "test.event" for n in event_names)
     assert "comp1" in component_names
     assert "comp2" in component_names
+
+
+async def test_handler_slow_fires_above_threshold():
+    """event.handler.slow reports handlers at or above the bus threshold."""
+    bus = AsyncEventManager(slow_handler_threshold=0.01)
+    slow_events = []
+
+    async def slow_handler(_):
+        await asyncio.sleep(0.02)
+
+    async def fast_handler(_):
+        pass
+
+    async def capture(data):
+        slow_events.append(data)
+
+    await bus.subscribe("test.event", "slow_component", slow_handler)
+    await bus.subscribe("test.event", "fast_component", fast_handler)
+    await bus.subscribe("event.handler.slow", "observer", capture)
+
+    await bus.publish("test.event")
+
+    assert len(slow_events) == 1
+    assert slow_events[0]["event_name"] == "test.event"
+    assert slow_events[0]["component_name"] == "slow_component"
+    assert slow_events[0]["duration"] >= 0.01
+    assert slow_events[0]["threshold"] == 0.01
+
+
+async def test_handler_slow_no_recursion():
+    """Slow handlers of event.handler.slow itself are not reported again."""
+    bus = AsyncEventManager(slow_handler_threshold=0.0)
+    calls = []
+
+    async def slow_observer(data):
+        calls.append(data["event_name"])
+
+    await bus.subscribe("event.handler.slow", "observer", slow_observer)
+    await bus.subscribe("test.event", "c", slow_observer)
+
+    await bus.publish("test.event", {"event_name": "test.event"})
+
+    # One call from the original publish, one for the slow report; no loop
+    assert calls == ["test.event", "test.event"]
+
+
+async def test_no_listeners_skips_publish(monkeypatch):
+    """Without subscribers the component does not publish observability events."""
+    bus = AsyncEventManager()
+    published = []
+
+    async def record(event_name, data=None, **kwargs):
+        published.append(event_name)
+
+    monkeypatch.setattr(bus, "publish", record)
+
+    component = AsyncComponent(
+        name="test_comp",
+        state_machine=StateMachine.from_name("InitialState"),
+        event_bus=bus,
+    )
+
+    await component.handle_message({"type": "start"})
+
+    assert published == []
+    assert component.state_machine.current_state.__class__.__name__ == "AwaitingConfirmation"
+
+
+async def test_handler_failed_skips_formatting_without_listeners():
+    """Exceptions are not formatted when nobody subscribes to event.handler.failed."""
+    bus = AsyncEventManager()
+    formatted = 0
+
+    class Tracked(Exception):
+        def __repr__(self):
+            nonlocal formatted
+            formatted += 1
+            return "Tracked()"
+
+    async def bad(data):
+        raise Tracked()
+
+    await bus.subscribe("test.event", "bad", bad)
+    await bus.publish("test.event", {})
+
+    assert formatted == 0
+
+
+async def test_handler_failed_aggregated_per_interval():
+    """With failure_interval, a failure storm becomes one report per (event, component)."""
+    bus = AsyncEventManager(failure_interval=0.02, failure_exemplars=2)
+    reports = []
+
+    async def bad(data):
+        raise ValueError(data)
+
+    async def capture(data):
+        reports.append(data)
+
+    await bus.subscribe("test.event", "bad", bad)
+    await bus.subscribe("other.event", "bad", bad)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    for i in range(100):
+        await bus.publish("test.event", i)
+    await bus.publish("other.event", "x")
+    assert reports == []
+
+    await asyncio.sleep(0.05)
+
+    by_event = {r["event_name"]: r for r in reports}
+    assert set(by_event) == {"test.event", "other.event"}
+    assert by_event["test.event"]["count"] == 100
+    assert by_event["test.event"]["component_name"] == "bad"
+    assert len(by_event["test.event"]["exemplars"]) == 2
+    assert by_event["test.event"]["exception"].startswith("ValueError(")
+    assert by_event["other.event"]["count"] == 1
+    assert by_event["other.event"]["exemplars"] == ["ValueError('x')"]
+
+
+async def test_aggregated_failures_flushed_on_aclose():
+    """aclose() publishes failures still waiting for their interval."""
+    bus = AsyncEventManager(failure_interval=60)
+    reports = []
+
+    async def bad(data):
+        raise RuntimeError("down")
+
+    async def capture(data):
+        reports.append(data)
+
+    await bus.subscribe("test.event", "bad", bad)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+    await bus.publish("test.event", {}, delivery="concurrent")
+
+    await bus.aclose()
+
+    assert [r["count"] for r in reports] == [1]
+
+
+def test_failure_interval_validated():
+    with pytest.raises(ValueError, match="failure_interval"):
+        AsyncEventManager(failure_interval=0)
+    with pytest.raises(ValueError, match="failure_exemplars"):
+        AsyncEventManager(failure_exemplars=0)
@@ -0,0 +1,250 @@
+import asyncio
+
+import pytest
+
+from flexiflow.event_manager import AsyncEventManager
+
+
+def by_component(data):
+    return data["component"]
+
+
+async def test_partitioned_preserves_per_key_order_across_publishers():
+    bus = AsyncEventManager(partition_key=by_component)
+    seen = {"a": [], "b": []}
+
+    async def handler(data):
+        await asyncio.sleep(0)
+        seen[data["component"]].append(data["n"])
+
+    await bus.subscribe("state.changed", "log", handler)
+
+    await asyncio.gather(
+        *(
+            bus.publish("state.changed", {"component": c, "n": n}, delivery="partitioned")
+            for n in range(20)
+            for c in ("a", "b")
+        )
+    )
+
+    assert seen == {"a": list(range(20)), "b": list(range(20))}
+
+
+async def test_partitioned_runs_different_keys_in_parallel():
+    bus = AsyncEventManager(partition_key=by_component)
+    running = 0
+    peak = 0
+
+    async def handler(data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await bus.subscribe("job", "worker", handler)
+    await asyncio.gather(
+        *(bus.publish("job", {"component": k}, delivery="partitioned") for k in range(4))
+    )
+
+    assert peak == 4
+
+
+async def test_partitioned_same_key_never_overlaps():
+    bus = AsyncEventManager(partition_key=by_component)
+    running = 0
+    peak = 0
+
+    async def handler(data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    await bus.subscribe("job", "worker", handler)
+    await asyncio.gather(
+        *(bus.publish("job", {"component": "x"}, delivery="partitioned") for _ in range(10))
+    )
+
+    assert peak == 1
+
+
+async def test_partition_workers_bounds_parallelism():
+    bus = AsyncEventManager(partition_key=by_component, partition_workers=2)
+    running = 0
+    peak = 0
+
+    async def handler(data):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+
+    await bus.subscribe("job", "worker", handler)
+    await asyncio.gather(
+        *(bus.publish("job", {"component": k}, delivery="partitioned") for k in range(8))
+    )
+
+    assert peak == 2
+    assert bus._active_partition_workers == 0
+    assert not bus._lanes
+
+
+async def test_partitioned_per_call_key_overrides_bus_default():
+    bus = AsyncEventManager()
+    seen = []
+
+    async def handler(data):
+        seen.append(data)
+
+    await bus.subscribe("job", "worker", handler)
+    await bus.publish("job", (1, "x"), delivery="partitioned", partition_key=lambda d: d[0])
+
+    assert seen == [(1, "x")]
+
+
+async def test_partitioned_raise_propagates_to_publisher():
+    bus = AsyncEventManager(partition_key=by_component)
+
+    async def boom(data):
+        raise RuntimeError("boom")
+
+    await bus.subscribe("job", "worker", boom)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.publish("job", {"component": "a"}, delivery="partitioned", on_error="raise")
+
+    # The lane keeps serving later events
+    with pytest.raises(RuntimeError):
+        await bus.publish("job", {"component": "a"}, delivery="partitioned", on_error="raise")
+
+
+async def test_publish_many_partitioned_keeps_order_per_key():
+    bus = AsyncEventManager(partition_key=by_component)
+    seen = []
+
+    async def handler(data):
+        await asyncio.sleep(0)
+        seen.append((data["component"], data["n"]))
+
+    await bus.subscribe("job", "worker", handler)
+    events = [("job", {"component": c, "n": n}) for n in range(5) for c in ("a", "b")]
+    await bus.publish_many(events, delivery="partitioned")
+
+    assert [n for c, n in seen if c == "a"] == list(range(5))
+    assert [n for c, n in seen if c == "b"] == list(range(5))
+
+
+async def test_partitioned_requires_key_function():
+    bus = AsyncEventManager()
+    await bus.subscribe("job", "worker", lambda d: None, executor="inline")
+
+    with pytest.raises(ValueError, match="partition_key"):
+        await bus.publish("job", {}, delivery="partitioned")
+
+
+async def test_queued_partitioned_requires_key_function():
+    bus = AsyncEventManager()
+
+    with pytest.raises(ValueError, match="partition_key"):
+        await bus.enqueue("job", {}, delivery="partitioned")
+    with pytest.raises(ValueError, match="partition_key"):
+        bus.publish_nowait("job", {}, delivery="partitioned")
+    assert bus.queue_stats()["enqueued"] == 0
+
+
+async def test_queued_partitioned_uses_per_call_key():
+    bus = AsyncEventManager()
+    seen = []
+    await bus.subscribe("job", "worker", seen.append, executor="inline")
+
+    assert bus.publish_nowait("job", {"component": "a"}, delivery="partitioned", partition_key=by_component)
+    assert await bus.enqueue("job", {"component": "b"}, delivery="partitioned", partition_key=by_component)
+    await bus.join()
+
+    assert seen == [{"component": "a"}, {"component": "b"}]
+    await bus.aclose()
+
+
+async def test_nested_partitioned_publish_other_key_does_not_deadlock():
+    bus = AsyncEventManager(partition_key=by_component, partition_workers=1)
+    seen = []
+
+    async def handler(data):
+        seen.append(data["component"])
+        if data["component"] == "a":
+            await bus.publish("job", {"component": "b"}, delivery="partitioned")
+
+    await bus.subscribe("job", "worker", handler)
+
+    await asyncio.wait_for(bus.publish("job", {"component": "a"}, delivery="partitioned"), 1)
+    await asyncio.sleep(0.01)  # the nested publish is queued, not awaited
+
+    assert seen == ["a", "b"]
+
+
+async def test_nested_partitioned_publish_across_lanes_does_not_deadlock():
+    bus = AsyncEventManager(partition_key=lambda d: d["k"], partition_workers=1)
+    seen = []
+
+    async def handler(data):
+        seen.append((data["k"], data["hop"]))
+        if data["hop"] < 3:
+            await bus.publish("job", {"k": 1 - data["k"], "hop": data["hop"] + 1}, delivery="partitioned")
+
+    await bus.subscribe("job", "worker", handler)
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            bus.publish("job", {"k": 0, "hop": 0}, delivery="partitioned"),
+            bus.publish("job", {"k": 1, "hop": 0}, delivery="partitioned"),
+        ),
+        5,
+    )
+    await asyncio.sleep(0.01)
+
+    assert len(seen) == 8
+
+
+async def test_nested_partitioned_fan_out_respects_worker_cap():
+    bus = AsyncEventManager(partition_key=lambda d: d["k"], partition_workers=2)
+    peak = 0
+
+    async def handler(data):
+        nonlocal peak
+        peak = max(peak, bus._active_partition_workers)
+        if data["k"] < 100:
+            for k in range(data["k"] * 10 + 1, data["k"] * 10 + 11):
+                await bus.publish("job", {"k": k}, delivery="partitioned")
+        await asyncio.sleep(0)
+
+    await bus.subscribe("job", "worker", handler)
+
+    await bus.publish("job", {"k": 0}, delivery="partitioned")
+    while bus._lanes:
+        await asyncio.sleep(0.001)
+
+    assert peak <= 2
+
+
+async def test_nested_partitioned_publish_same_key_does_not_deadlock():
+    bus = AsyncEventManager(partition_key=by_component, partition_workers=4)
+    seen = []
+
+    async def handler(data):
+        seen.append(data["n"])
+        if data["n"] < 3:
+            await bus.publish("job", {"component": "a", "n": data["n"] + 1}, delivery="partitioned")
+
+    await bus.subscribe("job", "worker", handler)
+
+    await asyncio.wait_for(bus.publish("job", {"component": "a", "n": 0}, delivery="partitioned"), 1)
+
+    assert seen == [0, 1, 2, 3]
+
+
+def test_partition_workers_validated():
+    with pytest.raises(ValueError, match="partition_workers"):
+        AsyncEventManager(partition_workers=0)
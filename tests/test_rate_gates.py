@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from flexiflow.event_manager import AsyncEventManager
+
+
+async def test_throttle_bounds_calls_and_delivers_latest():
+    bus = AsyncEventManager()
+    seen = []
+
+    async def handler(data):
+        seen.append(data)
+
+    await bus.subscribe("state.changed", "dashboard", handler, throttle=0.05)
+
+    for i in range(1000):
+        await bus.publish("state.changed", i)
+    await asyncio.sleep(0.12)
+
+    assert 1 <= len(seen) <= 3
+    assert seen[-1] == 999
+
+
+async def test_throttle_delivers_first_event_promptly():
+    bus = AsyncEventManager()
+    seen = []
+    await bus.subscribe("tick", "ui", seen.append, executor="inline", throttle=10)
+
+    await bus.publish("tick", 1)
+    await asyncio.sleep(0.01)
+
+    assert seen == [1]
+
+
+async def test_debounce_waits_for_quiet_period():
+    bus = AsyncEventManager()
+    seen = []
+    await bus.subscribe("search", "ui", seen.append, executor="inline", debounce=0.03)
+
+    for i in range(5):
+        await bus.publish("search", i)
+        await asyncio.sleep(0.01)
+    assert seen == []
+
+    await asyncio.sleep(0.05)
+    assert seen == [4]
+
+
+async def test_coalesce_key_delivers_latest_per_key():
+    bus = AsyncEventManager()
+    seen = []
+    await bus.subscribe(
+        "state.changed",
+        "dashboard",
+        seen.append,
+        executor="inline",
+        throttle=0.02,
+        coalesce_key=lambda d: d["component"],
+    )
+
+    for n in range(3):
+        for c in ("a", "b"):
+            await bus.publish("state.changed", {"component": c, "n": n})
+    await asyncio.sleep(0.05)
+
+    assert seen == [{"component": "a", "n": 2}, {"component": "b", "n": 2}]
+
+
+async def test_coalesce_key_alone_delivers_next_iteration():
+    bus = AsyncEventManager()
+    seen = []
+
+    async def handler(data):
+        seen.append(data)
+
+    await bus.subscribe("state.changed", "dashboard", handler, coalesce_key=lambda d: d["component"])
+
+    await bus.publish("state.changed", {"component": "a", "n": 1})
+    await bus.publish("state.changed", {"component": "a", "n": 2})
+    assert seen == []
+    await asyncio.sleep(0.01)
+
+    assert seen == [{"component": "a", "n": 2}]
+
+
+async def test_gated_runs_never_overlap():
+    bus = AsyncEventManager()
+    running = 0
+    peak = 0
+    calls = 0
+
+    async def slow(data):
+        nonlocal running, peak, calls
+        running += 1
+        calls += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    await bus.subscribe("tick", "ui", slow, coalesce_key=lambda d: 0)
+    for i in range(50):
+        await bus.publish("tick", i)
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0.1)
+
+    assert peak == 1
+    assert calls < 50
+
+
+async def test_unsubscribe_cancels_pending_delivery():
+    bus = AsyncEventManager()
+    seen = []
+    handle = await bus.subscribe("tick", "ui", seen.append, executor="inline", debounce=0.01)
+
+    await bus.publish("tick", 1)
+    bus.unsubscribe(handle)
+    await asyncio.sleep(0.03)
+
+    assert seen == []
+
+
+async def test_gated_handler_failure_is_reported():
+    bus = AsyncEventManager()
+    failures = []
+
+    async def boom(data):
+        raise RuntimeError("boom")
+
+    async def on_failed(data):
+        failures.append(data)
+
+    await bus.subscribe("tick", "ui", boom, throttle=0.01)
+    await bus.subscribe("event.handler.failed", "monitor", on_failed)
+
+    await bus.publish("tick", 1, on_error="raise")  # deferred: never raises here
+    await asyncio.sleep(0.03)
+
+    assert len(failures) == 1
+    assert failures[0]["component_name"] == "ui"
+
+
+async def test_gate_options_validated():
+    bus = AsyncEventManager()
+
+    async def handler(data):
+        pass
+
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        await bus.subscribe("tick", "ui", handler, debounce=0.1, throttle=0.1)
+    with pytest.raises(ValueError, match="> 0"):
+        await bus.subscribe("tick", "ui", handler, throttle=0)
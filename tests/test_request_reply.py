@@ -0,0 +1,207 @@
+"""Tests for request/reply over the event bus."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.event_manager import AsyncEventManager, current_correlation_id
+
+
+async def test_request_returns_first_result():
+    """The first non-None handler result answers the request."""
+    bus = AsyncEventManager()
+
+    async def quick(data):
+        return data * 2
+
+    async def slow(data):
+        await asyncio.sleep(1)
+        return "too late"
+
+    async def silent(_):
+        return None
+
+    await bus.subscribe("math.double", "silent", silent, priority=1)
+    await bus.subscribe("math.double", "quick", quick)
+    await bus.subscribe("math.double", "slow", slow)
+
+    assert await bus.request("math.double", 21, timeout=0.5) == 42
+
+
+async def test_request_gather_returns_results_in_priority_order():
+    bus = AsyncEventManager()
+
+    async def a(_):
+        await asyncio.sleep(0.01)
+        return "a"
+
+    async def b(_):
+        return "b"
+
+    await bus.subscribe("x", "b", b, priority=4)
+    await bus.subscribe("x", "a", a, priority=1)
+
+    assert await bus.request("x", mode="gather") == ["a", "b"]
+
+
+async def test_request_deferred_reply_via_correlation_id():
+    """A handler can answer later with reply(current_correlation_id(), ...)."""
+    bus = AsyncEventManager()
+
+    async def deferred(data):
+        cid = current_correlation_id()
+        asyncio.get_running_loop().call_later(0.01, bus.reply, cid, f"pong:{data}")
+
+    await bus.subscribe("ping", "server", deferred)
+
+    assert await bus.request("ping", 1, timeout=1) == "pong:1"
+    assert current_correlation_id() is None
+    assert bus._pending == {}
+
+
+async def test_request_timeout_and_late_reply():
+    bus = AsyncEventManager()
+    captured = []
+
+    async def never(_):
+        captured.append(current_correlation_id())
+
+    await bus.subscribe("x", "c", never)
+
+    with pytest.raises(asyncio.TimeoutError, match="no reply"):
+        await bus.request("x", timeout=0.01)
+    assert bus.reply(captured[0], "late") is False
+
+
+async def test_request_without_subscribers_raises():
+    bus = AsyncEventManager()
+    with pytest.raises(LookupError, match="no subscribers"):
+        await bus.request("nobody")
+
+
+async def test_request_all_handlers_fail_raises_first_error():
+    bus = AsyncEventManager()
+    failed = []
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def capture(data):
+        failed.append(data["component_name"])
+
+    await bus.subscribe("x", "bad", bad)
+    await bus.subscribe("event.handler.failed", "observer", capture)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.request("x", timeout=1)
+
+    await asyncio.sleep(0)  # failure report runs in the background
+    assert failed == ["bad"]
+
+
+async def test_request_failure_does_not_hide_other_answer():
+    bus = AsyncEventManager()
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def good(_):
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    await bus.subscribe("x", "bad", bad)
+    await bus.subscribe("x", "good", good)
+
+    assert await bus.request("x", timeout=1) == "ok"
+    assert await bus.request("x", mode="gather") == ["ok"]
+
+    with pytest.raises(RuntimeError):
+        await bus.request("x", timeout=1, on_error="raise")
+
+
+async def test_request_without_timeout_returns_none_when_nobody_answers():
+    bus = AsyncEventManager()
+
+    async def silent(_):
+        return None
+
+    await bus.subscribe("x", "a", silent)
+    await bus.subscribe("x", "b", silent)
+
+    assert await asyncio.wait_for(bus.request("x"), 1) is None
+    assert bus._pending == {}
+
+
+async def test_request_without_timeout_raises_failure_when_nobody_answers():
+    bus = AsyncEventManager()
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def silent(_):
+        await asyncio.sleep(0.01)
+
+    await bus.subscribe("x", "bad", bad)
+    await bus.subscribe("x", "silent", silent)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await asyncio.wait_for(bus.request("x"), 1)
+
+
+async def test_request_timeout_raises_failure_and_cancels_handlers():
+    bus = AsyncEventManager()
+    cancelled = []
+
+    async def bad(_):
+        raise RuntimeError("boom")
+
+    async def slow(_):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    await bus.subscribe("x", "bad", bad)
+    await bus.subscribe("x", "slow", slow)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await bus.request("x", timeout=0.01)
+    await asyncio.sleep(0)
+    assert cancelled == [True]
+
+    # Every handler finished without an answer: the failure beats a bare timeout
+    bus.unsubscribe_all("slow")
+    await bus.subscribe("x", "silent", lambda _: None, executor="inline")
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.request("x", timeout=0.01)
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread"])
+async def test_request_returns_sync_handler_results(executor):
+    bus = AsyncEventManager()
+    await bus.subscribe("x", "a", lambda data: data * 2, executor=executor)
+
+    assert await bus.request("x", 21, timeout=1) == 42
+    assert await bus.request("x", 1, mode="gather") == [2]
+    await bus.aclose()
+
+
+async def test_request_returns_results_with_stats_enabled():
+    bus = AsyncEventManager(collect_stats=True)
+
+    async def answer(data):
+        return "ok"
+
+    await bus.subscribe("x", "a", answer)
+    await bus.subscribe("x", "b", lambda data: "inline", executor="inline", priority=1)
+
+    assert await bus.request("x", mode="gather") == ["inline", "ok"]
+
+
+async def test_request_validates_options():
+    bus = AsyncEventManager()
+    with pytest.raises(ValueError, match="mode must be"):
+        await bus.request("x", mode="all")
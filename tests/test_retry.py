@@ -88,3 +88,12 @@ def test_invalid_config_jitter():
     """jitter outside 0.0-1.0 raises ValueError."""
     with pytest.raises(ValueError, match="jitter"):
         retry_async(RetryConfig(jitter=1.5))
+
+
+def test_retry_delay_backs_off_and_caps():
+    """retry_delay grows by backoff per failed attempt and stops at max_delay."""
+    from flexiflow.extras.retry import retry_delay
+
+    config = RetryConfig(base_delay=0.1, backoff=2.0, max_delay=0.5)
+    assert [retry_delay(config, n) for n in (1, 2, 3, 4, 100)] == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+    assert retry_delay(RetryConfig(base_delay=0), 3) == 0.0
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.component import AsyncComponent
+from flexiflow.sharding import ShardedEngine, shard_for
+from flexiflow.state_machine import StateMachine
+
+
+def _component(name: str) -> AsyncComponent:
+    return AsyncComponent(name=name, rules=[], state_machine=StateMachine.from_name("InitialState"))
+
+
+def test_shard_for_is_stable_and_in_range():
+    names = [f"c{i}" for i in range(200)]
+    assigned = [shard_for(name, 4) for name in names]
+    assert assigned == [shard_for(name, 4) for name in names]
+    assert set(assigned) == {0, 1, 2, 3}
+
+
+def test_validates_arguments():
+    with pytest.raises(ValueError):
+        ShardedEngine(shards=0)
+    with pytest.raises(ValueError):
+        ShardedEngine(batch_size=0)
+
+
+async def test_routes_messages_and_forwards_events():
+    transitions = []
+
+    async with ShardedEngine(shards=2) as engine:
+        await engine.event_bus.subscribe("state.changed", "test", transitions.append, executor="inline")
+        names = [f"c{i}" for i in range(20)]
+        assert {engine.shard_for(name) for name in names} == {0, 1}
+        for name in names:
+            await engine.register_async(_component(name))
+
+        await asyncio.gather(*(engine.handle_message(name, "start") for name in names))
+        await asyncio.gather(
+            *(engine.handle_message(name, "confirm", content="confirmed") for name in names)
+        )
+
+    assert len(transitions) == 40
+    per_component = {}
+    for t in transitions:
+        per_component.setdefault(t["component"], []).append(t["to_state"])
+    assert per_component == {name: ["AwaitingConfirmation", "ProcessingRequest"] for name in names}
+
+
+async def test_forwards_only_events_the_parent_subscribes_to():
+    transitions = []
+
+    async with ShardedEngine(shards=2) as engine:
+        await engine.register_async(_component("a"))
+        await engine.handle_message("a", "start")
+        assert engine._forwarding == ()
+
+        handle = await engine.event_bus.subscribe(
+            "state.changed", "test", transitions.append, executor="inline"
+        )
+        await engine.handle_message("a", "confirm", content="confirmed")
+        assert engine._forwarding == ("state.changed",)
+
+        engine.event_bus.unsubscribe(handle)
+        await engine.handle_message("a", "complete")
+        assert engine._forwarding == ()
+
+    assert [t["to_state"] for t in transitions] == ["ProcessingRequest"]
+
+
+async def test_register_without_waiting_precedes_later_messages():
+    registered = []
+
+    async with ShardedEngine(shards=2) as engine:
+        await engine.event_bus.subscribe(
+            "engine.component.registered", "test", registered.append, executor="inline"
+        )
+        engine.register(_component("a"))
+        await engine.handle_message("a", "start")
+
+    assert registered == [{"component": "a"}]
+
+
+async def test_shard_errors_are_reraised():
+    async with ShardedEngine(shards=2) as engine:
+        with pytest.raises(KeyError):
+            await engine.handle_message("missing", "start")
+
+
+async def test_closed_engine_rejects_messages():
+    engine = ShardedEngine(shards=1)
+    await engine.start()
+    await engine.aclose()
+    with pytest.raises(RuntimeError):
+        await engine.handle_message("a", "start")
+
+
+async def test_register_many_spreads_over_shards():
+    batches = []
+
+    async with ShardedEngine(shards=2) as engine:
+        await engine.event_bus.subscribe(
+            "engine.components.registered", "test", batches.append, executor="inline"
+        )
+        names = [f"c{i}" for i in range(10)]
+        assert await engine.register_many_async([_component(name) for name in names], chunk_size=100) == 10
+        await asyncio.gather(*(engine.handle_message(name, "start") for name in names))
+
+    assert len(batches) == 2
+    assert sorted(name for b in batches for name in b["components"]) == sorted(names)
+
+
+async def test_register_many_without_waiting_precedes_later_messages():
+    batches = []
+
+    async with ShardedEngine(shards=2) as engine:
+        await engine.event_bus.subscribe(
+            "engine.components.registered", "test", batches.append, executor="inline"
+        )
+        names = [f"c{i}" for i in range(10)]
+        assert engine.register_many([_component(name) for name in names], chunk_size=2) == 10
+        await asyncio.gather(*(engine.handle_message(name, "start") for name in names))
+
+        with pytest.raises(ValueError):
+            engine.register_many([], chunk_size=0)
+
+    assert all(b["count"] <= 2 for b in batches)
+    assert sorted(name for b in batches for name in b["components"]) == sorted(names)
+
+
+async def test_unpicklable_message_fails_alone():
+    async with ShardedEngine(shards=1) as engine:
+        await engine.register_async(_component("a"))
+        await engine.register_async(_component("b"))
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                engine.handle_message("a", "start"),
+                engine.handle_message("b", {"type": "start", "callback": lambda: None}),
+                return_exceptions=True,
+            ),
+            3,
+        )
+
+    assert results[0] is None
+    assert isinstance(results[1], Exception)
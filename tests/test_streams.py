@@ -0,0 +1,106 @@
+"""Tests for async-iterator event streams."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from flexiflow.event_manager import AsyncEventManager
+from flexiflow.streams import EventStream
+
+
+async def test_stream_yields_published_payloads_in_order():
+    bus = AsyncEventManager()
+
+    async with bus.stream("x") as events:
+        for i in range(3):
+            await bus.publish("x", i)
+
+        received = [await events.__anext__() for _ in range(3)]
+
+    assert received == [0, 1, 2]
+
+
+async def test_stream_unsubscribes_on_exit():
+    """Leaving the context manager removes the subscription and ends iteration."""
+    bus = AsyncEventManager()
+
+    async with bus.stream("x", component_name="consumer") as events:
+        assert bus.has_subscribers("x")
+
+    assert not bus.has_subscribers("x")
+    assert events.closed
+    assert [e async for e in events] == []
+
+
+async def test_stream_drains_buffer_after_close():
+    bus = AsyncEventManager()
+    events = bus.stream("x")
+
+    await bus.publish("x", "a")
+    await bus.publish("x", "b")
+    events.close()
+    await bus.publish("x", "ignored")
+
+    assert [e async for e in events] == ["a", "b"]
+
+
+async def test_stream_consumer_waits_for_events():
+    """An idle consumer wakes up when a payload arrives."""
+    bus = AsyncEventManager()
+    stream = bus.stream("x")
+
+    async def consume():
+        async for data in stream:
+            return data
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    assert not consumer.done()
+
+    await bus.publish("x", 42)
+    assert await consumer == 42
+    stream.close()
+
+
+async def test_slow_consumer_does_not_stall_publish():
+    """A full buffer drops according to policy instead of blocking publish."""
+    bus = AsyncEventManager()
+    oldest = bus.stream("x", maxsize=2, overflow="drop_oldest")
+    newest = bus.stream("x", maxsize=2, overflow="drop_newest")
+
+    for i in range(5):
+        await asyncio.wait_for(bus.publish("x", i), timeout=1)
+
+    oldest.close()
+    newest.close()
+    assert [e async for e in oldest] == [3, 4]
+    assert [e async for e in newest] == [0, 1]
+    assert oldest.dropped == 3
+    assert newest.dropped == 3
+
+
+async def test_coalesce_keeps_latest_per_key():
+    bus = AsyncEventManager()
+    stream = bus.stream("state.*", overflow="coalesce", key=lambda d: d["component"])
+
+    await bus.publish("state.changed", {"component": "a", "to_state": "S1"})
+    await bus.publish("state.changed", {"component": "b", "to_state": "S1"})
+    await bus.publish("state.changed", {"component": "a", "to_state": "S2"})
+
+    stream.close()
+    assert [e async for e in stream] == [
+        {"component": "a", "to_state": "S2"},
+        {"component": "b", "to_state": "S1"},
+    ]
+    assert stream.coalesced == 1
+
+
+def test_stream_options_validated():
+    with pytest.raises(ValueError, match="maxsize"):
+        EventStream(maxsize=0)
+    with pytest.raises(ValueError, match="overflow must be"):
+        EventStream(overflow="block")
+    with pytest.raises(ValueError, match="requires a key"):
+        EventStream(overflow="coalesce")
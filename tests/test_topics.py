@@ -0,0 +1,68 @@
+"""Tests for hierarchical topic pattern matching."""
+
+from __future__ import annotations
+
+import pytest
+
+from flexiflow.topics import TopicTrie, is_pattern
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("state.changed", False),
+        ("state.*", True),
+        ("component.#", True),
+        ("#", True),
+        ("state*", False),
+        ("a.b#.c", False),
+    ],
+)
+def test_is_pattern(name, expected):
+    assert is_pattern(name) is expected
+
+
+@pytest.mark.parametrize(
+    "pattern, name, matches",
+    [
+        ("state.*", "state.changed", True),
+        ("state.*", "state", False),
+        ("state.*", "state.changed.extra", False),
+        ("component.#", "component", True),
+        ("component.#", "component.message.received", True),
+        ("component.#", "engine.component.registered", False),
+        ("*.component.*", "engine.component.registered", True),
+        ("#.registered", "engine.component.registered", True),
+        ("#", "anything.at.all", True),
+        ("a.#.z", "a.z", True),
+        ("a.#.z", "a.b.c.z", True),
+        ("a.#.z", "a.b.c", False),
+    ],
+)
+def test_trie_match(pattern, name, matches):
+    trie = TopicTrie()
+    trie.add(pattern)
+    assert (trie.match(name) == [pattern]) is matches
+
+
+def test_trie_returns_each_pattern_once():
+    trie = TopicTrie()
+    for p in ("state.*", "state.#", "#", "#.#"):
+        trie.add(p)
+
+    assert sorted(trie.match("state.changed")) == ["#", "#.#", "state.#", "state.*"]
+
+
+def test_trie_remove_prunes_and_is_idempotent():
+    trie = TopicTrie()
+    trie.add("a.*.c")
+    trie.add("a.#")
+    assert len(trie) == 2
+
+    assert trie.remove("a.*.c") is True
+    assert trie.remove("a.*.c") is False
+    assert trie.match("a.b.c") == ["a.#"]
+
+    assert trie.remove("a.#") is True
+    assert len(trie) == 0
+    assert trie._root.children == {}